@@ -0,0 +1,215 @@
+import argparse
+import queue
+import sys
+import threading
+import time
+from config_manager import get_shared_config
+from backends import DRIVER_BACKENDS, load_backend
+from events import EventBus, ConsolePrinter, ERROR, STEP_FINISHED, RESOURCES
+from engine import AttendanceAutomation
+from cli import find_user
+from metrics import start_from_settings
+from resource_monitor import ResourceMonitor, DEFAULT_MEMORY_CAP_MB
+
+# Marks attendance for every saved user (or the --user ones) with headless browsers.
+#   python attendance_batch.py [--user NAME ...] [--workers N] [--backend playwright|selenium] [--visible] [--verbose]
+
+DEFAULT_WORKERS = 3
+
+
+class AttendanceBatch:
+    """Runs AttendanceAutomation for many accounts on a pool of worker threads.
+
+    Each worker launches one browser and reuses it for all of its accounts, giving
+    every account a fresh context (Playwright) or a cleared session (Selenium).
+    Playwright objects are thread-bound, so browsers are never shared between workers.
+    A browser that grows past the 'browser_memory_cap_mb' setting is relaunched
+    between accounts (needs psutil).
+    """
+
+    def __init__(self, users, events, config, backend=None, workers=DEFAULT_WORKERS, headless=True):
+        self.users = users
+        self.events = events
+        self.config = config
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.results = []
+        self.active = set()
+        self.failed_steps = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.elapsed = 0.0
+        events.subscribe(self.on_step_finished, types=(STEP_FINISHED,))
+
+    def on_step_finished(self, event):
+        # Judged per step rather than per ERROR event, so a login that succeeded on retry counts as ok
+        if not event.payload.get('ok'):
+            with self.lock:
+                self.failed_steps[event.run_id] = self.failed_steps.get(event.run_id, 0) + 1
+
+    def run(self):
+        """Process every account; returns one result dict per account"""
+        pending = queue.Queue()
+        for user in self.users:
+            pending.put(user)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=self.worker, args=(pending,), daemon=True)
+                   for _ in range(min(self.workers, len(self.users)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.elapsed = time.perf_counter() - started
+        return self.results
+
+    def stop(self):
+        """Stop every running account and skip the ones not started yet"""
+        self.stopped.set()
+        with self.lock:
+            active = list(self.active)
+        for automation in active:
+            automation.stop()
+
+    def worker(self, pending):
+        browsers = {}
+        monitors = {}
+        try:
+            while not self.stopped.is_set():
+                try:
+                    user = pending.get_nowait()
+                except queue.Empty:
+                    return
+                backend = self.run_account(user, browsers, monitors)
+                if backend in monitors and monitors[backend].over_cap(self.memory_cap_mb):
+                    print(f"🧹 {backend} browser passed {self.memory_cap_mb} MB - relaunching it", flush=True)
+                    self.close_browser(backend, browsers, monitors)
+        finally:
+            for backend in list(browsers):
+                self.close_browser(backend, browsers, monitors)
+
+    @property
+    def memory_cap_mb(self):
+        return self.config.get_setting('browser_memory_cap_mb', DEFAULT_MEMORY_CAP_MB)
+
+    def launch_browser(self, backend, browsers, monitors):
+        monitor = ResourceMonitor.create()
+        launch = load_backend(f'driver:{backend}').launch_shared
+        if monitor:
+            with monitor.watch_start():
+                browsers[backend] = launch(self.headless)
+            monitors[backend] = monitor
+        else:
+            browsers[backend] = launch(self.headless)
+
+    def close_browser(self, backend, browsers, monitors):
+        browsers.pop(backend).close()
+        monitor = monitors.pop(backend, None)
+        if monitor:
+            self.events.emit(RESOURCES, f'{threading.current_thread().name}:{backend}', **monitor.stop())
+
+    def run_account(self, user, browsers, monitors):
+        """Run one account on this worker's browsers; returns the backend it used"""
+        run_id = user.get('username') or user['id']
+        result = {'user': run_id, 'submitted': 0, 'already_marked': 0, 'failed': 0,
+                  'outcome': 'failed', 'seconds': 0.0}
+        started = time.perf_counter()
+        automation = None
+        backend = self.backend or user.get('backend') or AttendanceAutomation.default_backend
+        try:
+            if backend not in browsers:
+                self.launch_browser(backend, browsers, monitors)
+            automation = AttendanceAutomation(
+                user, self.events, config=self.config, run_id=run_id, backend=backend,
+                headless=True, shared_browser=browsers[backend]
+            )
+            with self.lock:
+                self.active.add(automation)
+            if not self.stopped.is_set():
+                automation.run()
+        except Exception as e:
+            self.events.emit(ERROR, run_id, step='batch', message=str(e))
+        finally:
+            if automation:
+                with self.lock:
+                    self.active.discard(automation)
+                result.update(automation.attendance_counts)
+                result['outcome'] = automation.outcome or 'cancelled'
+
+        with self.lock:
+            # A run can complete while a step inside it failed (e.g. panel not found)
+            if result['outcome'] == 'completed' and self.failed_steps.get(run_id):
+                result['outcome'] = 'failed'
+            result['seconds'] = time.perf_counter() - started
+            self.results.append(result)
+            done = len(self.results)
+        icon = '✅' if result['outcome'] == 'completed' else '❌'
+        print(f"{icon} [{done}/{len(self.users)}] {run_id}: {result['submitted']} submitted, "
+              f"{result['already_marked']} already marked, {result['failed']} failed "
+              f"({result['outcome']}, {result['seconds']:.1f}s)", flush=True)
+        return backend
+
+
+def print_summary(batch):
+    results = sorted(batch.results, key=lambda result: result['user'].lower())
+    width = max([len('Account')] + [len(result['user']) for result in results])
+    print(f"\n{'Account':<{width}}  Submitted  Already  Failed  Result     Time", flush=True)
+    for result in results:
+        print(f"{result['user']:<{width}}  {result['submitted']:>9}  {result['already_marked']:>7}  "
+              f"{result['failed']:>6}  {result['outcome']:<9}  {result['seconds']:>5.1f}s")
+
+    totals = {key: sum(result[key] for result in results) for key in ('submitted', 'already_marked', 'failed')}
+    per_minute = len(results) / batch.elapsed * 60 if batch.elapsed else 0.0
+    print(f"\n📊 {len(results)} account(s) in {batch.elapsed:.1f}s - {per_minute:.1f} accounts/min "
+          f"({totals['submitted']} submitted, {totals['already_marked']} already marked, "
+          f"{totals['failed']} failed)", flush=True)
+
+
+def main():
+    config = get_shared_config()
+    parser = argparse.ArgumentParser(description="Mark attendance for every saved user")
+    parser.add_argument('--user', action='append', help="only this saved user (repeatable)")
+    parser.add_argument('--workers', type=int,
+                        default=int(config.get_setting('attendance_batch_workers', DEFAULT_WORKERS)),
+                        help="accounts processed in parallel, one browser each")
+    parser.add_argument('--backend', choices=DRIVER_BACKENDS,
+                        help="browser backend (default: each user's, else playwright)")
+    parser.add_argument('--visible', action='store_true', help="show the browsers")
+    parser.add_argument('--verbose', action='store_true', help="print every account's log lines")
+    args = parser.parse_args()
+
+    users = [find_user(config, query) for query in args.user] if args.user else config.get_all_users()
+    if not users:
+        raise SystemExit("❌ No saved users in credentials.json - add one in the GUI first")
+
+    events = EventBus()
+    if args.verbose:
+        events.subscribe(ConsolePrinter(prefix_run_id=True))
+    batch = AttendanceBatch(users, events, config, backend=args.backend,
+                            workers=args.workers, headless=not args.visible)
+    try:
+        server = start_from_settings(config, events)
+        if server:
+            print(f"📈 Metrics on http://127.0.0.1:{server.server_port}/metrics", flush=True)
+    except OSError as e:
+        print(f"⚠️ Metrics endpoint not started: {e}", flush=True)
+
+    print(f"ℹ️ Marking attendance for {len(users)} account(s) with {min(batch.workers, len(users))} "
+          f"worker(s) - press Ctrl+C to stop", flush=True)
+    thread = threading.Thread(target=batch.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.5)
+    except KeyboardInterrupt:
+        batch.stop()
+        thread.join()
+
+    print_summary(batch)
+    ok = len(batch.results) == len(users) and all(result['outcome'] == 'completed' for result in batch.results)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
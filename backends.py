@@ -0,0 +1,26 @@
+import importlib
+import threading
+
+# Browser drivers the automation engine can run on (registered as 'driver:<name>')
+DRIVER_BACKENDS = ('playwright', 'selenium')
+
+# kind -> (module, class); modules are only imported when a run of that kind starts
+BACKENDS = {}
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+def register_backend(kind, module_name, class_name):
+    """Register the automation (or driver) class for a kind without importing it"""
+    BACKENDS[kind] = (module_name, class_name)
+
+
+def load_backend(kind):
+    """Import (once) and return the class registered for kind"""
+    with _load_lock:
+        if kind not in _loaded:
+            if kind not in BACKENDS:
+                raise KeyError(f"No automation backend registered for '{kind}'")
+            module_name, class_name = BACKENDS[kind]
+            _loaded[kind] = getattr(importlib.import_module(module_name), class_name)
+        return _loaded[kind]
@@ -0,0 +1,122 @@
+"""Check class_parser against the dashboard corpus, then time it on a large synthetic dashboard.
+
+Compares the old in-browser approach (regex search + two strptime calls per card)
+with class_parser's precompiled patterns and memoized time parser:
+
+    python benchmarks/bench_class_parser.py --cards 12000
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import class_parser
+
+CORPUS = os.path.join(ROOT, 'benchmarks', 'corpus')
+
+
+def check_corpus():
+    with open(os.path.join(CORPUS, 'expected.json'), 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    for name, cards in expected.items():
+        with open(os.path.join(CORPUS, name), 'r', encoding='utf-8') as f:
+            parsed = class_parser.parse_dashboard(f.read())
+        got = [[card.title, card.date.isoformat(), card.start.strftime('%H:%M'), card.end.strftime('%H:%M')]
+               if card else None for card in parsed]
+        if got != cards:
+            raise SystemExit(f"❌ {name}: expected {cards}, got {got}")
+        print(f"✅ {name}: {len(cards)} card(s) parsed as expected")
+
+
+def clock(moment):
+    return f"{moment.hour % 12 or 12}:{moment.minute:02d} {'AM' if moment.hour < 12 else 'PM'}"
+
+
+def synthetic_texts(count, seed=7):
+    """Card texts shaped like the portal's, over a few weeks of 30-minute slots"""
+    rng = random.Random(seed)
+    titles = ['Software Engineering - Batch 42', 'Database Systems', 'Java Programming Fundamentals',
+              'Web Application Development', 'Mobile Application Development']
+    first_day = date(2025, 3, 1)
+    texts = []
+    for _ in range(count):
+        start = datetime.combine(first_day + timedelta(days=rng.randrange(28)), datetime.min.time()) \
+            + timedelta(minutes=30 * rng.randrange(16, 44))
+        end = start + timedelta(hours=rng.choice((2, 3)))
+        texts.append(f"{rng.choice(titles)}\n{start:%Y-%m-%d}\n{clock(start)} to {clock(end)}\nView class")
+    return texts
+
+
+def synthetic_html(texts):
+    cards = ''.join(
+        '<div class="col-md-4"><div class="mt-element-ribbon tt-height bg-grey-steel">'
+        '<div class="ribbon" style="background-color: #26C281;"></div><div class="ribbon-content">'
+        + '<br>'.join(text.split('\n')) + '</div></div></div>'
+        for text in texts
+    )
+    return f"<html><body><div class=\"row\">{cards}</div></body></html>"
+
+
+def parse_with_strptime(text):
+    """The engine's previous per-card parsing, kept as the baseline"""
+    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", text)
+    time_match = re.search(r"(\d{1,2}:\d{2} [AP]M) to (\d{1,2}:\d{2} [AP]M)", text)
+    if not date_match or not time_match:
+        return None
+    start = datetime.strptime(date_match.group(1) + " " + time_match.group(1), "%Y-%m-%d %I:%M %p")
+    end = datetime.strptime(date_match.group(1) + " " + time_match.group(2), "%Y-%m-%d %I:%M %p")
+    return start, end
+
+
+def timed(label, func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<34} {best * 1000:>9.1f} ms")
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=12000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    check_corpus()
+    texts = synthetic_texts(args.cards)
+    html = synthetic_html(texts)
+    print(f"\n{args.cards} synthetic cards, best of {args.repeat}:")
+
+    baseline, baseline_time = timed("regex + strptime (old)", lambda: [parse_with_strptime(t) for t in texts],
+                                    args.repeat)
+
+    def cold():
+        class_parser.parse_clock.cache_clear()
+        class_parser.parse_date.cache_clear()
+        return [class_parser.parse_card_text(t) for t in texts]
+
+    timed("class_parser, cold caches", cold, args.repeat)
+    cards, parser_time = timed("class_parser, warm caches",
+                               lambda: [class_parser.parse_card_text(t) for t in texts], args.repeat)
+    from_html, _ = timed("class_parser from HTML snapshot", lambda: class_parser.parse_dashboard(html), args.repeat)
+
+    # strptime put a class that runs past midnight on the wrong day; class_parser ends it the next day
+    expected = [(start, end + timedelta(days=1) if end < start else end) for start, end in baseline]
+    got = [(card.starts_at(), card.ends_at()) if card else None for card in cards]
+    if got != expected or [c.starts_at() for c in from_html] != [c.starts_at() for c in cards]:
+        raise SystemExit("❌ class_parser disagrees with the strptime baseline")
+    print(f"\n✅ Results match the baseline - {baseline_time / parser_time:.1f}x faster on warm caches")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Compare a full start-screen rebuild with the in-place theme switch.
+
+Needs a display (Tk). Runs against a throwaway credentials.json in a temp
+directory so real user data is never touched:
+
+    python benchmarks/bench_theme_switch.py --users 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config_manager import get_shared_config
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def seed_users(config, count):
+    def apply(data):
+        for i in range(count):
+            data['users'].append({
+                'id': f'bench-{i}',
+                'site_url': 'https://example.invalid/portal',
+                'username': f'student{i}',
+                'password': config.encrypt_password('x'),
+                'first_name': f'First{i}',
+                'last_name': f'Last{i}',
+                'email': f'student{i}@example.invalid',
+                'nic_number': '000000000V',
+                'contact_number': '+940000000000'
+            })
+    config.update_data(apply)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix='theme-bench-'))
+    seed_users(get_shared_config(), args.users)
+
+    from main import ZoomAutoJoinGUI
+
+    root = tk.Tk()
+    app = ZoomAutoJoinGUI(root)
+    root.update()
+
+    rebuild_times = []
+    rebuild_widgets = 0
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        created_before = app.styles.created
+        app.is_dark_mode = not app.is_dark_mode
+        app.apply_theme()
+        app.clear_window()
+        app.show_start_screen()
+        root.update()
+        rebuild_times.append(time.perf_counter() - started)
+        rebuild_widgets = app.styles.created - created_before
+
+    switch_times = []
+    switch_widgets = 0
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        app.toggle_theme()
+        root.update()
+        switch_times.append(time.perf_counter() - started)
+        switch_widgets = app.last_theme_switch['widgets_created']
+
+    print(f"users: {args.users}, widgets on screen: {count_widgets(root)}")
+    print(f"rebuild   : {min(rebuild_times) * 1000:8.1f} ms, {rebuild_widgets} widgets created")
+    print(f"in place  : {min(switch_times) * 1000:8.1f} ms, {switch_widgets} widgets created")
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
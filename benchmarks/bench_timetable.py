@@ -0,0 +1,114 @@
+"""Check and time timetable's time handling on a large synthetic timetable.
+
+Every slot is checked against a slow reference (strptime, explicit next-day
+roll-over, zoneinfo), including classes that run past midnight and a clock
+sampled in another timezone, then the old strptime path and timetable are timed:
+
+    python benchmarks/bench_timetable.py --classes 50000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import timetable
+
+PORTAL_TZ = timetable.get_timezone(timetable.DEFAULT_PORTAL_TIMEZONE)
+
+
+def clock(moment):
+    return f"{moment.hour % 12 or 12}:{moment.minute:02d} {'AM' if moment.hour < 12 else 'PM'}"
+
+
+def synthetic_timetable(count, seed=11):
+    """(date, 'h:mm AM - h:mm PM') slots over a year, about a tenth running past midnight"""
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 1)
+    slots = []
+    for _ in range(count):
+        day = first_day + timedelta(days=rng.randrange(365))
+        start = datetime.combine(day, datetime.min.time()) + timedelta(minutes=15 * rng.randrange(96))
+        end = start + timedelta(minutes=30 * rng.randrange(1, 9))
+        slots.append((day.isoformat(), f"{clock(start)} - {clock(end)}"))
+    return slots
+
+
+def reference_window(day, class_time):
+    start_text, end_text = class_time.split(' - ')
+    start = datetime.strptime(f"{day} {start_text}", "%Y-%m-%d %I:%M %p")
+    end = datetime.strptime(f"{day} {end_text}", "%Y-%m-%d %I:%M %p")
+    if end < start:
+        end += timedelta(days=1)
+    return start.replace(tzinfo=PORTAL_TZ), end.replace(tzinfo=PORTAL_TZ)
+
+
+def old_window(day, class_time):
+    """What config_manager and select_class used to do: naive, same-day end"""
+    start_text, end_text = class_time.split(' - ')
+    return (datetime.strptime(f"{day} {start_text}", "%Y-%m-%d %I:%M %p"),
+            datetime.strptime(f"{day} {end_text}", "%Y-%m-%d %I:%M %p"))
+
+
+def new_window(day, class_time):
+    return timetable.class_window(timetable.parse_date(day), *timetable.parse_time_range(class_time), PORTAL_TZ)
+
+
+def check(slots, rng):
+    wrong_before = 0
+    for day, class_time in slots:
+        expected = reference_window(day, class_time)
+        if new_window(day, class_time) != expected:
+            raise SystemExit(f"❌ {day} {class_time}: expected {expected}, got {new_window(day, class_time)}")
+
+        # A clock sampled in UTC (a machine set to the wrong zone) must still land inside the slot
+        inside = (expected[0] + (expected[1] - expected[0]) * rng.random()).astimezone(timezone.utc)
+        start, end = new_window(day, class_time)
+        if not start <= inside <= end:
+            raise SystemExit(f"❌ {day} {class_time}: {inside} not inside {start} - {end}")
+
+        naive_start, naive_end = old_window(day, class_time)
+        naive_now = inside.replace(tzinfo=None)
+        wrong_before += not naive_start <= naive_now <= naive_end
+    return wrong_before
+
+
+def timed(label, func, slots, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for day, class_time in slots:
+            func(day, class_time)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<30} {best * 1000:>9.1f} ms")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--classes', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    slots = synthetic_timetable(args.classes)
+    wrong_before = check(slots, random.Random(3))
+    overnight = sum(1 for day, class_time in slots if new_window(day, class_time)[1].date().isoformat() != day)
+    print(f"✅ {len(slots)} slots match the reference ({overnight} run past midnight); "
+          f"the old naive parsing misjudged {wrong_before} clock samples taken in UTC")
+
+    print(f"\n{args.classes} slots, best of {args.repeat}:")
+    old = timed("strptime, naive (old)", old_window, slots, args.repeat)
+    timetable.parse_clock.cache_clear()
+    timetable.parse_date.cache_clear()
+    timetable.parse_time_range.cache_clear()
+    new = timed("timetable, aware", new_window, slots, args.repeat)
+    print(f"\n⚡ {old / new:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Measure GUI module import cost with `python -X importtime`.
+
+Imports main.py (the launcher) in a fresh interpreter, totals the import
+time and lists the slowest modules. Fails if a browser stack (playwright,
+selenium, webdriver_manager) gets imported at startup.
+
+    python benchmarks/startup_importtime.py
+    python benchmarks/startup_importtime.py --stack selenium_stack --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_PACKAGES = ('playwright', 'selenium', 'webdriver_manager')
+
+
+def measure(stack_dir, runs):
+    """Return ({module: cumulative_us}, best total_us) over several fresh interpreters"""
+    best_total = None
+    best_modules = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import main'],
+            cwd=stack_dir, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise SystemExit(f"import main failed:\n{result.stderr[-2000:]}")
+
+        modules = {}
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            # "import time:  self_us | cumulative_us | <indent>module"
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(cumulative_us)
+            total += int(self_us)
+
+        if best_total is None or total < best_total:
+            best_total, best_modules = total, modules
+    return best_modules, best_total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup import-time benchmark")
+    parser.add_argument('--stack', default='.', help="directory holding main.py (default: repo root)")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    stack_dir = os.path.join(ROOT, args.stack)
+    modules, total = measure(stack_dir, args.runs)
+
+    print(f"import main: {total / 1000:.1f} ms total (best of {args.runs})")
+    print(f"{'cumulative ms':>14}  module")
+    for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{cumulative / 1000:14.1f}  {name}")
+
+    heavy = sorted(name for name in modules if name.split('.')[0] in HEAVY_PACKAGES)
+    if heavy:
+        print(f"\n❌ Browser stack imported at startup: {', '.join(heavy[:5])}")
+        sys.exit(1)
+    print("\n✅ No browser stack imported at startup")
+
+
+if __name__ == '__main__':
+    main()
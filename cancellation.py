@@ -0,0 +1,43 @@
+import threading
+import time
+
+
+class RunCancelled(BaseException):
+    """Raised inside a run once it has been stopped.
+
+    Derives from BaseException so the step methods' broad `except Exception`
+    handlers do not swallow it and carry on with the next step.
+    """
+
+
+class CancelToken:
+    """Cancellation flag shared between a run and whoever may stop it"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.cancelled_at = None
+
+    def cancel(self):
+        """Request cancellation (safe from any thread)"""
+        if not self.event.is_set():
+            self.cancelled_at = time.perf_counter()
+            self.event.set()
+
+    @property
+    def is_cancelled(self):
+        return self.event.is_set()
+
+    def check(self):
+        """Raise RunCancelled if cancellation was requested"""
+        if self.event.is_set():
+            raise RunCancelled()
+
+    def wait(self, seconds=None):
+        """Sleep up to seconds; returns True early if cancelled"""
+        return self.event.wait(seconds)
+
+    def seconds_since_cancel(self):
+        """Seconds elapsed since cancel() was called, or None"""
+        if self.cancelled_at is None:
+            return None
+        return time.perf_counter() - self.cancelled_at
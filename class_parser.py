@@ -0,0 +1,129 @@
+import re
+from html.parser import HTMLParser
+from timetable import parse_clock, parse_date, class_window
+
+# Card text as rendered by the portal: a title line, the class date and "h:mm AM to h:mm PM"
+CARD_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+CARD_TIME_RE = re.compile(r"(\d{1,2}:\d{2} [AP]M) to (\d{1,2}:\d{2} [AP]M)")
+
+# Markers of a class card (engine.CLASS_CARDS in HTML terms): the ribbon div holding
+# an element with an inline background colour
+CARD_CLASSES = {'mt-element-ribbon', 'tt-height'}
+# Tags that start a new line in innerText
+BLOCK_TAGS = {'br', 'div', 'p', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+VOID_TAGS = {'br', 'img', 'input', 'hr', 'meta', 'link', 'wbr'}
+
+
+class ClassCard:
+    """One class card: title, date and start/end clock times"""
+
+    __slots__ = ('title', 'date', 'start', 'end', 'start_text', 'end_text', 'index')
+
+    def __init__(self, title, date, start, end, start_text, end_text, index=None):
+        self.title = title
+        self.date = date
+        self.start = start
+        self.end = end
+        self.start_text = start_text
+        self.end_text = end_text
+        # Position among the page's cards, so the engine can click the matching element
+        self.index = index
+
+    @property
+    def time_range(self):
+        return f"{self.start_text} - {self.end_text}"
+
+    def window(self, tz=None):
+        """(start, end) datetimes in tz; classes ending before they start run past midnight"""
+        return class_window(self.date, self.start, self.end, tz)
+
+    def starts_at(self, tz=None):
+        return self.window(tz)[0]
+
+    def ends_at(self, tz=None):
+        return self.window(tz)[1]
+
+
+def parse_card_text(text, index=None):
+    """ClassCard from a card's visible text, or None if it has no date and time range"""
+    date_match = CARD_DATE_RE.search(text)
+    time_match = CARD_TIME_RE.search(text)
+    if not date_match or not time_match:
+        return None
+    try:
+        class_date = parse_date(date_match.group(1))
+        start = parse_clock(time_match.group(1))
+        end = parse_clock(time_match.group(2))
+    except ValueError:
+        return None
+    lines = text.strip().split('\n')
+    title = lines[0].strip() if lines and lines[0].strip() else "Zoom Class"
+    return ClassCard(title, class_date, start, end, time_match.group(1), time_match.group(2), index)
+
+
+class CardTextExtractor(HTMLParser):
+    """Collects the innerText-like text of every class card in a dashboard snapshot"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self.depth = 0  # Open divs inside the current card, 0 when outside any card
+        self.parts = None
+        self.coloured = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if self.depth:
+            if tag == 'div':
+                self.depth += 1
+            if 'background-color' in (attrs.get('style') or ''):
+                self.coloured = True
+            if tag in BLOCK_TAGS:
+                self.parts.append('\n')
+            return
+        if tag == 'div' and CARD_CLASSES.issubset((attrs.get('class') or '').split()):
+            self.depth = 1
+            self.parts = []
+            self.coloured = 'background-color' in (attrs.get('style') or '')
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/> and friends: never change the div depth
+        if self.depth:
+            if 'background-color' in (dict(attrs).get('style') or ''):
+                self.coloured = True
+            if tag in BLOCK_TAGS:
+                self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if not self.depth:
+            return
+        if tag in BLOCK_TAGS and tag not in VOID_TAGS:
+            self.parts.append('\n')
+        if tag == 'div':
+            self.depth -= 1
+            if not self.depth:
+                if self.coloured:
+                    self.cards.append(normalize_text(''.join(self.parts)))
+                self.parts = None
+
+    def handle_data(self, data):
+        if self.depth:
+            self.parts.append(data)
+
+
+def normalize_text(text):
+    """Collapse whitespace the way innerText does: one line per block, no blank lines"""
+    lines = (' '.join(line.split()) for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def card_texts_from_html(html):
+    extractor = CardTextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.cards
+
+
+def parse_dashboard(html):
+    """ClassCards of a saved dashboard page, in page order (unparseable cards are None)"""
+    return [parse_card_text(text, index) for index, text in enumerate(card_texts_from_html(html))]
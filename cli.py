@@ -0,0 +1,76 @@
+import argparse
+import sys
+import threading
+from config_manager import get_shared_config
+from backends import DRIVER_BACKENDS
+from events import EventBus, ConsolePrinter
+
+
+def find_user(config, query):
+    """Saved user matching an id, username or search text; falls back to the legacy single-user file"""
+    users = config.get_all_users()
+    if query:
+        for user in users:
+            if query in (user['id'], user.get('username')):
+                return user
+        matches = config.search_users(query)
+        if len(matches) == 1:
+            return matches[0]
+        raise SystemExit(f"❌ {len(matches)} saved users match '{query}' - be more specific")
+
+    if len(users) == 1:
+        return users[0]
+    if users:
+        names = ', '.join(user.get('username', user['id']) for user in users)
+        raise SystemExit(f"❌ Several saved users ({names}) - pick one with --user")
+
+    # Original credentials.json layout: one user's fields at the top level, password in plain text
+    if config.data.get('username'):
+        legacy = {key: value for key, value in config.data.items()
+                  if key not in ('users', 'cached_classes', 'settings')}
+        legacy['password'] = config.encrypt_password(legacy.get('password', ''))
+        return legacy
+    raise SystemExit("❌ No saved users in credentials.json - add one in the GUI first")
+
+
+def run_from_command_line(automation_class, description, combined_class=None):
+    """Run one automation in the terminal until it finishes or Ctrl+C is pressed"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--user', help="saved user id, username or search text")
+    parser.add_argument('--backend', choices=DRIVER_BACKENDS,
+                        help="browser backend (default: the user's, else playwright)")
+    parser.add_argument('--headless', action='store_true', help="run without a visible browser")
+    if automation_class.traceable:
+        parser.add_argument('--trace', action='store_true', default=None,
+                            help="save Playwright traces of failed or slow steps under traces/")
+    if combined_class:
+        parser.add_argument('--with-attendance', action='store_true',
+                            help="also mark attendance, sharing one browser and login")
+    args = parser.parse_args()
+    if combined_class and args.with_attendance:
+        automation_class = combined_class
+
+    config = get_shared_config()
+    user = find_user(config, args.user)
+
+    events = EventBus()
+    events.subscribe(ConsolePrinter())
+    automation = automation_class(user, events, config=config, backend=args.backend, headless=args.headless,
+                                  trace=getattr(args, 'trace', None))
+
+    print("ℹ️ Press Ctrl+C to stop and close the browser", flush=True)
+    run_in_foreground(automation)
+    sys.exit(0 if automation.outcome == 'completed' else 1)
+
+
+def run_in_foreground(automation):
+    """Run automation on a worker thread, stopping it on Ctrl+C; returns its outcome"""
+    thread = threading.Thread(target=automation.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.5)
+    except KeyboardInterrupt:
+        automation.stop()
+        thread.join()
+    return automation.outcome
@@ -1,31 +1,117 @@
 import json
 import os
 import base64
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from timetable import parse_date, parse_time_range, class_window, portal_now
+from metrics import CONFIG_WRITES, CONFIG_WRITE_SECONDS, CACHE_LOOKUPS
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+# Zoom registrations are per meeting series, so they outlive the 24 hour class cache
+REGISTRATION_TTL_DAYS = 90
+
+_shared_instances = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_config(config_file="credentials.json"):
+    """Get the process-wide ConfigManager for a config file"""
+    key = os.path.abspath(config_file)
+    with _shared_lock:
+        config = _shared_instances.get(key)
+        if config is None:
+            config = ConfigManager(config_file)
+            _shared_instances[key] = config
+        return config
+
 
 class ConfigManager:
     def __init__(self, config_file="credentials.json"):
         self.config_file = config_file
+        self.lock_file = config_file + ".lock"
+        self.lock = threading.RLock()
+        self.lock_handle = None
+        self.file_signature = None
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        self.user_index = {}
+        self.search_index = []
         self.data = self.load_data()
+        self.rebuild_indexes()
+    
+    @contextmanager
+    def file_lock(self):
+        """Hold the advisory lock shared by every process using the config file"""
+        with self.lock:
+            # Re-entrant within this process: the holder is the only thread past self.lock
+            if self.lock_handle is not None:
+                yield
+                return
+            
+            handle = open(self.lock_file, 'a+')
+            try:
+                if msvcrt:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                self.lock_handle = handle
+                yield
+            finally:
+                self.lock_handle = None
+                try:
+                    if msvcrt:
+                        handle.seek(0)
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                    else:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                except OSError:
+                    pass
+                handle.close()
+    
+    def get_file_signature(self):
+        """Get (mtime, size) of the config file, or None if it is missing"""
+        try:
+            stat = os.stat(self.config_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def reload_if_changed(self):
+        """Reload data only if the file changed since it was last read or written"""
+        with self.lock:
+            if self.get_file_signature() == self.file_signature:
+                return False
+            self.data = self.load_data()
+            self.rebuild_indexes()
+            return True
     
     def load_data(self):
         """Load data from JSON file or create new structure"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure all required keys exist
-                    if 'users' not in data:
-                        data['users'] = []
-                    if 'cached_classes' not in data:
-                        data['cached_classes'] = []
-                    if 'settings' not in data:
-                        data['settings'] = {'theme': 'dark'}
-                    return data
-            except:
+        with self.file_lock():
+            self.file_signature = self.get_file_signature()
+            if os.path.exists(self.config_file):
+                try:
+                    with open(self.config_file, 'r') as f:
+                        data = json.load(f)
+                        # Ensure all required keys exist
+                        if 'users' not in data:
+                            data['users'] = []
+                        if 'cached_classes' not in data:
+                            data['cached_classes'] = []
+                        if 'settings' not in data:
+                            data['settings'] = {'theme': 'dark'}
+                        return data
+                except:
+                    return self.create_default_structure()
+            else:
                 return self.create_default_structure()
-        else:
-            return self.create_default_structure()
     
     def create_default_structure(self):
         """Create default data structure"""
@@ -37,13 +123,52 @@ class ConfigManager:
             }
         }
     
-    def save_data(self):
-        """Save data to JSON file"""
+    def write_data(self):
+        """Atomically replace the config file with the in-memory data"""
+        # Unique per process and thread; written next to the target so os.replace stays atomic
+        temp_path = f"{self.config_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        started = time.perf_counter()
         try:
-            with open(self.config_file, 'w') as f:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
                 json.dump(self.data, f, indent=2)
+            os.replace(temp_path, self.config_file)
+        except:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.file_signature = self.get_file_signature()
+        CONFIG_WRITES.inc()
+        CONFIG_WRITE_SECONDS.observe(time.perf_counter() - started)
+    
+    def update_data(self, mutator):
+        """Read-merge-write: apply mutator to the latest file contents under the file lock
+        
+        The mutator receives the freshly loaded data dict and edits it in place, so
+        concurrent writers (other GUIs, batch workers) never overwrite each other's changes.
+        """
+        try:
+            with self.file_lock():
+                self.data = self.load_data()
+                result = mutator(self.data)
+                self.write_data()
+                self.rebuild_indexes()
+                return result
         except Exception as e:
             print(f"Error saving data: {e}")
+            return None
+    
+    def rebuild_indexes(self):
+        """Rebuild user lookup and search indexes after data is (re)loaded"""
+        users = self.data.get('users', [])
+        self.user_index = {user['id']: user for user in users}
+        self.search_index = [
+            (user['id'], ' '.join(
+                str(user.get(field, '')) for field in
+                ('first_name', 'last_name', 'email', 'username', 'site_url')
+            ).lower())
+            for user in users
+        ]
     
     # ==================== Encryption ====================
     
@@ -62,14 +187,25 @@ class ConfigManager:
     
     def get_all_users(self):
         """Get all saved users"""
+        self.reload_if_changed()
         return self.data.get('users', [])
     
     def get_user(self, user_id):
         """Get specific user by ID"""
-        for user in self.data.get('users', []):
-            if user['id'] == user_id:
-                return user
-        return None
+        self.reload_if_changed()
+        return self.user_index.get(user_id)
+    
+    def search_users(self, query):
+        """Get users whose name, email, username or site match every word of query"""
+        self.reload_if_changed()
+        terms = query.lower().split()
+        if not terms:
+            return self.get_all_users()
+        
+        return [
+            self.user_index[user_id] for user_id, text in self.search_index
+            if all(term in text for term in terms)
+        ]
     
     def add_user(self, user_data):
         """Add new user with encrypted password"""
@@ -78,12 +214,12 @@ class ConfigManager:
         user_data['created_at'] = datetime.now().isoformat()
         user_data['last_used'] = datetime.now().isoformat()
         
-        self.data['users'].append(user_data)
+        def apply(data):
+            data['users'].append(user_data)
+            # Add site URL to history if not present
+            self._add_site_url(data, user_data['site_url'])
         
-        # Add site URL to history if not present
-        self.add_site_url(user_data['site_url'])
-        
-        self.save_data()
+        self.update_data(apply)
     
     def update_user(self, user_data):
         """Update existing user"""
@@ -98,39 +234,53 @@ class ConfigManager:
         
         user_data['last_used'] = datetime.now().isoformat()
         
-        # Find and update user
-        for i, user in enumerate(self.data['users']):
-            if user['id'] == user_data['id']:
-                self.data['users'][i] = user_data
-                break
+        def apply(data):
+            # Find and update user
+            for i, user in enumerate(data['users']):
+                if user['id'] == user_data['id']:
+                    data['users'][i] = user_data
+                    break
+            
+            # Add site URL to history if not present
+            if 'site_url' in user_data:
+                self._add_site_url(data, user_data['site_url'])
         
-        # Add site URL to history if not present
-        if 'site_url' in user_data:
-            self.add_site_url(user_data['site_url'])
+        self.update_data(apply)
+    
+    def touch_user(self, user_id):
+        """Record that a user was just used"""
+        now = datetime.now().isoformat()
+        
+        def apply(data):
+            for user in data['users']:
+                if user['id'] == user_id:
+                    user['last_used'] = now
+                    break
         
-        self.save_data()
+        self.update_data(apply)
     
     def delete_user(self, user_id):
         """Delete user by ID"""
-        self.data['users'] = [u for u in self.data['users'] if u['id'] != user_id]
-        
-        # Also delete cached classes for this user
-        self.data['cached_classes'] = [
-            c for c in self.data['cached_classes'] 
-            if c.get('user_id') != user_id
-        ]
+        def apply(data):
+            data['users'] = [u for u in data['users'] if u['id'] != user_id]
+            
+            # Also delete cached classes for this user
+            data['cached_classes'] = [
+                c for c in data['cached_classes'] 
+                if c.get('user_id') != user_id
+            ]
+            data.get('zoom_registrations', {}).pop(user_id, None)
         
-        self.save_data()
+        self.update_data(apply)
     
     # ==================== Site URL Management ====================
     
     def get_site_urls(self):
         """Get list of previously used site URLs"""
-        if 'site_urls' not in self.data['settings']:
-            self.data['settings']['site_urls'] = []
+        self.reload_if_changed()
         
         # Extract unique URLs from users
-        urls = set(self.data['settings']['site_urls'])
+        urls = set(self.data['settings'].get('site_urls', []))
         for user in self.data['users']:
             if 'site_url' in user:
                 urls.add(user['site_url'])
@@ -139,12 +289,14 @@ class ConfigManager:
     
     def add_site_url(self, url):
         """Add site URL to history"""
-        if 'site_urls' not in self.data['settings']:
-            self.data['settings']['site_urls'] = []
+        self.update_data(lambda data: self._add_site_url(data, url))
+    
+    def _add_site_url(self, data, url):
+        if 'site_urls' not in data['settings']:
+            data['settings']['site_urls'] = []
         
-        if url not in self.data['settings']['site_urls']:
-            self.data['settings']['site_urls'].append(url)
-            self.save_data()
+        if url not in data['settings']['site_urls']:
+            data['settings']['site_urls'].append(url)
     
     # ==================== Cache Management ====================
     
@@ -157,87 +309,222 @@ class ConfigManager:
             'user_id': class_data['user_id'],
             'class_name': class_data['class_name'],
             'class_time': class_data['class_time'],
-            'date': now.strftime("%Y-%m-%d"),
+            # The class's own date (it may have started yesterday), else today
+            'date': class_data.get('date') or now.strftime("%Y-%m-%d"),
             'zoom_link': class_data['zoom_link'],
+            # zoom_links.parse_zoom_link() of the link, so rejoin can open the Zoom app directly
+            'meeting': class_data.get('meeting'),
             'cached_at': now.isoformat(),
             'expires_at': expires.isoformat()
         }
         
-        # Check if entry already exists (same user, date, class name)
-        existing_index = -1
-        for i, cached in enumerate(self.data['cached_classes']):
-            if (cached['user_id'] == class_data['user_id'] and 
-                cached['date'] == cache_entry['date'] and
-                cached['class_name'] == class_data['class_name']):
-                existing_index = i
-                break
-        
-        if existing_index >= 0:
-            # Update existing entry
-            self.data['cached_classes'][existing_index] = cache_entry
-        else:
-            # Add new entry
-            self.data['cached_classes'].append(cache_entry)
+        def apply(data):
+            # Check if entry already exists (same user, date, class name)
+            existing_index = -1
+            for i, cached in enumerate(data['cached_classes']):
+                if (cached['user_id'] == class_data['user_id'] and 
+                    cached['date'] == cache_entry['date'] and
+                    cached['class_name'] == class_data['class_name']):
+                    existing_index = i
+                    break
+            
+            if existing_index >= 0:
+                # Update existing entry
+                data['cached_classes'][existing_index] = cache_entry
+            else:
+                # Add new entry
+                data['cached_classes'].append(cache_entry)
+            
+            # Clean up expired entries
+            self._cleanup_expired_cache(data)
         
-        # Clean up expired entries
-        self.cleanup_expired_cache()
-        
-        self.save_data()
+        self.update_data(apply)
     
     def get_cached_classes(self, user_id=None):
         """Get cached classes, optionally filtered by user"""
+        self.reload_if_changed()
         if user_id:
             return [c for c in self.data['cached_classes'] if c['user_id'] == user_id]
         return self.data['cached_classes']
     
     def get_valid_cached_classes(self):
-        """Get only non-expired cached classes for today"""
-        now = datetime.now()
+        """Get only non-expired cached classes for the portal's today (or still running from yesterday)"""
+        self.reload_if_changed()
+        now = portal_now(self)
+        local_now = datetime.now()
         today = now.strftime("%Y-%m-%d")
         
         valid_classes = []
         for cached in self.data['cached_classes']:
             try:
-                expires_at = datetime.fromisoformat(cached['expires_at'])
                 # Only include if not expired and is today's class
-                if expires_at > now and cached['date'] == today:
+                if datetime.fromisoformat(cached['expires_at']) <= local_now:
+                    continue
+                if cached['date'] == today:
+                    valid_classes.append(cached)
+                    continue
+                # A class that started yesterday and runs past midnight
+                end = class_window(parse_date(cached['date']), *parse_time_range(cached['class_time']),
+                                   tz=now.tzinfo)[1]
+                if now <= end:
                     valid_classes.append(cached)
             except:
                 continue
         
         return valid_classes
     
+    def find_current_cached_class(self, user_id, now=None):
+        """Get the user's valid cached class whose time slot covers now, recording hit/miss.
+
+        Slots are read in the portal's timezone (portal_timezone setting), and one
+        that ends before it starts runs into the next day.
+        """
+        self.reload_if_changed()
+        now = now or portal_now(self)
+        local_now = datetime.now()
+        match = None
+        
+        for cached in self.data['cached_classes']:
+            if cached.get('user_id') != user_id or not cached.get('zoom_link'):
+                continue
+            try:
+                if datetime.fromisoformat(cached['expires_at']) <= local_now:
+                    continue
+                start, end = class_window(parse_date(cached['date']), *parse_time_range(cached['class_time']),
+                                          tz=now.tzinfo)
+            except (KeyError, ValueError):
+                continue
+            if start <= now <= end:
+                match = cached
+                break
+        
+        with self.lock:
+            self.cache_stats['hits' if match else 'misses'] += 1
+        CACHE_LOOKUPS.inc(result='hit' if match else 'miss')
+        return match
+    
+    def get_cache_hit_rate(self):
+        """Get (hits, lookups, rate) for cached-class lookups in this process"""
+        with self.lock:
+            hits = self.cache_stats['hits']
+            lookups = hits + self.cache_stats['misses']
+        return hits, lookups, (hits / lookups if lookups else 0.0)
+    
     def cleanup_expired_cache(self):
         """Remove expired cached classes"""
+        self.update_data(self._cleanup_expired_cache)
+    
+    def _cleanup_expired_cache(self, data):
         now = datetime.now()
         
-        self.data['cached_classes'] = [
-            cached for cached in self.data['cached_classes']
+        data['cached_classes'] = [
+            cached for cached in data['cached_classes']
             if datetime.fromisoformat(cached['expires_at']) > now
         ]
     
     def delete_cached_class(self, cache_index):
         """Delete a specific cached class by index"""
-        if 0 <= cache_index < len(self.data['cached_classes']):
-            del self.data['cached_classes'][cache_index]
-            self.save_data()
+        with self.lock:
+            if not 0 <= cache_index < len(self.data['cached_classes']):
+                return
+            target = self.data['cached_classes'][cache_index]
+        
+        # The index refers to what the caller saw; match by identity on the latest data
+        key = (target.get('user_id'), target.get('date'), target.get('class_name'))
+        
+        def apply(data):
+            data['cached_classes'] = [
+                c for c in data['cached_classes']
+                if (c.get('user_id'), c.get('date'), c.get('class_name')) != key
+            ]
+        
+        self.update_data(apply)
+    
+    # ==================== Selector Stats ====================
+    
+    def get_selector_stats(self, backend):
+        """Get a copy of {element: {locator: stats}} for one browser backend"""
+        self.reload_if_changed()
+        stored = self.data.get('selector_stats', {}).get(backend, {})
+        return {element: {key: dict(stats) for key, stats in locators.items()}
+                for element, locators in stored.items()}
+    
+    def merge_selector_stats(self, backend, deltas):
+        """Add one run's selector attempts to the stored stats"""
+        def apply(data):
+            stored = data.setdefault('selector_stats', {}).setdefault(backend, {})
+            for element, locators in deltas.items():
+                for key, delta in locators.items():
+                    stats = stored.setdefault(element, {}).setdefault(
+                        key, {'hits': 0, 'misses': 0, 'seconds': 0.0, 'streak': 0}
+                    )
+                    stats['hits'] += delta['hits']
+                    stats['misses'] += delta['misses']
+                    stats['seconds'] = round(stats['seconds'] + delta['seconds'], 3)
+                    # A hit during the run restarts the miss streak
+                    stats['streak'] = delta['streak'] if delta.get('reset') else stats['streak'] + delta['streak']
+        
+        self.update_data(apply)
+    
+    # ==================== Zoom Registrations ====================
+    
+    def get_registration(self, user_id, register_id):
+        """The user's saved registration for a Zoom meeting ({'join_url', 'meeting', ...}), or None"""
+        self.reload_if_changed()
+        entry = self.data.get('zoom_registrations', {}).get(user_id, {}).get(register_id)
+        if not entry or not entry.get('join_url'):
+            return None
+        registered_at = datetime.fromisoformat(entry['registered_at'])
+        if datetime.now() - registered_at > timedelta(days=REGISTRATION_TTL_DAYS):
+            return None
+        return dict(entry)
+    
+    def save_registration(self, user_id, register_id, join_url, meeting=None):
+        """Remember that the user registered for a meeting and the join URL Zoom gave back"""
+        now = datetime.now()
+        
+        def apply(data):
+            registrations = data.setdefault('zoom_registrations', {})
+            registrations.setdefault(user_id, {})[register_id] = {
+                'join_url': join_url,
+                'meeting': meeting,
+                'registered_at': now.isoformat()
+            }
+            # Drop registrations past their lifetime
+            cutoff = now - timedelta(days=REGISTRATION_TTL_DAYS)
+            for user_registrations in registrations.values():
+                for key in [key for key, entry in user_registrations.items()
+                            if datetime.fromisoformat(entry['registered_at']) < cutoff]:
+                    del user_registrations[key]
+        
+        self.update_data(apply)
+    
+    def forget_registration(self, user_id, register_id):
+        """Drop a registration Zoom no longer accepts"""
+        def apply(data):
+            data.get('zoom_registrations', {}).get(user_id, {}).pop(register_id, None)
+        
+        self.update_data(apply)
     
     # ==================== Settings Management ====================
     
     def get_theme(self):
         """Get current theme setting"""
+        self.reload_if_changed()
         return self.data['settings'].get('theme', 'dark')
     
     def set_theme(self, theme):
         """Set theme (dark or light)"""
-        self.data['settings']['theme'] = theme
-        self.save_data()
+        self.set_setting('theme', theme)
     
     def get_setting(self, key, default=None):
         """Get a setting value"""
+        self.reload_if_changed()
         return self.data['settings'].get(key, default)
     
     def set_setting(self, key, value):
         """Set a setting value"""
-        self.data['settings'][key] = value
-        self.save_data()
\ No newline at end of file
+        def apply(data):
+            data['settings'][key] = value
+        
+        self.update_data(apply)
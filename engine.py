@@ -0,0 +1,865 @@
+import re
+import time
+from datetime import timedelta
+from config_manager import get_shared_config
+from cancellation import CancelToken, RunCancelled
+from backends import register_backend, load_backend
+from selector_registry import SelectorRegistry
+from class_parser import parse_card_text
+from schedule_planner import plan_day, choose_class, minutes, UPCOMING, ONGOING, DEFAULT_MAX_WAIT_MINUTES
+from timetable import portal_now, portal_timezone, parse_date, parse_time_range, class_window
+from retry import STEP_POLICIES, breaker_for
+from tracing import StepTracer, DEFAULT_MAX_MB
+from resource_monitor import ResourceMonitor, DEFAULT_HOLD_MINUTES, DEFAULT_MEMORY_CAP_MB
+from zoom_links import parse_zoom_link
+from events import (
+    LOG, STATUS, RUN_STARTED, RUN_FINISHED, STEP_STARTED, STEP_FINISHED,
+    CLASS_SELECTED, LINK_CAPTURED, ATTENDANCE_SUBMITTED, ERROR, RESOURCES
+)
+
+# Drivers are imported on first use, so picking one never loads the other stack
+register_backend('driver:playwright', 'playwright_driver', 'PlaywrightDriver')
+register_backend('driver:selenium', 'selenium_driver', 'SeleniumDriver')
+
+PORTAL_LOGIN_URL = 'https://web.javainstitute.org/web-portal/login/student.jsp'
+# While holding a session for the next class: reload this often to keep it alive,
+# and open the class this long before it starts
+KEEPALIVE_SECONDS = 300
+JOIN_LEAD_SECONDS = 30
+MAX_ATTENDANCE_SUBMITS = 10
+
+# Single locators (see selector_registry for the tuple format); elements with
+# fallback candidates live in selector_registry.SELECTORS
+LOGGED_IN_MARKERS = (
+    ('css', 'div.mt-element-ribbon'),
+    ('css', '#online_attendance_panel')
+)
+CLASS_CARDS = ('css', "div.mt-element-ribbon.tt-height:has([style*='background-color'])")
+CARD_LINK = ('css', 'a')
+SUBMIT_BUTTON = ('role', 'button', 'Submit')
+ATTENDANCE_CARD = ('xpath', "./ancestor::div[contains(@class, 'col-md-6')][1]")
+ZOOM_FORM_FIELDS = (
+    ('first_name', 'First Name'),
+    ('last_name', 'Last Name'),
+    ('email', 'Email Address'),
+    ('nic_number', 'NIC Number'),
+    ('contact_number', 'Contact Number')
+)
+
+ALREADY_MARKED_RE = re.compile(r'already', re.IGNORECASE)
+
+
+def cached_class_start(cached, config):
+    """ISO start time of a cached class in the portal timezone, or None if its slot is unreadable"""
+    try:
+        start, end = parse_time_range(cached['class_time'])
+        return class_window(parse_date(cached['date']), start, end, portal_timezone(config))[0].isoformat()
+    except (KeyError, ValueError):
+        return None
+
+
+class Automation:
+    """Portal automation core shared by every backend and entry point.
+
+    Subclasses implement run_steps() against self.driver, a Playwright or
+    Selenium adapter chosen per run (backend=...) or per user ('backend' field).
+    """
+
+    kind = None
+    default_backend = 'playwright'
+    # Whether the 'failure_tracing' setting applies to this flow
+    traceable = False
+    # Whether the flow ends by opening Zoom (the 'after_join' close policy waits for that)
+    joins_zoom = False
+
+    def __init__(self, user_credentials, events, config=None, run_id=None, backend=None, headless=False,
+                 shared_browser=None, trace=None, har=None, close_policy=None):
+        self.credentials = user_credentials
+        self.events = events
+        self.run_id = run_id
+        self.config = config or get_shared_config()
+        self.backend = backend or user_credentials.get('backend') or self.default_backend
+        self.headless = headless
+        # Launched by the caller (driver.launch_shared) to reuse one browser across runs
+        self.shared_browser = shared_browser
+        # None follows the 'failure_tracing' setting
+        self.trace = trace
+        # ('record' | 'replay', path) for offline runs, see har_tool.py
+        self.har = har
+        # resource_monitor.CLOSE_POLICIES entry; None follows the 'browser_close_policy' setting
+        self.close_policy = close_policy
+        self.driver = None
+        self.selectors = None
+        self.tracer = None
+        # Browser process sampling (needs psutil); shared browsers are measured by their owner
+        self.monitor = None
+        # Set once the Zoom app was opened, for the 'after_join' close policy
+        self.joined = False
+        # Portal the run logs into; retried steps share its circuit breaker
+        self.portal_url = None
+        self.should_stop = False
+        self.cancel_token = CancelToken()
+        self.outcome = None
+        self.zoom_link = None
+        # Rank of zoom_link when it came from the network (1 registration, 2 join), else 0
+        self.link_rank = 0
+        self.watching_links = False
+        self.cached_link = None
+        # Zoom registration page id of the class's meeting, and the join URL saved for it this run
+        self.register_id = None
+        self.registered_link = None
+        self.class_name = None
+        self.class_time = None
+        self.class_date = None
+        # Upcoming class select_class chose to wait for (schedule_planner.PlannedClass)
+        self.next_class = None
+
+    def emit(self, type, **payload):
+        self.events.emit(type, self.run_id, **payload)
+
+    def log(self, message, level='info'):
+        self.events.emit(LOG, self.run_id, message=message, level=level)
+
+    def update_status(self, message, level='info'):
+        self.events.emit(STATUS, self.run_id, message=message, level=level)
+
+    def run_step(self, name, func):
+        """Run one step between step_started/step_finished events; returns its result.
+
+        Steps listed in retry.STEP_POLICIES are retried with backoff and go through
+        the portal's circuit breaker; all others run exactly once.
+        """
+        self.emit(STEP_STARTED, step=name)
+        if self.tracer:
+            self.tracer.begin(name)
+        started = time.perf_counter()
+        ok = False
+        attempts = 0
+        try:
+            policy = STEP_POLICIES.get(name)
+            if not policy or not self.portal_url:
+                attempts = 1
+                ok = func()
+                return ok
+
+            breaker = breaker_for(self.portal_url)
+            while True:
+                attempts += 1
+                breaker.acquire(self.cancel_token, on_wait=lambda: self.portal_down(breaker))
+                try:
+                    if attempts > 1 and name != 'login':
+                        # Start the retry from a freshly loaded page
+                        self.driver.goto(self.driver.current_url())
+                        self.driver.wait_until_loaded()
+                    ok = func()
+                except RunCancelled:
+                    breaker.release()
+                    raise
+                except Exception as e:
+                    # e.g. the reload hit a portal that is down: a failed attempt like any other
+                    self.emit(ERROR, step=name, message=str(e))
+                    self.log(f"❌ {name} failed: {str(e)}", 'error')
+                    ok = False
+                if self.cancel_token.is_cancelled:
+                    # A stop tears the browser down mid-step; that says nothing about the portal
+                    breaker.release()
+                    self.cancel_token.check()
+                breaker.record(bool(ok), caller=self.run_id or id(self))
+                if ok or attempts >= policy.attempts:
+                    return ok
+                delay = policy.delay(attempts)
+                self.log(f"🔁 {name} failed, retrying in {delay:.1f}s (attempt {attempts + 1}/{policy.attempts})",
+                         'warning')
+                self.pause(delay)
+        finally:
+            duration = time.perf_counter() - started
+            if self.tracer:
+                self.tracer.end(name, bool(ok), duration)
+            self.emit(STEP_FINISHED, step=name, ok=bool(ok), duration=duration, attempts=attempts)
+
+    def portal_down(self, breaker):
+        self.log(f"⛔ {breaker.name} keeps failing - waiting for it to recover", 'warning')
+        self.update_status("⛔ Portal unavailable - waiting", 'warning')
+
+    def stop(self):
+        """Request a stop (safe from any thread); the browser is released promptly"""
+        self.should_stop = True
+        self.cancel_token.cancel()
+        if self.driver:
+            self.driver.interrupt()
+
+    def pause(self, seconds):
+        self.driver.pause(seconds)
+
+    def fill(self, element, value, timeout=5):
+        """Fill a registry element, trying its best-performing locator first"""
+        return self.driver.fill(
+            self.selectors.candidates(element), value, timeout, report=self.selectors.reporter(element)
+        )
+
+    def click(self, element, timeout=5, js_fallback=False):
+        """Click a registry element, trying its best-performing locator first"""
+        return self.driver.click(
+            self.selectors.candidates(element), timeout, js_fallback, report=self.selectors.reporter(element)
+        )
+
+    def run(self):
+        self.outcome = 'failed'
+        self.emit(RUN_STARTED, user_id=self.credentials.get('id'), kind=self.kind, backend=self.backend)
+        try:
+            self.selectors = SelectorRegistry(self.config, self.backend, self.log)
+            self.driver = load_backend(f'driver:{self.backend}')(
+                self.cancel_token, self.log, headless=self.headless, shared=self.shared_browser, har=self.har
+            )
+            self.log(f"🧭 Using {self.backend} backend", 'info')
+            self.monitor = None if self.shared_browser else ResourceMonitor.create()
+            if self.monitor:
+                with self.monitor.watch_start():
+                    self.driver.start()
+            else:
+                self.driver.start()
+            self.cancel_token.check()
+            trace = self.trace if self.trace is not None else self.config.get_setting('failure_tracing', False)
+            if self.traceable and trace:
+                self.start_tracing()
+
+            completed = self.run_steps()
+            self.selectors.flush()
+            # A stop kills the browser mid-step, so the step fails; report the stop, not the failure
+            self.cancel_token.check()
+            if not completed:
+                return
+            self.outcome = 'completed'
+
+            if self.headless:
+                self.log("✅ Automation complete", 'success')
+                self.update_status("✅ Completed", 'success')
+            else:
+                self.hold_browser()
+
+        except RunCancelled:
+            self.outcome = 'cancelled'
+            self.log("⏹ Automation stopped", 'warning')
+            self.update_status("⏹ Stopped", 'warning')
+        except Exception as e:
+            self.emit(ERROR, step='run', message=str(e))
+            self.log(f"❌ Automation error: {str(e)}", 'error')
+            self.update_status("❌ Error occurred", 'error')
+            raise
+        finally:
+            if self.driver:
+                self.driver.close()
+            if self.monitor:
+                self.report_resources(self.monitor.stop())
+            if self.selectors:
+                self.selectors.flush()
+            released_after = self.cancel_token.seconds_since_cancel()
+            if released_after is not None:
+                self.log(f"🧹 Browser released {released_after:.1f}s after stop", 'info')
+            self.emit(RUN_FINISHED, outcome=self.outcome, zoom_link=self.zoom_link)
+
+    def hold_browser(self):
+        """Keep the finished run's browser open for the user, within the close policies"""
+        policy = self.close_policy or self.config.get_setting('browser_close_policy', 'hold')
+        if policy == 'after_join' and (self.joined or not self.joins_zoom):
+            reason = "Zoom is open" if self.joined else "nothing left to do"
+            self.log(f"✅ Automation complete - {reason}, closing the browser", 'success')
+            self.update_status("✅ Completed", 'success')
+            return
+
+        self.log("✅ Automation complete. Browser will remain open until you close it.", 'success')
+        self.log("ℹ️ You can now interact with the browser manually.", 'info')
+        self.update_status("✅ Completed - Browser Open", 'success')
+
+        # Wait until the user closes the browser, the run is stopped, the hold time passes
+        # or the browser outgrows the memory cap
+        hold_seconds = self.config.get_setting('browser_hold_minutes', DEFAULT_HOLD_MINUTES) * 60
+        memory_cap_mb = self.config.get_setting('browser_memory_cap_mb', DEFAULT_MEMORY_CAP_MB)
+        deadline = time.monotonic() + hold_seconds
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.log("⌛ Hold time over - closing the browser", 'info')
+                    return
+                self.pause(min(remaining, self.monitor.interval) if self.monitor else remaining)
+                if self.monitor and self.monitor.over_cap(memory_cap_mb):
+                    self.log(f"🧹 Browser passed {memory_cap_mb} MB - closing it", 'warning')
+                    return
+        except RunCancelled:
+            raise
+        except:
+            pass
+
+    def report_resources(self, summary):
+        self.emit(RESOURCES, **summary)
+        lifetime = max((process['seconds'] for process in summary['processes']), default=0.0)
+        self.log(f"🧮 Browser used up to {summary['peak_rss_mb']:.0f} MB, {summary['avg_cpu_percent']:.0f}% CPU "
+                 f"on average, across {len(summary['processes'])} process(es) over {lifetime:.0f}s", 'info')
+        leftovers = [process for process in summary['processes'] if process['alive']]
+        if leftovers:
+            names = ', '.join(f"{process['name']} ({process['pid']})" for process in leftovers)
+            self.log(f"⚠️ Browser processes still running after close: {names}", 'warning')
+
+    def start_tracing(self):
+        try:
+            self.tracer = StepTracer(
+                self.driver, self.run_id, max_mb=self.config.get_setting('trace_max_mb', DEFAULT_MAX_MB),
+                log=self.log
+            )
+            if not self.tracer.enabled:
+                self.tracer = None
+                self.log(f"⚠️ Tracing is not supported by the {self.backend} backend", 'warning')
+        except Exception as e:
+            self.tracer = None
+            self.log(f"⚠️ Could not start tracing: {e}", 'warning')
+
+    def run_steps(self):
+        """Perform the automation; return False to end the run early"""
+        raise NotImplementedError
+
+    def login(self, url):
+        try:
+            self.log("🌐 Navigating to login page...", 'info')
+            self.update_status("🌐 Loading login page...", 'info')
+
+            # Decrypt password
+            password = self.config.decrypt_password(self.credentials['password'])
+
+            self.driver.goto(url)
+            self.driver.wait_until_loaded()
+
+            self.log("📝 Entering credentials...", 'info')
+            if not self.fill('username', self.credentials['username'], timeout=10):
+                raise RuntimeError("Username field not found")
+            self.pause(0.5)
+
+            if not self.fill('password', password):
+                raise RuntimeError("Password field not found")
+            self.pause(0.5)
+
+            if not self.click('sign_in'):
+                raise RuntimeError("Sign In button not found")
+
+            self.log("⏳ Waiting for dashboard to load...", 'info')
+            self.driver.wait_until_loaded()
+            if not self.driver.wait_for_any(LOGGED_IN_MARKERS, timeout=10):
+                self.log("⚠️ Success indicators not detected - check the browser", 'warning')
+
+            self.log("✅ Logged in successfully - Check browser", 'success')
+            self.update_status("✅ Logged in", 'success')
+            return True
+
+        except Exception as e:
+            self.emit(ERROR, step='login', message=str(e))
+            self.log(f"❌ Login failed: {str(e)}", 'error')
+            self.log("⚠️ Please check the browser and login manually if needed", 'warning')
+            self.update_status("❌ Login failed", 'error')
+            return False
+
+
+class ZoomAutomation(Automation):
+    """Log in, pick today's ongoing (or latest started) class and register for its Zoom meeting"""
+
+    kind = 'zoom'
+    traceable = True
+    joins_zoom = True
+
+    def run_steps(self):
+        # Fast path: rejoin today's cached link without touching the portal
+        if self.run_step('cache_join', self.join_from_cache):
+            return True
+
+        # Step 1: Login
+        self.portal_url = self.credentials['site_url']
+        if not self.run_step('login', lambda: self.login(self.portal_url)):
+            return False
+        self.cancel_token.check()
+
+        # Step 2: Select class
+        if not self.open_class():
+            return False
+        self.cancel_token.check()
+
+        # Step 3: Handle Zoom registration
+        if self.run_step('join', self.handle_zoom_popup):
+            self.cache_link()
+        return True
+
+    def join_from_cache(self):
+        cached = self.config.find_current_cached_class(self.credentials.get('id'))
+        hits, lookups, rate = self.config.get_cache_hit_rate()
+        self.log(f"📊 Class cache hit rate: {hits}/{lookups} ({rate:.0%})", 'info')
+
+        if not cached:
+            return False
+
+        try:
+            self.class_name = cached['class_name']
+            self.class_time = cached['class_time']
+            self.zoom_link = cached['zoom_link']
+            self.emit(CLASS_SELECTED, class_name=self.class_name, class_time=self.class_time, source='cache',
+                      class_start=cached_class_start(cached, self.config))
+
+            self.log(f"⚡ Cached link found for {self.class_name} - skipping portal login", 'success')
+            self.update_status(f"⚡ Rejoining: {self.class_name}", 'success')
+
+            self.driver.goto(self.zoom_link)
+            # A stale or broken link shows no Open button: fall back to the portal
+            if not self.fill_zoom_form(require_open=True):
+                self.log("⚠️ Cached link did not lead to Zoom, using portal instead", 'warning')
+                return False
+            return True
+
+        except Exception as e:
+            self.log(f"⚠️ Cached link failed, using portal instead: {str(e)}", 'warning')
+            return False
+
+    def select_class(self):
+        try:
+            self.log("🔍 Searching for today's classes...", 'info')
+            self.update_status("🔍 Searching classes...", 'info')
+
+            # Card times are portal-local, so compare against the portal's clock, not the machine's
+            now = portal_now(self.config)
+
+            # Wait for class cards to load
+            self.driver.wait_for_any((CLASS_CARDS,), timeout=10)
+            class_cards = self.driver.find_all(CLASS_CARDS)
+
+            if not class_cards:
+                self.log("⚠️ No class cards found on page", 'warning')
+                self.update_status("⚠️ No classes found", 'warning')
+                return False
+
+            self.log(f"📚 Found {len(class_cards)} class card(s)", 'info')
+
+            parsed = []
+            for index, card in enumerate(class_cards):
+                self.cancel_token.check()
+                parsed.append(parse_card_text(self.driver.text_of(card), index))
+
+            # Ongoing first, then the next upcoming, then the ones that already ended
+            plan = plan_day(parsed, now)
+            for planned in plan:
+                self.log(f"📅 Class found: {planned.card.title}", 'info')
+                self.log(f"   ⏰ Time: {planned.card.time_range} ({planned.describe(now)})", 'info')
+
+            max_wait = self.config.get_setting('wait_for_class_minutes', DEFAULT_MAX_WAIT_MINUTES)
+            chosen = choose_class(plan, now, max_wait=timedelta(minutes=max_wait))
+            if not chosen:
+                upcoming = [planned for planned in plan if planned.status == UPCOMING]
+                if upcoming:
+                    self.log(f"⚠️ Next class starts in {minutes(upcoming[0].start - now)} - too far ahead to wait",
+                             'warning')
+                self.log("⚠️ No suitable class found for today", 'warning')
+                self.update_status("⚠️ No classes today", 'warning')
+                return False
+
+            if chosen.status == UPCOMING and (chosen.start - now).total_seconds() > JOIN_LEAD_SECONDS:
+                # Logged in already: hold the session and open the class as it starts
+                self.next_class = chosen
+                self.log(f"⏳ {chosen.card.title} {chosen.describe(now)} - holding the session until then",
+                         'info')
+                self.update_status(f"⏳ Waiting for {chosen.card.title}", 'info')
+                return True
+            self.next_class = None
+
+            selected = chosen.card
+            if chosen.status == ONGOING:
+                self.log(f"✅ Class is ongoing! Selecting this class", 'success')
+            nearest_card = class_cards[selected.index]
+            self.class_name = selected.title
+            self.class_time = selected.time_range
+            self.class_date = selected.date.isoformat()
+
+            self.emit(CLASS_SELECTED, class_name=self.class_name, class_time=self.class_time, source='portal',
+                      class_start=selected.starts_at(now.tzinfo).isoformat())
+            self.log(f"🎯 Selecting class: {self.class_name}", 'success')
+            self.log(f"   ⏰ {self.class_time}", 'info')
+            self.update_status(f"🎯 Selected: {self.class_name}", 'success')
+
+            # Click the card, then the first link inside it
+            self.driver.click_element(nearest_card)
+            self.pause(1)
+
+            link = self.driver.find_within(nearest_card, CARD_LINK)
+            if link:
+                self.driver.click_element(link)
+                self.pause(1)
+                self.log("✅ Clicked class link", 'success')
+            else:
+                self.log("⚠️ Could not find link inside card", 'warning')
+            return True
+
+        except Exception as e:
+            self.emit(ERROR, step='select_class', message=str(e))
+            self.log(f"❌ Error selecting class: {str(e)}", 'error')
+            self.update_status("❌ Class selection failed", 'error')
+            return False
+
+    def wait_for_class(self):
+        """Hold the logged-in page until the chosen class is about to start"""
+        opens_at = self.next_class.start - timedelta(seconds=JOIN_LEAD_SECONDS)
+        while True:
+            remaining = (opens_at - portal_now(self.config)).total_seconds()
+            if remaining <= 0:
+                break
+            self.pause(min(remaining, KEEPALIVE_SECONDS))
+            # Reload so the portal session does not time out, and once more at the end for fresh cards
+            try:
+                self.driver.goto(self.driver.current_url())
+                self.driver.wait_until_loaded()
+            except Exception as e:
+                # A blip while waiting should not cost the class; the next reload tries again
+                self.log(f"⚠️ Keep-alive reload failed: {str(e)}", 'warning')
+        self.log(f"🔔 {self.next_class.card.title} is starting", 'success')
+        return True
+
+    def open_class(self, before_wait=None):
+        """select_class, waiting for the next class first when it has not started yet.
+
+        before_wait() runs once the run knows it has to wait, before the wait starts.
+        """
+        if not self.run_step('select_class', self.select_class):
+            return False
+        if self.next_class:
+            if before_wait:
+                before_wait()
+            self.cancel_token.check()
+            if not self.run_step('wait_for_class', self.wait_for_class):
+                return False
+            # Still not open (e.g. the timetable changed while waiting): give up rather than wait again
+            return self.run_step('select_class', self.select_class) and not self.next_class
+        return True
+
+    def handle_zoom_popup(self):
+        if not self.open_zoom_popup():
+            return False
+        self.fill_zoom_form()
+        return True
+
+    def watch_zoom_links(self):
+        """Capture Zoom URLs as they cross the network, so the link is cached even if the popup never renders"""
+        if not self.watching_links:
+            self.watching_links = self.driver.watch_urls(self.on_network_url)
+
+    def on_network_url(self, url):
+        meeting = parse_zoom_link(url) if 'zoom.us/' in url else None
+        if not meeting:
+            return
+        if meeting['register_id']:
+            self.register_id = self.register_id or meeting['register_id']
+        # A join link (meeting id, maybe pwd/tk) beats a registration page; keep the first of the best kind
+        rank = 2 if meeting['meeting_id'] else 1
+        if rank <= self.link_rank:
+            return
+        self.zoom_link = url
+        self.link_rank = rank
+        self.emit(LINK_CAPTURED, url=url, source='network')
+        self.log(f"🔗 Captured Zoom {'join' if rank == 2 else 'registration'} link from the network", 'info')
+        try:
+            self.cache_link()
+        except Exception as e:
+            self.log(f"⚠️ Could not cache the link: {str(e)}", 'warning')
+        if rank == 2 and self.register_id:
+            # A join link after the registration page is the one Zoom hands this registrant
+            self.remember_registration(url, meeting)
+
+    def open_zoom_popup(self):
+        """Open the class's Zoom registration window and switch to it"""
+        self.watch_zoom_links()
+        try:
+            self.log("⏳ Waiting for Zoom registration popup...", 'info')
+            self.update_status("⏳ Waiting for popup...", 'info')
+
+            popup_url = self.driver.click_for_popup(
+                self.selectors.candidates('zoom_popup_link'), timeout=10,
+                report=self.selectors.reporter('zoom_popup_link')
+            )
+            self.log("✅ Popup detected!", 'success')
+            # The popup may already have redirected past the link the network showed; keep the better one
+            if not self.link_rank:
+                self.zoom_link = popup_url
+                self.emit(LINK_CAPTURED, url=self.zoom_link, source='popup')
+            return True
+
+        except Exception as e:
+            if self.link_rank and not self.cancel_token.is_cancelled:
+                # The request went out but the window did not show up in time: open the link ourselves
+                self.log("ℹ️ Popup did not open - continuing with the link captured from the network", 'info')
+                self.driver.switch_to(self.driver.open_tab(self.zoom_link))
+                return True
+            self.emit(ERROR, step='join', message=str(e))
+            self.log(f"⚠️ No popup detected or error: {str(e)}", 'warning')
+            self.log("ℹ️ Please check browser and join manually if needed", 'info')
+            return False
+
+    def known_registration(self):
+        """This user's saved registration for the meeting on the current page, or None"""
+        if not self.register_id:
+            meeting = parse_zoom_link(self.zoom_link) or parse_zoom_link(self.driver.current_url())
+            self.register_id = meeting and meeting['register_id']
+        if not self.register_id or not self.credentials.get('id'):
+            return None
+        return self.config.get_registration(self.credentials['id'], self.register_id)
+
+    def remember_registration(self, join_url, meeting=None):
+        if not self.register_id or not self.credentials.get('id') or join_url == self.registered_link:
+            return
+        try:
+            self.config.save_registration(self.credentials['id'], self.register_id, join_url,
+                                          meeting or parse_zoom_link(join_url))
+            self.registered_link = join_url
+            self.log("💾 Zoom registration saved - next time the form is skipped", 'info')
+        except Exception as e:
+            self.log(f"⚠️ Could not save the registration: {str(e)}", 'warning')
+
+    def fill_zoom_form(self, require_open=False):
+        """Register on the Zoom page and click Open; with require_open, a page without the Open button fails"""
+        try:
+            self.log("📝 Filling Zoom registration form...", 'info')
+            self.update_status("📝 Filling form...", 'info')
+
+            self.driver.wait_until_loaded()
+
+            # Registered for this meeting before: go straight to the join URL Zoom gave back then
+            registration = self.known_registration()
+            skip_form = False
+            if registration:
+                self.log("⚡ Already registered for this meeting - skipping the form", 'success')
+                register_page = self.driver.current_url()
+                self.zoom_link = self.registered_link = registration['join_url']
+                self.link_rank = 2
+                self.driver.goto(self.zoom_link)
+                self.driver.wait_until_loaded()
+                skip_form = self.driver.wait_for_any(self.selectors.candidates('open_zoom'), timeout=5)
+                if not skip_form:
+                    # Expired or invalid registrant link: drop it and register from the original page
+                    self.log("⚠️ Saved registration was not accepted - registering again", 'warning')
+                    self.config.forget_registration(self.credentials['id'], self.register_id)
+                    self.registered_link = None
+                    self.zoom_link, self.link_rank = register_page, 1
+                    if not self.driver.wait_for_any(self.selectors.candidates('first_name'), timeout=1):
+                        self.driver.goto(register_page)
+                        self.driver.wait_until_loaded()
+
+            # Already registered / direct join links skip straight to the Open button
+            if skip_form:
+                pass
+            elif not self.driver.wait_for_any(self.selectors.candidates('first_name'), timeout=3):
+                self.log("ℹ️ No registration form on page - looking for Open button", 'info')
+            else:
+                for key, label in ZOOM_FORM_FIELDS:
+                    if not self.fill(key, self.credentials[key], timeout=3):
+                        self.log(f"⚠️ Could not fill '{label}' - please fill it manually", 'warning')
+                    self.pause(0.3)
+
+                self.log("✅ Form filled successfully", 'success')
+
+                # Click Register and Join, falling back to a DOM click when the real click is blocked
+                if self.click('register', timeout=3, js_fallback=True):
+                    self.pause(1)
+                    self.log("✅ Clicked 'Register'", 'success')
+                else:
+                    self.log("⚠️ Could not click register button automatically; please click it manually", 'warning')
+
+            # Wait for "Open Zoom" button
+            if self.driver.wait_for_any(self.selectors.candidates('open_zoom'), timeout=5):
+                self.log("⚠️ POPUP DETECTED - Please check browser!", 'warning')
+                self.log("👉 Click the 'Open Zoom' button manually in the browser", 'warning')
+                self.update_status("⚠️ Manual action needed - Check browser", 'warning')
+
+                # Backends without network capture learn the join URL from the page itself
+                current = parse_zoom_link(self.driver.current_url())
+                if current and current['meeting_id']:
+                    if self.link_rank < 2:
+                        self.zoom_link, self.link_rank = self.driver.current_url(), 2
+                    self.remember_registration(self.driver.current_url(), current)
+
+                # Try to click, but it might not work due to browser restrictions
+                if self.click('open_zoom', timeout=2):
+                    self.joined = True
+                    self.log("✅ Attempted to click 'Open Zoom'", 'info')
+                else:
+                    self.log("ℹ️ Automatic click failed - Please click manually", 'info')
+            elif require_open:
+                return False
+            else:
+                self.log("ℹ️ 'Open Zoom' button not found - Please handle manually", 'info')
+
+            # Keep popup open for manual interaction
+            self.log("✅ Registration complete - Browser will remain open", 'success')
+            self.log("👉 Please check browser for any additional steps", 'info')
+            self.update_status("✅ Form submitted - Check browser", 'success')
+            return True
+
+        except Exception as e:
+            self.log(f"⚠️ Form filling error: {str(e)}", 'warning')
+            self.log("👉 Please fill the form manually in the browser", 'warning')
+            self.update_status("⚠️ Manual form fill needed", 'warning')
+            return False
+
+    def cache_link(self):
+        """Cache the captured link so the next run today can skip the portal"""
+        if not self.zoom_link or not self.credentials.get('id') or self.zoom_link == self.cached_link:
+            return
+        self.config.cache_class({
+            'user_id': self.credentials['id'],
+            'class_name': self.class_name or "Zoom Class",
+            'class_time': self.class_time or "Time TBD",
+            'date': self.class_date,
+            'zoom_link': self.zoom_link,
+            'meeting': parse_zoom_link(self.zoom_link)
+        })
+        self.cached_link = self.zoom_link
+        self.log("💾 Class link cached for 24 hours", 'success')
+
+
+class AttendanceAutomation(Automation):
+    """Log in and submit every open attendance entry"""
+
+    kind = 'attendance'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-entry results of mark_attendance: 'submitted', 'already_marked' or 'failed'
+        self.attendance_counts = {'submitted': 0, 'already_marked': 0, 'failed': 0}
+
+    def run_steps(self):
+        self.portal_url = self.config.get_setting('attendance_login_url', PORTAL_LOGIN_URL)
+
+        # Step 1: Login
+        if not self.run_step('login', lambda: self.login(self.portal_url)):
+            return False
+        self.cancel_token.check()
+
+        # Step 2: Mark attendance
+        self.run_step('mark_attendance', self.mark_attendance)
+        return True
+
+    def mark_attendance(self):
+        try:
+            self.log("📋 Opening attendance panel...", 'info')
+            self.update_status("📋 Opening attendance...", 'info')
+
+            if not self.click('attendance_panel', timeout=10):
+                raise RuntimeError("Attendance panel not found")
+            self.pause(1.5)
+
+            self.log("🔍 Searching for attendance entries...", 'info')
+            submitted_count = 0
+
+            for _ in range(MAX_ATTENDANCE_SUBMITS):
+                self.cancel_token.check()
+                buttons = [btn for btn in self.driver.find_all(SUBMIT_BUTTON) if self.driver.is_visible(btn)]
+                if not buttons:
+                    self.log("✅ No more attendance entries found", 'success')
+                    break
+                submit_btn = buttons[0]
+
+                # Log which class is being marked
+                entry = None
+                try:
+                    card = self.driver.find_within(submit_btn, ATTENDANCE_CARD)
+                    lines = [line for line in self.driver.text_of(card).split('\n') if line.strip() and 'Submit' not in line]
+                    if lines:
+                        entry = lines[0].strip()
+                        self.log("   --- Marking Attendance ---", 'info')
+                        self.log(f"   {entry}", 'info')
+                except Exception:
+                    pass
+
+                try:
+                    alert_text = self.driver.click_and_accept_dialog(submit_btn, timeout=5)
+                except Exception as e:
+                    self.attendance_counts['failed'] += 1
+                    self.emit(ERROR, step='mark_attendance', message=str(e))
+                    self.log(f"❌ Error submitting: {e}", 'error')
+                    break
+
+                self.log("✅ Clicked Submit", 'success')
+                if alert_text is not None:
+                    self.log(f"📢 Alert: {alert_text}", 'info')
+                else:
+                    self.log("⚠️ No alert appeared (maybe already marked)", 'warning')
+
+                # No confirmation alert, or one saying so, means the portal had it already
+                status = 'submitted'
+                if alert_text is None or ALREADY_MARKED_RE.search(alert_text):
+                    status = 'already_marked'
+                self.attendance_counts[status] += 1
+
+                submitted_count += 1
+                self.emit(ATTENDANCE_SUBMITTED, entry=entry, alert=alert_text, count=submitted_count, status=status)
+                self.update_status(f"✅ Submitted {submitted_count}", 'success')
+                self.pause(2)
+
+            if submitted_count > 0:
+                self.log(f"🎉 Successfully submitted {submitted_count} attendance(s)!", 'success')
+            else:
+                self.log("⚠️ No entries to submit", 'warning')
+            return True
+
+        except Exception as e:
+            self.emit(ERROR, step='mark_attendance', message=str(e))
+            self.log(f"❌ Attendance error: {str(e)}", 'error')
+            return False
+
+
+class CombinedAutomation(ZoomAutomation, AttendanceAutomation):
+    """Join today's class and mark attendance with one browser and one login.
+
+    The driver API is synchronous, so the two flows overlap their page loads
+    rather than running in parallel: a second tab loads the dashboard for
+    attendance while the first picks the class, and the Zoom registration page
+    loads in its own window while attendance is being marked.
+    """
+
+    kind = 'combined'
+
+    def run_steps(self):
+        site_url = self.portal_url = self.credentials['site_url']
+
+        # Fast path: the Zoom page comes from the cache, the portal is only needed for attendance
+        if self.run_step('cache_join', self.join_from_cache):
+            self.driver.switch_to(self.driver.open_tab('about:blank'))
+            if self.run_step('login', lambda: self.login(site_url)):
+                self.run_step('mark_attendance', self.mark_attendance)
+            return True
+
+        # Step 1: Login (once, shared by both tabs through the browser context)
+        if not self.run_step('login', lambda: self.login(site_url)):
+            return False
+        self.cancel_token.check()
+
+        # Step 2: Start loading the attendance tab in the background
+        attendance_tab = self.driver.open_tab(site_url)
+        marked = []
+
+        def mark_attendance_now():
+            # Before waiting up to wait_for_class_minutes for the class, so attendance never waits on it
+            dashboard_tab = self.driver.current_tab()
+            self.driver.switch_to(attendance_tab)
+            self.run_step('mark_attendance', self.mark_attendance)
+            marked.append(True)
+            self.driver.switch_to(dashboard_tab)
+
+        # Step 3: Pick the class and open its Zoom window
+        joining = (self.open_class(before_wait=mark_attendance_now)
+                   and self.run_step('open_popup', self.open_zoom_popup))
+        zoom_tab = self.driver.current_tab() if joining else None
+        self.cancel_token.check()
+
+        # Step 4: Mark attendance while the Zoom page loads
+        if not marked:
+            self.driver.switch_to(attendance_tab)
+            self.run_step('mark_attendance', self.mark_attendance)
+            self.cancel_token.check()
+
+        # Step 5: Finish the Zoom registration
+        if joining:
+            self.driver.switch_to(zoom_tab)
+            if self.run_step('join', self.fill_zoom_form):
+                self.cache_link()
+        return True
@@ -0,0 +1,157 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+# Event types
+RUN_STARTED = 'run_started'
+RUN_FINISHED = 'run_finished'
+STEP_STARTED = 'step_started'
+STEP_FINISHED = 'step_finished'
+CLASS_SELECTED = 'class_selected'
+LINK_CAPTURED = 'link_captured'
+ATTENDANCE_SUBMITTED = 'attendance_submitted'
+ERROR = 'error'
+LOG = 'log'        # payload: message, level
+STATUS = 'status'  # payload: message, level
+RESOURCES = 'resources'  # payload: peak_rss_mb, avg_cpu_percent, processes
+
+# Zoom links carry the meeting password and registrant token in their query string
+ZOOM_QUERY_RE = re.compile(r'((?:https?://(?:[\w-]+\.)*zoom\.us|zoommtg://)[^\s?"]*)\?[^\s"]*', re.IGNORECASE)
+# The event log rolls over to <file>.1 past this size
+MAX_EVENT_LOG_BYTES = 5 * 1024 * 1024
+
+
+class Event:
+    __slots__ = ('type', 'timestamp', 'run_id', 'payload')
+
+    def __init__(self, type, timestamp, run_id, payload):
+        self.type = type
+        self.timestamp = timestamp
+        self.run_id = run_id
+        self.payload = payload
+
+    def to_dict(self):
+        return {'type': self.type, 'timestamp': self.timestamp, 'run_id': self.run_id, **self.payload}
+
+
+class EventBus:
+    """Typed progress events from automation runs to any number of subscribers.
+
+    Subscribers are called synchronously on the emitting thread, so they must be
+    quick and thread-safe (the GUI subscriber just enqueues onto its LogBus).
+    """
+
+    def __init__(self):
+        # Replaced (never mutated) on subscribe, so emit can read it without a lock
+        self.subscribers = ()
+        self.lock = threading.Lock()
+
+    def subscribe(self, callback, types=None):
+        """Call callback(event) for every event, or only for the given types; returns unsubscribe"""
+        entry = (callback, frozenset(types) if types else None)
+        with self.lock:
+            self.subscribers = self.subscribers + (entry,)
+
+        def unsubscribe():
+            with self.lock:
+                self.subscribers = tuple(s for s in self.subscribers if s is not entry)
+        return unsubscribe
+
+    def emit(self, type, run_id=None, **payload):
+        subscribers = self.subscribers
+        if not subscribers:
+            return
+        event = Event(type, time.time(), run_id, payload)
+        for callback, types in subscribers:
+            if types is None or type in types:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+
+
+# ==================== Subscribers ====================
+
+class ConsolePrinter:
+    """CLI subscriber: prints log lines and step timings to stdout"""
+
+    def __init__(self, prefix_run_id=False):
+        self.prefix_run_id = prefix_run_id
+
+    def __call__(self, event):
+        stamp = datetime.fromtimestamp(event.timestamp).strftime('%H:%M:%S')
+        prefix = f"[{event.run_id}] " if self.prefix_run_id and event.run_id is not None else ""
+        if event.type == LOG:
+            print(f"[{stamp}] {prefix}{event.payload['message']}", flush=True)
+        elif event.type == STEP_FINISHED:
+            outcome = "ok" if event.payload.get('ok') else "failed"
+            print(f"[{stamp}] {prefix}⏱ {event.payload['step']} {outcome} in {event.payload['duration']:.1f}s",
+                  flush=True)
+
+
+def redact(text):
+    """text with the query strings of Zoom links (pwd, tk) removed"""
+    return ZOOM_QUERY_RE.sub(r'\1?<redacted>', text)
+
+
+class JsonLinesFileSubscriber:
+    """Log-file subscriber: appends every event as one JSON line.
+
+    Zoom link tokens are redacted, and the file rolls over to <path>.1 once it
+    passes max_bytes, so only two files are ever kept.
+    """
+
+    def __init__(self, path, max_bytes=MAX_EVENT_LOG_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # Opened on the first event and kept open; line buffering writes each event out whole
+        self.file = None
+        self.size = 0
+
+    def __call__(self, event):
+        line = redact(json.dumps(event.to_dict(), ensure_ascii=False, default=str)) + '\n'
+        with self.lock:
+            if self.file is not None and self.size >= self.max_bytes:
+                self.file.close()
+                os.replace(self.path, self.path + '.1')
+                self.file = None
+            if self.file is None:
+                self.file = open(self.path, 'a', encoding='utf-8', buffering=1)
+                self.size = self.file.tell()
+            self.file.write(line)
+            self.size += len(line.encode('utf-8'))
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+
+class StepTimingCollector:
+    """Metrics subscriber: count, failures, total and max duration per step"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.steps = {}
+
+    def __call__(self, event):
+        if event.type != STEP_FINISHED:
+            return
+        with self.lock:
+            stats = self.steps.setdefault(
+                event.payload['step'], {'count': 0, 'failed': 0, 'total': 0.0, 'max': 0.0}
+            )
+            stats['count'] += 1
+            stats['failed'] += 0 if event.payload.get('ok') else 1
+            stats['total'] += event.payload['duration']
+            stats['max'] = max(stats['max'], event.payload['duration'])
+
+    def averages(self):
+        """Get {step: average seconds}"""
+        with self.lock:
+            return {step: stats['total'] / stats['count'] for step, stats in self.steps.items()}
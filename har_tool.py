@@ -0,0 +1,214 @@
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote, quote_plus
+from config_manager import ConfigManager, get_shared_config
+from events import EventBus, ConsolePrinter, StepTimingCollector
+from engine import ZoomAutomation, AttendanceAutomation, CombinedAutomation
+from cli import find_user, run_in_foreground
+
+# Records a real portal session as a HAR, scrubs credentials from it and replays it offline.
+#   python har_tool.py record portal.har [--flow zoom|attendance|combined] [--user NAME] [--headless]
+#   python har_tool.py scrub portal.har [--user NAME] [--out scrubbed.har]
+#   python har_tool.py replay portal.har [--flow ...] [--runs N] [--visible]
+
+FLOWS = {
+    'zoom': ZoomAutomation,
+    'attendance': AttendanceAutomation,
+    'combined': CombinedAutomation,
+}
+
+# Scrubbing swaps each credential for a fixed stand-in; replay logs in with the same
+# stand-ins, so the scrubbed login and form POST bodies still match the recording.
+PLACEHOLDERS = {
+    'username': 'har-user',
+    'password': 'har-password',
+    'first_name': 'First',
+    'last_name': 'Last',
+    'email': 'student@example.com',
+    'nic_number': '000000000V',
+    'contact_number': '0700000000',
+}
+SECRET_HEADERS = ('cookie', 'set-cookie', 'authorization')
+# Shorter values would match unrelated text
+MIN_SECRET_LENGTH = 3
+
+
+def secret_replacements(config, user):
+    """(secret, stand-in) pairs for every form the user's credentials can take in a request"""
+    values = dict(user)
+    values['password'] = config.decrypt_password(user.get('password', ''))
+    pairs = {}
+    for field, placeholder in PLACEHOLDERS.items():
+        value = str(values.get(field) or '')
+        if len(value) < MIN_SECRET_LENGTH:
+            continue
+        for encode in (str, lambda text: quote(text, safe=''), quote_plus):
+            pairs[encode(value)] = encode(placeholder)
+    # Longest first, so a value is not partly replaced by a shorter one it contains
+    return sorted(pairs.items(), key=lambda pair: -len(pair[0]))
+
+
+def scrub_text(text, replacements):
+    for secret, placeholder in replacements:
+        text = text.replace(secret, placeholder)
+    return text
+
+
+def scrub_value(value, replacements):
+    """Scrub every string in a HAR fragment, including base64-encoded response bodies"""
+    if isinstance(value, str):
+        return scrub_text(value, replacements)
+    if isinstance(value, list):
+        return [scrub_value(item, replacements) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if value.get('encoding') == 'base64' and isinstance(value.get('text'), str):
+        try:
+            decoded = base64.b64decode(value['text']).decode('utf-8')
+            value = dict(value, text=base64.b64encode(scrub_text(decoded, replacements).encode()).decode())
+        except (ValueError, UnicodeDecodeError):
+            pass  # Binary body (images, fonts) - nothing readable to scrub
+    return {key: scrub_value(item, replacements) for key, item in value.items()}
+
+
+def scrub_har(har, replacements):
+    for entry in har['log']['entries']:
+        for message in (entry['request'], entry['response']):
+            message['cookies'] = []
+            for header in message.get('headers', []):
+                if header['name'].lower() in SECRET_HEADERS:
+                    header['value'] = 'scrubbed'
+    return scrub_value(har, replacements)
+
+
+def first_entry(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)['log']['entries']
+    if not entries:
+        raise SystemExit(f"❌ {path} has no requests")
+    return entries[0]
+
+
+def first_url(path):
+    return first_entry(path)['request']['url']
+
+
+def recorded_at(path):
+    """When the recording started, as an aware datetime"""
+    return datetime.fromisoformat(first_entry(path)['startedDateTime'].replace('Z', '+00:00'))
+
+
+def record(args):
+    config = get_shared_config()
+    user = find_user(config, args.user)
+    events = EventBus()
+    events.subscribe(ConsolePrinter())
+    automation = FLOWS[args.flow](user, events, config=config, backend='playwright', headless=args.headless,
+                                  har=('record', args.har))
+
+    print("ℹ️ Recording - press Ctrl+C once the flow is done to close the browser and save the HAR", flush=True)
+    run_in_foreground(automation)
+    if not os.path.exists(args.har):
+        raise SystemExit(f"❌ No HAR was written to {args.har}")
+
+    if not args.no_scrub:
+        scrub(argparse.Namespace(har=args.har, user=user.get('id'), out=None))
+    print(f"💾 Recorded {args.flow} flow to {args.har}", flush=True)
+
+
+def scrub(args):
+    config = get_shared_config()
+    user = find_user(config, args.user)
+    with open(args.har, 'r', encoding='utf-8') as f:
+        har = json.load(f)
+    har = scrub_har(har, secret_replacements(config, user))
+
+    out = args.out or args.har
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(har, f, ensure_ascii=False)
+    print(f"🧽 Scrubbed credentials of {user.get('username', user.get('id'))} into {out}", flush=True)
+
+
+def replay(args):
+    site_url = args.site_url or first_url(args.har)
+    started_at = recorded_at(args.har)
+    timings = StepTimingCollector()
+    durations = []
+    outcomes = []
+
+    for number in range(1, args.runs + 1):
+        # A fresh throwaway config per run: no cache hits or learned selector order carry over
+        with tempfile.TemporaryDirectory() as folder:
+            config = ConfigManager(os.path.join(folder, 'credentials.json'))
+            config.set_setting('attendance_login_url', site_url)
+            # Class cards are judged against today's date: start each run's clock where the recording started
+            config.set_setting('clock_offset_seconds',
+                               (started_at - datetime.now(timezone.utc)).total_seconds())
+            user = dict(PLACEHOLDERS, id='har-replay', site_url=site_url,
+                        password=config.encrypt_password(PLACEHOLDERS['password']))
+
+            events = EventBus()
+            events.subscribe(timings)
+            if args.verbose:
+                events.subscribe(ConsolePrinter())
+            automation = FLOWS[args.flow](user, events, config=config, backend='playwright',
+                                          headless=not args.visible, har=('replay', args.har))
+            started = time.perf_counter()
+            outcome = run_in_foreground(automation)
+            durations.append(time.perf_counter() - started)
+            outcomes.append(outcome)
+            print(f"▶️ Run {number}/{args.runs}: {outcome} in {durations[-1]:.2f}s", flush=True)
+            if outcome == 'cancelled':
+                break
+
+    if not durations:
+        raise SystemExit("❌ No runs")
+    print(f"\n{'Step':<16} {'Runs':>5} {'Failed':>7} {'Avg':>8} {'Max':>8}")
+    for step, stats in timings.steps.items():
+        print(f"{step:<16} {stats['count']:>5} {stats['failed']:>7} "
+              f"{stats['total'] / stats['count']:>7.2f}s {stats['max']:>7.2f}s")
+    print(f"\n📊 {len(durations)} run(s), avg {sum(durations) / len(durations):.2f}s, "
+          f"{outcomes.count('completed')} completed", flush=True)
+    sys.exit(0 if outcomes and all(outcome == 'completed' for outcome in outcomes) else 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record, scrub and replay portal sessions as HAR files")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help="run a flow against the live portal and save it as a HAR")
+    record_parser.add_argument('har', help="HAR file to write")
+    record_parser.add_argument('--flow', choices=FLOWS, default='zoom')
+    record_parser.add_argument('--user', help="saved user id, username or search text")
+    record_parser.add_argument('--headless', action='store_true', help="run without a visible browser")
+    record_parser.add_argument('--no-scrub', action='store_true', help="keep credentials in the HAR")
+    record_parser.set_defaults(func=record)
+
+    scrub_parser = commands.add_parser('scrub', help="replace a user's credentials in a HAR with stand-ins")
+    scrub_parser.add_argument('har', help="HAR file to scrub")
+    scrub_parser.add_argument('--user', help="saved user whose credentials are in the HAR")
+    scrub_parser.add_argument('--out', help="write here instead of overwriting the input")
+    scrub_parser.set_defaults(func=scrub)
+
+    replay_parser = commands.add_parser('replay', help="run a flow offline against a scrubbed HAR")
+    replay_parser.add_argument('har', help="HAR file to serve")
+    replay_parser.add_argument('--flow', choices=FLOWS, default='zoom')
+    replay_parser.add_argument('--runs', type=int, default=5, help="number of runs to time")
+    replay_parser.add_argument('--site-url', help="login page (default: first request in the HAR)")
+    replay_parser.add_argument('--visible', action='store_true', help="show the browser")
+    replay_parser.add_argument('--verbose', action='store_true', help="print each run's log lines")
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
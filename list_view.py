@@ -0,0 +1,164 @@
+import tkinter as tk
+from collections import namedtuple
+
+ListDiff = namedtuple('ListDiff', ['added', 'removed', 'changed', 'reordered'])
+
+
+class ListModel:
+    """Keyed list of rows that reports what changed since the last update"""
+
+    def __init__(self, key, signature):
+        self.key = key
+        self.signature = signature
+        self.items = []
+        self.keys = []
+        self.signatures = {}
+
+    def update(self, items):
+        """Replace the rows and return a ListDiff against the previous rows"""
+        keys = [self.key(item) for item in items]
+        signatures = {k: self.signature(item) for k, item in zip(keys, items)}
+
+        old = self.signatures
+        added = [k for k in keys if k not in old]
+        removed = [k for k in self.keys if k not in signatures]
+        changed = [k for k in keys if k in old and old[k] != signatures[k]]
+        reordered = not added and not removed and keys != self.keys
+
+        self.items = list(items)
+        self.keys = keys
+        self.signatures = signatures
+        return ListDiff(added, removed, changed, reordered)
+
+
+class VirtualListView(tk.Frame):
+    """Scrollable list that only keeps widgets for the rows currently in view.
+
+    create_row(parent) builds an empty row widget once; update_row(row, item)
+    fills it. Row widgets are recycled as the list scrolls, and a row is only
+    re-filled when the item shown in its slot actually changed.
+    """
+
+    def __init__(self, parent, row_height, create_row, update_row, key, signature,
+                 bg, empty_text="", empty_fg=None, empty_font=None):
+        super().__init__(parent, bg=bg)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.update_row = update_row
+        self.model = ListModel(key, signature)
+        self.rows = []  # [(row widget, canvas window id)]
+        self.row_state = {}  # window id -> (key, signature) currently shown
+
+        self.canvas = tk.Canvas(
+            self, bg=bg, highlightthickness=0, bd=0, yscrollincrement=row_height
+        )
+        self.scrollbar = tk.Scrollbar(self, orient='vertical', command=self.on_scroll)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side='left', fill='both', expand=True)
+
+        self.empty_label = tk.Label(
+            self, text=empty_text, font=empty_font or ('Helvetica', 10),
+            bg=bg, fg=empty_fg, justify='center'
+        )
+
+        self.canvas.bind('<Configure>', lambda e: self.render())
+        self.bind('<Enter>', self.bind_mousewheel)
+        self.bind('<Leave>', self.unbind_mousewheel)
+
+    # ==================== Data ====================
+
+    def set_items(self, items):
+        """Show items, touching only rows whose content changed"""
+        diff = self.model.update(items)
+        if not (diff.added or diff.removed or diff.changed or diff.reordered) and self.rows:
+            return diff
+
+        if self.model.items:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(relx=0.5, rely=0.4, anchor='center')
+
+        self.render()
+        return diff
+
+    def set_colors(self, bg, empty_fg):
+        """Recolor the list chrome and re-fill visible rows so row-level colors follow"""
+        self.config(bg=bg)
+        self.canvas.config(bg=bg)
+        self.empty_label.config(bg=bg, fg=empty_fg)
+        self.row_state.clear()
+        self.render()
+
+    # ==================== Rendering ====================
+
+    def render(self):
+        total = len(self.model.items)
+        height = max(self.canvas.winfo_height(), 1)
+        width = max(self.canvas.winfo_width(), 1)
+        self.canvas.configure(scrollregion=(0, 0, width, total * self.row_height))
+
+        if total * self.row_height > height:
+            self.scrollbar.pack(side='right', fill='y')
+        else:
+            self.scrollbar.pack_forget()
+            self.canvas.yview_moveto(0)
+
+        first = int(self.canvas.canvasy(0) // self.row_height)
+        visible = height // self.row_height + 2
+        indices = range(max(first, 0), min(first + visible, total))
+
+        # Grow the widget pool only up to the number of visible rows
+        while len(self.rows) < len(indices):
+            row = self.create_row(self.canvas)
+            window = self.canvas.create_window(0, 0, window=row, anchor='nw')
+            self.rows.append((row, window))
+
+        for slot, (row, window) in enumerate(self.rows):
+            if slot >= len(indices):
+                self.canvas.itemconfigure(window, state='hidden')
+                continue
+
+            index = indices[slot]
+            item = self.model.items[index]
+            key = self.model.keys[index]
+            state = (key, self.model.signatures[key])
+            if self.row_state.get(window) != state:
+                self.update_row(row, item)
+                self.row_state[window] = state
+
+            self.canvas.coords(window, 0, index * self.row_height)
+            self.canvas.itemconfigure(
+                window, state='normal', width=width, height=self.row_height - 6
+            )
+
+    def on_scroll(self, *args):
+        self.canvas.yview(*args)
+        self.render()
+
+    # ==================== Mouse wheel ====================
+
+    def bind_mousewheel(self, event=None):
+        self.canvas.bind_all('<MouseWheel>', self.on_mousewheel)
+        self.canvas.bind_all('<Button-4>', self.on_mousewheel)
+        self.canvas.bind_all('<Button-5>', self.on_mousewheel)
+
+    def unbind_mousewheel(self, event=None):
+        # Leave also fires when the pointer moves onto one of our own rows
+        x, y = self.winfo_pointerxy()
+        widget = self.winfo_containing(x, y)
+        if widget is not None and str(widget).startswith(str(self)):
+            return
+        self.canvas.unbind_all('<MouseWheel>')
+        self.canvas.unbind_all('<Button-4>')
+        self.canvas.unbind_all('<Button-5>')
+
+    def on_mousewheel(self, event):
+        if not self.winfo_exists():
+            return
+        if len(self.model.items) * self.row_height <= self.canvas.winfo_height():
+            return
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.canvas.yview_scroll(-1, 'units')
+        else:
+            self.canvas.yview_scroll(1, 'units')
+        self.render()
@@ -0,0 +1,51 @@
+import queue
+from collections import deque, namedtuple
+from datetime import datetime
+
+LogRecord = namedtuple('LogRecord', ['kind', 'timestamp', 'text', 'level'])
+
+
+class LogBus:
+    """Thread-safe hand-off of log and status records to the Tk main thread.
+
+    Automation threads only enqueue records; the GUI drains them in batches
+    from a root.after tick, so no Tk widget is touched off the main thread.
+    """
+
+    def __init__(self, max_lines=2000):
+        self.records = queue.SimpleQueue()
+        self.lines = deque(maxlen=max_lines)
+        self.max_lines = max_lines
+
+    def post_log(self, message, level='info'):
+        """Queue a console line (safe from any thread)"""
+        self.records.put(LogRecord('log', datetime.now(), message, level))
+
+    def post_status(self, status, level='info'):
+        """Queue a status label update (safe from any thread)"""
+        self.records.put(LogRecord('status', datetime.now(), status, level))
+
+    def clear(self):
+        """Forget buffered console lines"""
+        self.lines.clear()
+
+    def drain(self, max_records=500):
+        """Take up to max_records queued records.
+
+        Returns (lines, status) where lines is a list of (text, level) to append
+        and status is the latest (text, level) status update or None.
+        """
+        lines = []
+        status = None
+        for _ in range(max_records):
+            try:
+                record = self.records.get_nowait()
+            except queue.Empty:
+                break
+            if record.kind == 'status':
+                status = (record.text, record.level)
+            else:
+                line = (f"[{record.timestamp.strftime('%H:%M:%S')}] {record.text}\n", record.level)
+                self.lines.append(line)
+                lines.append(line)
+        return lines, status
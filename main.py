@@ -1,10 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import time
 from datetime import datetime
 import uuid
-from config_manager import ConfigManager
-from automation import ZoomAutomation
+from config_manager import get_shared_config
+from log_bus import LogBus
+from list_view import VirtualListView
+from style_registry import StyleRegistry
+from run_manager import RunManager
+from backends import register_backend, load_backend, DRIVER_BACKENDS
+from events import EventBus, JsonLinesFileSubscriber, StepTimingCollector, LOG, STATUS
+from metrics import start_from_settings
+
+# Browser stacks are imported on first START, keeping the launcher window fast
+register_backend('zoom', 'automation', 'ZoomAutomation')
+register_backend('combined', 'automation', 'CombinedAutomation')
+
+DEFAULT_BROWSER_BACKEND = 'playwright'
+LOG_POLL_INTERVAL_MS = 100
+USER_ROW_HEIGHT = 62
+CACHED_ROW_HEIGHT = 58
+RUN_ROW_HEIGHT = 44
+DASHBOARD_REFRESH_MS = 500
 
 class ZoomAutoJoinGUI:
     def __init__(self, root):
@@ -13,10 +31,27 @@ class ZoomAutoJoinGUI:
         self.root.geometry("1000x700")
         self.root.minsize(900, 650)
         
-        self.config = ConfigManager()
+        self.config = get_shared_config()
         self.automation = None
         self.selected_user_id = None
         self.temp_user = None
+        self.log_bus = LogBus()
+        self.last_theme_switch = None
+        self.checked_user_ids = set()
+        self.events = EventBus()
+        self.events.subscribe(self.on_automation_event, types=(LOG, STATUS))
+        self.step_timings = StepTimingCollector()
+        self.events.subscribe(self.step_timings)
+        # Off unless the 'event_log_file' setting names a file (e.g. automation_events.jsonl)
+        event_log_file = self.config.get_setting('event_log_file')
+        if event_log_file:
+            self.events.subscribe(JsonLinesFileSubscriber(event_log_file))
+        try:
+            self.metrics_server = start_from_settings(self.config, self.events)
+        except OSError as e:
+            self.metrics_server = None
+            self.log_bus.post_log(f"⚠️ Metrics endpoint not started: {e}", 'warning')
+        self.run_manager = RunManager(self.config, self.make_automation, self.events)
         self.is_dark_mode = self.config.get_theme() == "dark"
         
         # Colors
@@ -45,25 +80,38 @@ class ZoomAutoJoinGUI:
             }
         }
         
+        self.styles = StyleRegistry(self.colors['dark' if self.is_dark_mode else 'light'])
         self.apply_theme()
         self.show_start_screen()
+        self.process_log_bus()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def apply_theme(self):
         theme = 'dark' if self.is_dark_mode else 'light'
         self.current_colors = self.colors[theme]
         self.root.configure(bg=self.current_colors['bg'])
+        return self.styles.set_palette(self.current_colors)
         
     def toggle_theme(self):
+        started = time.perf_counter()
+        created_before = self.styles.created
+        
         self.is_dark_mode = not self.is_dark_mode
         self.config.set_theme('dark' if self.is_dark_mode else 'light')
-        self.apply_theme()
-        # Refresh current screen
-        if hasattr(self, 'automation_running') and self.automation_running:
-            self.show_automation_screen()
-        else:
-            self.show_start_screen()
+        
+        # Recolor the current screen in place instead of rebuilding it
+        recolored, redraw_seconds = self.apply_theme()
+        self.root.update_idletasks()
+        
+        self.last_theme_switch = {
+            'widgets_recolored': recolored,
+            'widgets_created': self.styles.created - created_before,
+            'redraw_seconds': redraw_seconds,
+            'total_seconds': time.perf_counter() - started
+        }
     
     def clear_window(self):
+        self.styles.clear()
         for widget in self.root.winfo_children():
             widget.destroy()
     
@@ -72,7 +120,8 @@ class ZoomAutoJoinGUI:
         self.automation_running = False
         
         # Top bar
-        top_bar = tk.Frame(self.root, bg=self.current_colors['secondary_bg'], height=60)
+        top_bar = tk.Frame(self.root, height=60)
+        self.styles.register(top_bar, bg='secondary_bg')
         top_bar.pack(fill='x', padx=0, pady=0)
         top_bar.pack_propagate(False)
         
@@ -80,9 +129,8 @@ class ZoomAutoJoinGUI:
             top_bar, 
             text="🎓 Zoom Auto-Join System", 
             font=('Helvetica', 18, 'bold'),
-            bg=self.current_colors['secondary_bg'],
-            fg=self.current_colors['accent']
         )
+        self.styles.register(title_label, bg='secondary_bg', fg='accent')
         title_label.pack(side='left', padx=20, pady=15)
         
         # Current time
@@ -90,9 +138,8 @@ class ZoomAutoJoinGUI:
             top_bar,
             text=datetime.now().strftime("%I:%M %p"),
             font=('Helvetica', 12),
-            bg=self.current_colors['secondary_bg'],
-            fg=self.current_colors['text']
         )
+        self.styles.register(self.time_label, bg='secondary_bg', fg='text')
         self.time_label.pack(side='right', padx=20)
         self.update_time()
         
@@ -101,42 +148,72 @@ class ZoomAutoJoinGUI:
             top_bar,
             text="🌙" if not self.is_dark_mode else "☀️",
             font=('Helvetica', 16),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
             bd=0,
             padx=15,
             pady=5,
             cursor='hand2',
             command=self.toggle_theme
         )
+        self.styles.register(theme_btn, bg='card_bg', fg='text')
+        self.styles.register_callback(
+            lambda colors: theme_btn.config(text="🌙" if not self.is_dark_mode else "☀️")
+        )
         theme_btn.pack(side='right', padx=10)
         
         # Main content
-        content_frame = tk.Frame(self.root, bg=self.current_colors['bg'])
+        content_frame = tk.Frame(self.root)
+        self.styles.register(content_frame, bg='bg')
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Left panel - Users
-        left_panel = tk.Frame(content_frame, bg=self.current_colors['card_bg'], relief='flat', bd=2)
+        left_panel = tk.Frame(content_frame, relief='flat', bd=2)
+        self.styles.register(left_panel, bg='card_bg')
         left_panel.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         users_header = tk.Label(
             left_panel,
             text="👥 Saved Users",
             font=('Helvetica', 14, 'bold'),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
             anchor='w'
         )
+        self.styles.register(users_header, bg='card_bg', fg='text')
         users_header.pack(fill='x', padx=15, pady=(15, 10))
         
-        # User list
-        self.user_list_frame = tk.Frame(left_panel, bg=self.current_colors['card_bg'])
-        self.user_list_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
+        # Search box
+        self.user_search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            left_panel,
+            textvariable=self.user_search_var,
+            font=('Helvetica', 10),
+            relief='flat'
+        )
+        self.styles.register(search_entry, bg='secondary_bg', fg='text', insertbackground='text')
+        search_entry.pack(fill='x', padx=15, pady=(0, 10), ipady=4)
+        self.user_search_var.trace_add('write', lambda *args: self.refresh_user_list())
+        
+        # User list (only visible rows get widgets)
+        self.user_var = tk.StringVar(value=self.selected_user_id or '')
+        self.user_list = VirtualListView(
+            left_panel,
+            row_height=USER_ROW_HEIGHT,
+            create_row=self.create_user_row,
+            update_row=self.update_user_row,
+            key=lambda user: user['id'],
+            signature=lambda user: (user['first_name'], user['last_name'], user['email']),
+            bg=self.current_colors['card_bg'],
+            empty_fg=self.current_colors['text_secondary'],
+            empty_font=('Helvetica', 11)
+        )
+        self.styles.register_callback(
+            lambda colors: self.user_list.set_colors(colors['card_bg'], colors['text_secondary'])
+        )
+        self.user_list.pack(fill='both', expand=True, padx=15, pady=(0, 15))
         
         self.refresh_user_list()
         
         # Right panel - Actions & Cached Classes
-        right_panel = tk.Frame(content_frame, bg=self.current_colors['card_bg'], relief='flat', bd=2)
+        right_panel = tk.Frame(content_frame, relief='flat', bd=2)
+        self.styles.register(right_panel, bg='card_bg')
         right_panel.pack(side='right', fill='both', expand=True, padx=(10, 0))
         
         # Selected user info
@@ -144,10 +221,9 @@ class ZoomAutoJoinGUI:
             right_panel,
             text="⚡ Quick Actions",
             font=('Helvetica', 14, 'bold'),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
             anchor='w'
         )
+        self.styles.register(info_header, bg='card_bg', fg='text')
         info_header.pack(fill='x', padx=15, pady=(15, 10))
         
         # Start button
@@ -155,7 +231,6 @@ class ZoomAutoJoinGUI:
             right_panel,
             text="▶ START ZOOM CLASS JOIN",
             font=('Helvetica', 14, 'bold'),
-            bg=self.current_colors['success'],
             fg='white',
             bd=0,
             padx=20,
@@ -163,14 +238,44 @@ class ZoomAutoJoinGUI:
             cursor='hand2',
             command=self.start_automation
         )
+        self.styles.register(self.start_btn, bg='success')
         self.start_btn.pack(fill='x', padx=15, pady=10)
         
+        # Join + attendance in one browser session
+        combined_btn = tk.Button(
+            right_panel,
+            text="🎓📋 JOIN CLASS + MARK ATTENDANCE",
+            font=('Helvetica', 12, 'bold'),
+            fg='white',
+            bd=0,
+            padx=20,
+            pady=12,
+            cursor='hand2',
+            command=lambda: self.start_automation('combined')
+        )
+        self.styles.register(combined_btn, bg='accent')
+        combined_btn.pack(fill='x', padx=15, pady=5)
+        
+        # Dashboard button (runs every checked user)
+        self.dashboard_btn = tk.Button(
+            right_panel,
+            font=('Helvetica', 12, 'bold'),
+            fg='white',
+            bd=0,
+            padx=20,
+            pady=12,
+            cursor='hand2',
+            command=lambda: self.start_dashboard_runs('zoom')
+        )
+        self.styles.register(self.dashboard_btn, bg='success')
+        self.dashboard_btn.pack(fill='x', padx=15, pady=5)
+        self.update_dashboard_buttons()
+        
         # Add user button
         add_btn = tk.Button(
             right_panel,
             text="➕ Add New User",
             font=('Helvetica', 12),
-            bg=self.current_colors['accent'],
             fg='white',
             bd=0,
             padx=20,
@@ -178,6 +283,7 @@ class ZoomAutoJoinGUI:
             cursor='hand2',
             command=self.show_add_user_dialog
         )
+        self.styles.register(add_btn, bg='accent')
         add_btn.pack(fill='x', padx=15, pady=5)
         
         # Edit button
@@ -185,7 +291,6 @@ class ZoomAutoJoinGUI:
             right_panel,
             text="✏️ Edit Selected",
             font=('Helvetica', 12),
-            bg=self.current_colors['warning'],
             fg='white',
             bd=0,
             padx=20,
@@ -194,6 +299,7 @@ class ZoomAutoJoinGUI:
             command=self.edit_selected_user,
             state='disabled'
         )
+        self.styles.register(self.edit_btn, bg='warning')
         self.edit_btn.pack(fill='x', padx=15, pady=5)
         
         # Delete button
@@ -201,7 +307,6 @@ class ZoomAutoJoinGUI:
             right_panel,
             text="🗑️ Delete Selected",
             font=('Helvetica', 12),
-            bg=self.current_colors['error'],
             fg='white',
             bd=0,
             padx=20,
@@ -210,6 +315,7 @@ class ZoomAutoJoinGUI:
             command=self.delete_selected_user,
             state='disabled'
         )
+        self.styles.register(self.delete_btn, bg='error')
         self.delete_btn.pack(fill='x', padx=15, pady=5)
         
         # Cached classes section
@@ -217,80 +323,119 @@ class ZoomAutoJoinGUI:
             right_panel,
             text="🕐 Cached Classes (Today)",
             font=('Helvetica', 12, 'bold'),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
             anchor='w'
         )
+        self.styles.register(cache_header, bg='card_bg', fg='text')
         cache_header.pack(fill='x', padx=15, pady=(20, 10))
         
-        self.cached_frame = tk.Frame(right_panel, bg=self.current_colors['card_bg'])
-        self.cached_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
+        self.cached_list = VirtualListView(
+            right_panel,
+            row_height=CACHED_ROW_HEIGHT,
+            create_row=self.create_cached_row,
+            update_row=self.update_cached_row,
+            key=lambda cls: (cls['user_id'], cls['date'], cls['class_name']),
+            signature=lambda cls: (cls['class_time'], cls['zoom_link']),
+            bg=self.current_colors['card_bg'],
+            empty_text="No cached classes available",
+            empty_fg=self.current_colors['text_secondary']
+        )
+        self.styles.register_callback(
+            lambda colors: self.cached_list.set_colors(colors['card_bg'], colors['text_secondary'])
+        )
+        self.cached_list.pack(fill='both', expand=True, padx=15, pady=(0, 15))
         
         self.refresh_cached_classes()
+        
+        # Restore the selection that survived a screen rebuild
+        if self.selected_user_id and self.config.get_user(self.selected_user_id):
+            self.on_user_selected()
     
     def refresh_user_list(self):
-        for widget in self.user_list_frame.winfo_children():
-            widget.destroy()
+        query = self.user_search_var.get()
+        users = self.config.search_users(query)
         
-        users = self.config.get_all_users()
+        if query.strip():
+            empty_text = "No users match your search."
+        else:
+            empty_text = "No saved users.\nClick 'Add New User' to get started!"
+        self.user_list.empty_label.config(text=empty_text)
         
-        if not users:
-            no_user_label = tk.Label(
-                self.user_list_frame,
-                text="No saved users.\nClick 'Add New User' to get started!",
-                font=('Helvetica', 11),
-                bg=self.current_colors['card_bg'],
-                fg=self.current_colors['text_secondary'],
-                justify='center'
-            )
-            no_user_label.pack(expand=True)
-            return
+        self.user_list.set_items(users)
+    
+    def create_user_row(self, parent):
+        user_card = tk.Frame(
+            parent,
+            relief='flat',
+            bd=1
+        )
+        self.styles.register(user_card, bg='secondary_bg')
         
-        self.user_var = tk.StringVar()
+        user_card.radio = tk.Radiobutton(
+            user_card,
+            variable=self.user_var,
+            command=self.on_user_selected
+        )
+        self.styles.register(
+            user_card.radio,
+            bg='secondary_bg',
+            fg='text',
+            selectcolor='card_bg',
+            activebackground='secondary_bg'
+        )
+        user_card.radio.pack(side='left', padx=10)
         
-        for user in users:
-            user_card = tk.Frame(
-                self.user_list_frame,
-                bg=self.current_colors['secondary_bg'],
-                relief='flat',
-                bd=1
-            )
-            user_card.pack(fill='x', pady=5)
-            
-            radio = tk.Radiobutton(
-                user_card,
-                variable=self.user_var,
-                value=user['id'],
-                bg=self.current_colors['secondary_bg'],
-                fg=self.current_colors['text'],
-                selectcolor=self.current_colors['card_bg'],
-                activebackground=self.current_colors['secondary_bg'],
-                command=self.on_user_selected
-            )
-            radio.pack(side='left', padx=10)
-            
-            info_frame = tk.Frame(user_card, bg=self.current_colors['secondary_bg'])
-            info_frame.pack(side='left', fill='both', expand=True, padx=5, pady=8)
-            
-            name_label = tk.Label(
-                info_frame,
-                text=f"{user['first_name']} {user['last_name']}",
-                font=('Helvetica', 11, 'bold'),
-                bg=self.current_colors['secondary_bg'],
-                fg=self.current_colors['text'],
-                anchor='w'
-            )
-            name_label.pack(anchor='w')
-            
-            email_label = tk.Label(
-                info_frame,
-                text=f"📧 {user['email']}",
-                font=('Helvetica', 9),
-                bg=self.current_colors['secondary_bg'],
-                fg=self.current_colors['text_secondary'],
-                anchor='w'
-            )
-            email_label.pack(anchor='w')
+        info_frame = tk.Frame(user_card)
+        self.styles.register(info_frame, bg='secondary_bg')
+        info_frame.pack(side='left', fill='both', expand=True, padx=5, pady=8)
+        
+        user_card.name_label = tk.Label(
+            info_frame,
+            font=('Helvetica', 11, 'bold'),
+            anchor='w'
+        )
+        self.styles.register(user_card.name_label, bg='secondary_bg', fg='text')
+        user_card.name_label.pack(anchor='w')
+        
+        user_card.email_label = tk.Label(
+            info_frame,
+            font=('Helvetica', 9),
+            anchor='w'
+        )
+        self.styles.register(user_card.email_label, bg='secondary_bg', fg='text_secondary')
+        user_card.email_label.pack(anchor='w')
+        
+        # Checked users are run together from the dashboard
+        user_card.check_var = tk.BooleanVar()
+        user_card.check = tk.Checkbutton(
+            user_card,
+            text="Batch",
+            variable=user_card.check_var,
+            font=('Helvetica', 9),
+            command=lambda: self.on_user_checked(user_card)
+        )
+        self.styles.register(
+            user_card.check,
+            bg='secondary_bg',
+            fg='text_secondary',
+            selectcolor='card_bg',
+            activebackground='secondary_bg'
+        )
+        user_card.check.pack(side='right', padx=10)
+        return user_card
+    
+    def update_user_row(self, user_card, user):
+        user_card.user_id = user['id']
+        user_card.check_var.set(user['id'] in self.checked_user_ids)
+        user_card.radio.config(value=user['id'])
+        user_card.name_label.config(text=f"{user['first_name']} {user['last_name']}")
+        user_card.email_label.config(text=f"📧 {user['email']}")
+    
+    def on_user_checked(self, user_card):
+        if user_card.check_var.get():
+            self.checked_user_ids.add(user_card.user_id)
+        else:
+            self.checked_user_ids.discard(user_card.user_id)
+        self.update_dashboard_buttons()
     
     def on_user_selected(self):
         self.selected_user_id = self.user_var.get()
@@ -299,60 +444,56 @@ class ZoomAutoJoinGUI:
         self.start_btn.config(state='normal')
     
     def refresh_cached_classes(self):
-        for widget in self.cached_frame.winfo_children():
-            widget.destroy()
-        
-        cached = self.config.get_valid_cached_classes()
+        self.cached_list.set_items(self.config.get_valid_cached_classes())
+    
+    def create_cached_row(self, parent):
+        cache_card = tk.Frame(
+            parent,
+            relief='flat',
+            bd=1
+        )
+        self.styles.register(cache_card, bg='secondary_bg')
         
-        if not cached:
-            no_cache_label = tk.Label(
-                self.cached_frame,
-                text="No cached classes available",
-                font=('Helvetica', 10),
-                bg=self.current_colors['card_bg'],
-                fg=self.current_colors['text_secondary']
-            )
-            no_cache_label.pack(pady=10)
-            return
+        cache_card.class_info = tk.Label(
+            cache_card,
+            font=('Helvetica', 9),
+            anchor='w',
+            justify='left'
+        )
+        self.styles.register(cache_card.class_info, bg='secondary_bg', fg='text')
+        cache_card.class_info.pack(side='left', padx=10, pady=8)
         
-        for cls in cached:
-            cache_card = tk.Frame(
-                self.cached_frame,
-                bg=self.current_colors['secondary_bg'],
-                relief='flat',
-                bd=1
-            )
-            cache_card.pack(fill='x', pady=5)
-            
-            class_info = tk.Label(
-                cache_card,
-                text=f"{cls['class_name']}\n⏰ {cls['class_time']}",
-                font=('Helvetica', 9),
-                bg=self.current_colors['secondary_bg'],
-                fg=self.current_colors['text'],
-                anchor='w',
-                justify='left'
-            )
-            class_info.pack(side='left', padx=10, pady=8)
-            
-            rejoin_btn = tk.Button(
-                cache_card,
-                text="↻ Rejoin",
-                font=('Helvetica', 9, 'bold'),
-                bg=self.current_colors['accent'],
-                fg='white',
-                bd=0,
-                padx=15,
-                pady=5,
-                cursor='hand2',
-                command=lambda link=cls['zoom_link']: self.rejoin_class(link)
-            )
-            rejoin_btn.pack(side='right', padx=10)
+        cache_card.rejoin_btn = tk.Button(
+            cache_card,
+            text="↻ Rejoin",
+            font=('Helvetica', 9, 'bold'),
+            fg='white',
+            bd=0,
+            padx=15,
+            pady=5,
+            cursor='hand2'
+        )
+        self.styles.register(cache_card.rejoin_btn, bg='accent')
+        cache_card.rejoin_btn.pack(side='right', padx=10)
+        return cache_card
     
-    def rejoin_class(self, link):
-        import webbrowser
-        webbrowser.open(link)
-        self.log_to_console(f"✓ Opened cached class link in browser", 'success')
+    def update_cached_row(self, cache_card, cls):
+        cache_card.class_info.config(text=f"{cls['class_name']}\n⏰ {cls['class_time']}")
+        cache_card.rejoin_btn.config(command=lambda cached=cls: self.rejoin_class(cached))
+    
+    def rejoin_class(self, cached):
+        from zoom_links import launch_meeting
+        user = self.config.get_user(cached.get('user_id')) or {}
+        display_name = ' '.join(filter(None, (user.get('first_name'), user.get('last_name')))) or None
+        
+        def launch():
+            # Handing the link to the OS can take seconds; keep it off the Tk thread
+            if launch_meeting(cached['zoom_link'], cached.get('meeting'), display_name) == 'app':
+                self.log_to_console(f"✓ Opened {cached['class_name']} in the Zoom app", 'success')
+            else:
+                self.log_to_console(f"✓ Opened cached class link in browser", 'success')
+        
+        threading.Thread(target=launch, daemon=True).start()
     
     def update_time(self):
         if hasattr(self, 'time_label') and self.time_label.winfo_exists():
@@ -363,7 +504,7 @@ class ZoomAutoJoinGUI:
     def show_add_user_dialog(self, edit_user=None):
         dialog = tk.Toplevel(self.root)
         dialog.title("Add New User" if not edit_user else "Edit User")
-        dialog.geometry("500x650")
+        dialog.geometry("500x720")
         dialog.configure(bg=self.current_colors['bg'])
         dialog.transient(self.root)
         dialog.grab_set()
@@ -393,6 +534,14 @@ class ZoomAutoJoinGUI:
         fields['site_url'] = ttk.Combobox(form_frame, values=site_urls, font=('Helvetica', 10))
         fields['site_url'].pack(fill='x', pady=(0, 10))
         
+        # Browser backend the shared engine drives for this user
+        tk.Label(form_frame, text="Browser Backend:", font=('Helvetica', 10, 'bold'),
+                bg=self.current_colors['bg'], fg=self.current_colors['text']).pack(anchor='w', pady=(10, 2))
+        
+        fields['backend'] = ttk.Combobox(form_frame, values=DRIVER_BACKENDS, state='readonly', font=('Helvetica', 10))
+        fields['backend'].set(DEFAULT_BROWSER_BACKEND)
+        fields['backend'].pack(fill='x', pady=(0, 10))
+        
         # Other fields
         field_labels = [
             ('username', 'Username'),
@@ -431,6 +580,7 @@ class ZoomAutoJoinGUI:
         # Pre-fill if editing
         if edit_user:
             fields['site_url'].set(edit_user['site_url'])
+            fields['backend'].set(edit_user.get('backend', DEFAULT_BROWSER_BACKEND))
             fields['username'].insert(0, edit_user['username'])
             fields['password'].insert(0, self.config.decrypt_password(edit_user['password']))
             fields['first_name'].insert(0, edit_user['first_name'])
@@ -466,7 +616,7 @@ class ZoomAutoJoinGUI:
                 messagebox.showinfo("Success", "User loaded for one-time use!")
             
             dialog.destroy()
-            self.show_start_screen()
+            self.refresh_user_list()
         
         save_btn = tk.Button(
             btn_frame,
@@ -510,9 +660,15 @@ class ZoomAutoJoinGUI:
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this user?"):
             self.config.delete_user(self.selected_user_id)
             messagebox.showinfo("Success", "User deleted successfully!")
-            self.show_start_screen()
+            
+            self.selected_user_id = None
+            self.user_var.set('')
+            self.edit_btn.config(state='disabled')
+            self.delete_btn.config(state='disabled')
+            self.refresh_user_list()
+            self.refresh_cached_classes()
     
-    def start_automation(self):
+    def start_automation(self, kind='zoom'):
         if not self.selected_user_id:
             messagebox.showwarning("Warning", "Please select a user first!")
             return
@@ -523,6 +679,9 @@ class ZoomAutoJoinGUI:
             return
         
         self.current_user = user
+        self.automation_kind = kind
+        self.config.touch_user(user['id'])
+        self.log_bus.clear()
         self.show_automation_screen()
         
         # Start automation in thread
@@ -534,7 +693,8 @@ class ZoomAutoJoinGUI:
         self.automation_running = True
         
         # Top bar
-        top_bar = tk.Frame(self.root, bg=self.current_colors['secondary_bg'], height=60)
+        top_bar = tk.Frame(self.root, height=60)
+        self.styles.register(top_bar, bg='secondary_bg')
         top_bar.pack(fill='x', padx=0, pady=0)
         top_bar.pack_propagate(False)
         
@@ -542,9 +702,8 @@ class ZoomAutoJoinGUI:
             top_bar,
             text=f"👤 {self.current_user['first_name']} {self.current_user['last_name']}",
             font=('Helvetica', 16, 'bold'),
-            bg=self.current_colors['secondary_bg'],
-            fg=self.current_colors['accent']
         )
+        self.styles.register(user_label, bg='secondary_bg', fg='accent')
         user_label.pack(side='left', padx=20, pady=15)
         
         # Status indicator
@@ -552,8 +711,11 @@ class ZoomAutoJoinGUI:
             top_bar,
             text="⏳ Initializing...",
             font=('Helvetica', 11),
-            bg=self.current_colors['secondary_bg'],
-            fg=self.current_colors['warning']
+        )
+        self.styles.register(self.status_label, bg='secondary_bg')
+        self.status_level = 'warning'
+        self.styles.register_callback(
+            lambda colors: self.status_label.config(fg=self.get_status_color(self.status_level))
         )
         self.status_label.pack(side='left', padx=10)
         
@@ -562,9 +724,8 @@ class ZoomAutoJoinGUI:
             top_bar,
             text=datetime.now().strftime("%I:%M %p"),
             font=('Helvetica', 12),
-            bg=self.current_colors['secondary_bg'],
-            fg=self.current_colors['text']
         )
+        self.styles.register(self.time_label, bg='secondary_bg', fg='text')
         self.time_label.pack(side='right', padx=20)
         self.update_time()
         
@@ -573,106 +734,369 @@ class ZoomAutoJoinGUI:
             top_bar,
             text="🌙" if not self.is_dark_mode else "☀️",
             font=('Helvetica', 16),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
             bd=0,
             padx=15,
             pady=5,
             cursor='hand2',
             command=self.toggle_theme
         )
+        self.styles.register(theme_btn, bg='card_bg', fg='text')
+        self.styles.register_callback(
+            lambda colors: theme_btn.config(text="🌙" if not self.is_dark_mode else "☀️")
+        )
         theme_btn.pack(side='right', padx=10)
         
         # Main content
-        content_frame = tk.Frame(self.root, bg=self.current_colors['bg'])
+        content_frame = tk.Frame(self.root)
+        self.styles.register(content_frame, bg='bg')
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Console output
-        console_label = tk.Label(
-            content_frame,
-            text="📋 Console Output",
+        self.build_console(content_frame, height=20)
+        
+        # Buttons
+        btn_frame = tk.Frame(content_frame)
+        self.styles.register(btn_frame, bg='bg')
+        btn_frame.pack(fill='x', pady=(10, 0))
+        
+        self.stop_btn = tk.Button(
+            btn_frame,
+            text="⏹ STOP & GO BACK",
             font=('Helvetica', 12, 'bold'),
-            bg=self.current_colors['bg'],
-            fg=self.current_colors['text'],
-            anchor='w'
+            fg='white',
+            bd=0,
+            padx=30,
+            pady=12,
+            cursor='hand2',
+            command=self.stop_automation
         )
-        console_label.pack(fill='x', pady=(0, 10))
+        self.styles.register(self.stop_btn, bg='error')
+        self.stop_btn.pack(side='left', expand=True, fill='x')
+    
+    def update_dashboard_buttons(self):
+        count = len(self.checked_user_ids)
+        if count:
+            self.dashboard_btn.config(text=f"📊 RUN {count} CHECKED ON DASHBOARD")
+        else:
+            self.dashboard_btn.config(text="📊 OPEN DASHBOARD")
+    
+    def make_automation(self, user, kind, run_id):
+        # Pool runs close their browser once Zoom is open, so the slot goes to the next queued user
+        return load_backend(kind)(user, self.events, config=self.config, run_id=run_id, close_policy='after_join')
+    
+    def start_dashboard_runs(self, kind):
+        users = [self.config.get_user(user_id) for user_id in self.checked_user_ids]
+        users = [user for user in users if user]
         
-        self.console = scrolledtext.ScrolledText(
+        if not users and not self.run_manager.runs:
+            messagebox.showwarning("Warning", "Tick 'Batch' on one or more users first!")
+            return
+        
+        for user in users:
+            self.run_manager.submit(user, kind)
+        
+        self.checked_user_ids.clear()
+        self.show_dashboard_screen()
+    
+    def show_dashboard_screen(self):
+        self.clear_window()
+        self.automation_running = False
+        
+        # Top bar
+        top_bar = tk.Frame(self.root, height=60)
+        self.styles.register(top_bar, bg='secondary_bg')
+        top_bar.pack(fill='x', padx=0, pady=0)
+        top_bar.pack_propagate(False)
+        
+        title_label = tk.Label(
+            top_bar,
+            text="📊 Run Dashboard",
+            font=('Helvetica', 16, 'bold')
+        )
+        self.styles.register(title_label, bg='secondary_bg', fg='accent')
+        title_label.pack(side='left', padx=20, pady=15)
+        
+        self.dashboard_summary = tk.Label(top_bar, font=('Helvetica', 11))
+        self.styles.register(self.dashboard_summary, bg='secondary_bg', fg='text')
+        self.dashboard_summary.pack(side='left', padx=10)
+        
+        # Concurrency limit (persisted in settings)
+        self.concurrency_var = tk.IntVar(value=self.run_manager.max_workers)
+        concurrency_box = tk.Spinbox(
+            top_bar,
+            from_=1,
+            to=16,
+            width=3,
+            font=('Helvetica', 11),
+            textvariable=self.concurrency_var,
+            command=self.on_concurrency_changed
+        )
+        self.styles.register(concurrency_box, bg='card_bg', fg='text', buttonbackground='card_bg')
+        concurrency_box.pack(side='right', padx=(0, 20))
+        concurrency_box.bind('<Return>', lambda e: self.on_concurrency_changed())
+        concurrency_box.bind('<FocusOut>', lambda e: self.on_concurrency_changed())
+        
+        concurrency_label = tk.Label(top_bar, text="Parallel runs:", font=('Helvetica', 11))
+        self.styles.register(concurrency_label, bg='secondary_bg', fg='text')
+        concurrency_label.pack(side='right', padx=5)
+        
+        # Main content
+        content_frame = tk.Frame(self.root)
+        self.styles.register(content_frame, bg='bg')
+        content_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        self.run_list = VirtualListView(
             content_frame,
-            font=('Courier', 10),
-            bg=self.current_colors['card_bg'],
-            fg=self.current_colors['text'],
-            height=20,
-            wrap='word',
-            state='disabled'
+            row_height=RUN_ROW_HEIGHT,
+            create_row=self.create_run_row,
+            update_row=self.update_run_row,
+            key=lambda run: run.run_id,
+            signature=lambda run: (run.state, run.step, int(run.elapsed)),
+            bg=self.current_colors['bg'],
+            empty_text="No runs yet",
+            empty_fg=self.current_colors['text_secondary']
         )
-        self.console.pack(fill='both', expand=True)
+        self.styles.register_callback(
+            lambda colors: self.run_list.set_colors(colors['bg'], colors['text_secondary'])
+        )
+        self.run_list.pack(fill='both', expand=True)
         
-        # Configure tags for colored output
-        self.console.tag_config('success', foreground=self.current_colors['success'])
-        self.console.tag_config('error', foreground=self.current_colors['error'])
-        self.console.tag_config('warning', foreground=self.current_colors['warning'])
-        self.console.tag_config('info', foreground=self.current_colors['accent'])
+        self.build_console(content_frame, height=8, top_pady=10)
         
         # Buttons
-        btn_frame = tk.Frame(content_frame, bg=self.current_colors['bg'])
+        btn_frame = tk.Frame(content_frame)
+        self.styles.register(btn_frame, bg='bg')
         btn_frame.pack(fill='x', pady=(10, 0))
         
-        self.stop_btn = tk.Button(
+        back_btn = tk.Button(
             btn_frame,
-            text="⏹ STOP & GO BACK",
+            text="⬅ BACK",
             font=('Helvetica', 12, 'bold'),
-            bg=self.current_colors['error'],
             fg='white',
             bd=0,
             padx=30,
             pady=12,
             cursor='hand2',
-            command=self.stop_automation
+            command=self.show_start_screen
         )
-        self.stop_btn.pack(side='left', expand=True, fill='x')
+        self.styles.register(back_btn, bg='accent')
+        back_btn.pack(side='left', expand=True, fill='x', padx=(0, 5))
+        
+        clear_btn = tk.Button(
+            btn_frame,
+            text="🧹 CLEAR FINISHED",
+            font=('Helvetica', 12, 'bold'),
+            fg='white',
+            bd=0,
+            padx=30,
+            pady=12,
+            cursor='hand2',
+            command=self.run_manager.clear_finished
+        )
+        self.styles.register(clear_btn, bg='warning')
+        clear_btn.pack(side='left', expand=True, fill='x', padx=5)
+        
+        cancel_all_btn = tk.Button(
+            btn_frame,
+            text="⏹ CANCEL ALL",
+            font=('Helvetica', 12, 'bold'),
+            fg='white',
+            bd=0,
+            padx=30,
+            pady=12,
+            cursor='hand2',
+            command=self.run_manager.cancel_all
+        )
+        self.styles.register(cancel_all_btn, bg='error')
+        cancel_all_btn.pack(side='left', expand=True, fill='x', padx=(5, 0))
+        
+        self.refresh_dashboard()
     
-    def log_to_console(self, message, level='info'):
-        if not hasattr(self, 'console') or not self.console.winfo_exists():
+    def create_run_row(self, parent):
+        run_card = tk.Frame(parent, relief='flat', bd=1)
+        self.styles.register(run_card, bg='secondary_bg')
+        
+        run_card.name_label = tk.Label(run_card, font=('Helvetica', 10, 'bold'), width=22, anchor='w')
+        self.styles.register(run_card.name_label, bg='secondary_bg', fg='text')
+        run_card.name_label.pack(side='left', padx=(10, 5))
+        
+        run_card.state_label = tk.Label(run_card, font=('Helvetica', 10, 'bold'), width=10, anchor='w')
+        self.styles.register(run_card.state_label, bg='secondary_bg')
+        run_card.state_label.pack(side='left', padx=5)
+        
+        run_card.cancel_btn = tk.Button(
+            run_card,
+            text="⏹ Cancel",
+            font=('Helvetica', 9, 'bold'),
+            fg='white',
+            bd=0,
+            padx=10,
+            pady=3,
+            cursor='hand2'
+        )
+        self.styles.register(run_card.cancel_btn, bg='error')
+        run_card.cancel_btn.pack(side='right', padx=10)
+        
+        run_card.elapsed_label = tk.Label(run_card, font=('Courier', 10), width=8, anchor='e')
+        self.styles.register(run_card.elapsed_label, bg='secondary_bg', fg='text_secondary')
+        run_card.elapsed_label.pack(side='right', padx=5)
+        
+        run_card.step_label = tk.Label(run_card, font=('Helvetica', 9), anchor='w')
+        self.styles.register(run_card.step_label, bg='secondary_bg', fg='text_secondary')
+        run_card.step_label.pack(side='left', fill='x', expand=True, padx=5)
+        return run_card
+    
+    def update_run_row(self, run_card, run):
+        state_colors = {
+            'queued': self.current_colors['text_secondary'],
+            'running': self.current_colors['accent'],
+            'done': self.current_colors['success'],
+            'failed': self.current_colors['error'],
+            'cancelled': self.current_colors['warning']
+        }
+        icon = "📋" if run.kind == 'attendance' else "🎓"
+        minutes, seconds = divmod(int(run.elapsed), 60)
+        
+        run_card.name_label.config(text=f"{icon} {run.user['first_name']} {run.user['last_name']}")
+        run_card.state_label.config(text=run.state.upper(), fg=state_colors[run.state])
+        run_card.step_label.config(text=run.step)
+        run_card.elapsed_label.config(text=f"{minutes:02d}:{seconds:02d}")
+        run_card.cancel_btn.config(
+            command=lambda run_id=run.run_id: self.run_manager.cancel(run_id),
+            state='normal' if run.is_active else 'disabled'
+        )
+    
+    def refresh_dashboard(self):
+        if not hasattr(self, 'run_list') or not self.run_list.winfo_exists():
+            return
+        
+        runs = list(self.run_manager.runs)
+        self.run_list.set_items(runs)
+        
+        counts = {}
+        for run in runs:
+            counts[run.state] = counts.get(run.state, 0) + 1
+        self.dashboard_summary.config(
+            text=f"▶ {counts.get('running', 0)} running · ⏳ {counts.get('queued', 0)} queued · "
+                 f"✅ {counts.get('done', 0)} done · ❌ {counts.get('failed', 0)} failed"
+                 + ''.join(f" · ⌀ {step} {seconds:.1f}s" for step, seconds in self.step_timings.averages().items())
+        )
+        
+        self.root.after(DASHBOARD_REFRESH_MS, self.refresh_dashboard)
+    
+    def on_concurrency_changed(self):
+        try:
+            max_workers = int(self.concurrency_var.get())
+        except (tk.TclError, ValueError):
             return
+        self.run_manager.set_max_workers(max_workers)
+    
+    def build_console(self, parent, height, top_pady=0):
+        console_label = tk.Label(
+            parent,
+            text="📋 Console Output",
+            font=('Helvetica', 12, 'bold'),
+            anchor='w'
+        )
+        self.styles.register(console_label, bg='bg', fg='text')
+        console_label.pack(fill='x', pady=(top_pady, 10))
+        
+        self.console = scrolledtext.ScrolledText(
+            parent,
+            font=('Courier', 10),
+            height=height,
+            wrap='word',
+            state='disabled'
+        )
+        self.styles.register(self.console, bg='card_bg', fg='text')
+        self.console.pack(fill='both', expand=True)
+        
+        # Configure tags for colored output
+        self.styles.register_callback(self.configure_console_tags)
+        
+        # Replay buffered output when coming back to a screen with a console
+        if self.log_bus.lines:
+            self.append_console_lines(list(self.log_bus.lines))
+    
+    def log_to_console(self, message, level='info'):
+        # Safe from automation threads: rendering happens in process_log_bus
+        self.log_bus.post_log(message, level)
+    
+    def update_status(self, status, level='info'):
+        self.log_bus.post_status(status, level)
+    
+    def on_automation_event(self, event):
+        # Called on automation threads: only enqueue onto the log bus
+        message = event.payload['message']
+        level = event.payload.get('level', 'info')
+        if event.type == LOG:
+            run = self.run_manager.get_run(event.run_id) if event.run_id is not None else None
+            if run:
+                message = f"[{run.user['first_name']} {run.user['last_name']}] {message}"
+            self.log_to_console(message, level)
+        elif event.run_id is None:
+            # Dashboard runs report status through their run rows instead
+            self.update_status(message, level)
+    
+    def get_status_color(self, level):
+        colors = {
+            'success': self.current_colors['success'],
+            'error': self.current_colors['error'],
+            'warning': self.current_colors['warning'],
+            'info': self.current_colors['accent']
+        }
+        return colors.get(level, self.current_colors['text'])
+    
+    def configure_console_tags(self, colors):
+        self.console.tag_config('success', foreground=colors['success'])
+        self.console.tag_config('error', foreground=colors['error'])
+        self.console.tag_config('warning', foreground=colors['warning'])
+        self.console.tag_config('info', foreground=colors['accent'])
+    
+    def process_log_bus(self):
+        lines, status = self.log_bus.drain()
+        
+        try:
+            if lines and hasattr(self, 'console') and self.console.winfo_exists():
+                self.append_console_lines(lines)
+            
+            if status and hasattr(self, 'status_label') and self.status_label.winfo_exists():
+                text, self.status_level = status
+                self.status_label.config(text=text, fg=self.get_status_color(self.status_level))
+        except tk.TclError:
+            pass
         
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_msg = f"[{timestamp}] {message}\n"
+        self.root.after(LOG_POLL_INTERVAL_MS, self.process_log_bus)
+    
+    def append_console_lines(self, lines):
+        # One insert call for the whole batch: text1, tag1, text2, tag2, ...
+        chunks = []
+        for text, level in lines:
+            chunks.append(text)
+            chunks.append(level if level in ('success', 'error', 'warning', 'info') else 'info')
         
         self.console.config(state='normal')
-        self.console.insert('end', formatted_msg, level)
+        self.console.insert('end', *chunks)
+        
+        # Keep the widget a bounded ring of the newest lines
+        line_count = int(self.console.index('end-1c').split('.')[0]) - 1
+        excess = line_count - self.log_bus.max_lines
+        if excess > 0:
+            self.console.delete('1.0', f'{excess + 1}.0')
+        
         self.console.see('end')
         self.console.config(state='disabled')
     
-    def update_status(self, status, level='info'):
-        if hasattr(self, 'status_label') and self.status_label.winfo_exists():
-            colors = {
-                'success': self.current_colors['success'],
-                'error': self.current_colors['error'],
-                'warning': self.current_colors['warning'],
-                'info': self.current_colors['accent']
-            }
-            self.status_label.config(text=status, fg=colors.get(level, self.current_colors['text']))
-    
     def run_automation(self):
         try:
             self.log_to_console("🚀 Starting automation...", 'info')
             self.update_status("⏳ Logging in...", 'info')
             
-            self.automation = ZoomAutomation(self.current_user, self.log_to_console, self.update_status)
+            self.automation = load_backend(self.automation_kind)(
+                self.current_user, self.events, config=self.config
+            )
             self.automation.run()
             
-            # Cache the zoom link if available
-            if hasattr(self.automation, 'zoom_link') and self.automation.zoom_link:
-                self.config.cache_class({
-                    'user_id': self.current_user['id'],
-                    'class_name': self.automation.class_name or "Zoom Class",
-                    'class_time': self.automation.class_time or "Time TBD",
-                    'zoom_link': self.automation.zoom_link
-                })
-                self.log_to_console("💾 Class link cached for 24 hours", 'success')
-            
             self.log_to_console("✅ Automation completed! Browser will remain open.", 'success')
             self.update_status("✅ Completed - Check Browser", 'success')
             
@@ -680,6 +1104,13 @@ class ZoomAutoJoinGUI:
             self.log_to_console(f"❌ Error: {str(e)}", 'error')
             self.update_status("❌ Error occurred", 'error')
     
+    def on_close(self):
+        # Stop every run so browsers close and pool threads can exit with the app
+        if self.automation:
+            self.automation.stop()
+        self.run_manager.cancel_all()
+        self.root.destroy()
+    
     def stop_automation(self):
         if self.automation:
             self.automation.stop()
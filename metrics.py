@@ -0,0 +1,254 @@
+import bisect
+import threading
+from datetime import datetime
+
+from events import (
+    RUN_STARTED, RUN_FINISHED, STEP_FINISHED, CLASS_SELECTED, ATTENDANCE_SUBMITTED, RESOURCES
+)
+
+# Setting 'metrics_port'; 0 turns the endpoint off
+DEFAULT_METRICS_PORT = 9464
+DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+JOIN_DELAY_BUCKETS = (5, 15, 30, 60, 120, 300, 600, 1800)
+WRITE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+RSS_BUCKETS = tuple(mb * 1024 * 1024 for mb in (128, 256, 512, 768, 1024, 1536, 2048, 3072, 4096))
+LIFETIME_BUCKETS = (10, 60, 300, 900, 1800, 3600, 7200)
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}'
+
+
+def format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count, optionally split by labels"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            items = sorted(self.values.items())
+        return [(self.name, format_labels(self.labels, key), value) for key, value in items]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values, optionally split by labels"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, buckets=DURATION_BUCKETS, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self.values = {}  # label values -> [per-bucket counts (+Inf last), sum]
+        self.lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def samples(self):
+        with self.lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self.values.items())
+        samples = []
+        for key, (counts, total) in items:
+            running = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                running += count
+                samples.append((f"{self.name}_bucket",
+                                format_labels(self.labels, key, [('le', format_number(bound))]), running))
+            samples.append((f"{self.name}_sum", format_labels(self.labels, key), total))
+            samples.append((f"{self.name}_count", format_labels(self.labels, key), running))
+        return samples
+
+
+class Gauge:
+    """Value read from a callback at scrape time"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, help, read):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def samples(self):
+        try:
+            return [(self.name, '', self.read())]
+        except Exception:
+            return []
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        """Add metric, or return the one already registered under its name"""
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, labels=()):
+        return self.register(Counter(name, help, labels))
+
+    def histogram(self, name, help, buckets=DURATION_BUCKETS, labels=()):
+        return self.register(Histogram(name, help, buckets, labels))
+
+    def gauge(self, name, help, read):
+        return self.register(Gauge(name, help, read))
+
+    def render(self):
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {format_number(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+# ConfigManager (instrumented directly, so writes from every entry point count)
+CONFIG_WRITES = REGISTRY.counter('config_writes_total', "credentials.json writes")
+CONFIG_WRITE_SECONDS = REGISTRY.histogram('config_write_seconds', "Time to write credentials.json",
+                                          buckets=WRITE_BUCKETS)
+CACHE_LOOKUPS = REGISTRY.counter('class_cache_lookups_total', "Cached class lookups", labels=('result',))
+
+
+def cache_hit_ratio():
+    hits = CACHE_LOOKUPS.values.get(('hit',), 0)
+    lookups = hits + CACHE_LOOKUPS.values.get(('miss',), 0)
+    return hits / lookups if lookups else 0.0
+
+
+REGISTRY.gauge('class_cache_hit_ratio', "Share of cached class lookups that hit", cache_hit_ratio)
+
+
+class MetricsSubscriber:
+    """Event-bus subscriber that turns automation events into metrics"""
+
+    def __init__(self, registry=REGISTRY):
+        self.runs_started = registry.counter('automation_runs_started_total', "Runs started", labels=('kind',))
+        self.runs_finished = registry.counter('automation_runs_finished_total', "Runs finished by outcome",
+                                              labels=('kind', 'outcome'))
+        self.steps = registry.counter('automation_steps_total', "Steps finished by result",
+                                      labels=('step', 'result'))
+        self.step_seconds = registry.histogram('automation_step_seconds', "Step duration", labels=('step',))
+        self.login_seconds = registry.histogram('automation_login_seconds', "Portal login duration")
+        self.join_delay = registry.histogram('automation_join_delay_seconds',
+                                             "Seconds between class start and a completed Zoom join",
+                                             buckets=JOIN_DELAY_BUCKETS)
+        self.attendance = registry.counter('automation_attendance_entries_total', "Attendance entries by result",
+                                           labels=('status',))
+        self.browser_rss = registry.histogram('browser_peak_rss_bytes', "Peak RSS of a run's browser processes",
+                                              buckets=RSS_BUCKETS)
+        self.browser_lifetime = registry.histogram('browser_process_lifetime_seconds',
+                                                   "Lifetime of each browser process a run launched",
+                                                   buckets=LIFETIME_BUCKETS)
+        self.browser_leftovers = registry.counter('browser_leftover_processes_total',
+                                                  "Browser processes still running after their run closed")
+        self.kinds = {}
+        self.class_starts = {}
+
+    def __call__(self, event):
+        run_id = event.run_id
+        if event.type == RUN_STARTED:
+            self.kinds[run_id] = event.payload.get('kind') or ''
+            self.runs_started.inc(kind=self.kinds[run_id])
+        elif event.type == RUN_FINISHED:
+            self.runs_finished.inc(kind=self.kinds.pop(run_id, ''), outcome=event.payload.get('outcome') or '')
+            self.class_starts.pop(run_id, None)
+        elif event.type == STEP_FINISHED:
+            step, ok = event.payload['step'], event.payload.get('ok')
+            self.steps.inc(step=step, result='ok' if ok else 'failed')
+            self.step_seconds.observe(event.payload['duration'], step=step)
+            if step == 'login' and ok:
+                self.login_seconds.observe(event.payload['duration'])
+            if step in ('join', 'cache_join') and ok and run_id in self.class_starts:
+                class_start = self.class_starts[run_id]
+                self.join_delay.observe(max(0.0, datetime.now(class_start.tzinfo).timestamp()
+                                            - class_start.timestamp()))
+        elif event.type == CLASS_SELECTED:
+            if event.payload.get('class_start'):
+                self.class_starts[run_id] = datetime.fromisoformat(event.payload['class_start'])
+        elif event.type == ATTENDANCE_SUBMITTED:
+            self.attendance.inc(status=event.payload.get('status') or 'submitted')
+        elif event.type == RESOURCES:
+            self.browser_rss.observe(event.payload['peak_rss_mb'] * 1024 * 1024)
+            for process in event.payload['processes']:
+                self.browser_lifetime.observe(process['seconds'])
+                if process['alive']:
+                    self.browser_leftovers.inc()
+
+
+def start_metrics_server(port=DEFAULT_METRICS_PORT, host='127.0.0.1', registry=REGISTRY):
+    """Serve /metrics on a daemon thread (localhost only); returns the server"""
+    # Imported here: http.server pulls in email and ssl, which the GUIs' startup doesn't need
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Scrapes every few seconds would flood the console
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_from_settings(config, events):
+    """Feed events into the registry and serve it on the 'metrics_port' setting; returns the server or None.
+
+    Raises OSError when the port is taken (e.g. both GUIs open at once).
+    """
+    events.subscribe(MetricsSubscriber())
+    port = int(config.get_setting('metrics_port', DEFAULT_METRICS_PORT) or 0)
+    return start_metrics_server(port) if port else None
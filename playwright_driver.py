@@ -0,0 +1,262 @@
+import time
+from playwright.sync_api import sync_playwright
+
+# Longest a wait may run before re-checking for cancellation
+CANCEL_POLL_MS = 250
+LAUNCH_ARGS = ['--disable-blink-features=AutomationControlled']
+
+
+class SharedBrowser:
+    """A launched browser that consecutive runs on one thread reuse, each in a fresh context"""
+
+    def __init__(self, headless=True):
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+
+    def close(self):
+        try:
+            self.browser.close()
+        except:
+            pass
+        self.playwright.stop()
+
+
+class PlaywrightDriver:
+    """Engine driver on the Playwright sync API.
+
+    Playwright objects belong to the thread that created them, so every method
+    except interrupt() must be called from the run thread.
+    """
+
+    name = 'playwright'
+
+    def __init__(self, cancel_token, log, headless=False, shared=None, har=None):
+        self.cancel_token = cancel_token
+        self.log = log
+        self.headless = headless
+        self.shared = shared
+        # ('record', path) saves the session as a HAR on close; ('replay', path) serves it offline
+        self.har = har
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+
+    @classmethod
+    def launch_shared(cls, headless=True):
+        return SharedBrowser(headless)
+
+    def start(self):
+        if self.shared:
+            # Contexts are cheap and isolate cookies, so accounts never see each other's session
+            self.browser = self.shared.browser
+        else:
+            # Launch browser with automation flags hidden and downloads disabled
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+        options = {
+            'accept_downloads': False,
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        if self.har and self.har[0] == 'record':
+            options.update(record_har_path=self.har[1], record_har_content='embed')
+        self.context = self.browser.new_context(**options)
+        if self.har and self.har[0] == 'replay':
+            # Requests missing from the HAR fail instead of reaching the network
+            self.context.route_from_har(self.har[1], not_found='abort')
+        self.page = self.context.new_page()
+
+    def interrupt(self):
+        # Thread-bound: the run thread notices the cancel token at its next pause and closes
+        pass
+
+    def close(self):
+        # A shared browser outlives this run; only its context is ours to close
+        for target in (self.context,) if self.shared else (self.context, self.browser):
+            if target:
+                try:
+                    target.close()
+                except:
+                    pass
+        if self.playwright:
+            try:
+                self.playwright.stop()
+            except:
+                pass
+
+    def pause(self, seconds):
+        """Like page.wait_for_timeout, but returns promptly once the run is stopped"""
+        deadline = time.monotonic() + seconds
+        while True:
+            self.cancel_token.check()
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return
+            self.page.wait_for_timeout(min(remaining_ms, CANCEL_POLL_MS))
+
+    # ==================== Tracing ====================
+
+    def start_tracing(self):
+        """Begin recording a trace for this context; returns whether tracing is supported"""
+        self.context.tracing.start(screenshots=True, snapshots=True)
+        return True
+
+    def begin_trace_chunk(self, title):
+        self.context.tracing.start_chunk(title=title)
+
+    def end_trace_chunk(self, path=None):
+        """Save the chunk since begin_trace_chunk to path, or discard it when path is None"""
+        self.context.tracing.stop_chunk(path=path)
+
+    # ==================== Network ====================
+
+    def watch_urls(self, callback):
+        """Call callback(url) for every request in this context, popups and redirect hops included.
+
+        Runs on the run thread while Playwright waits; returns whether watching is supported.
+        """
+        self.context.on('request', lambda request: callback(request.url))
+        return True
+
+    # ==================== Navigation ====================
+
+    def goto(self, url):
+        self.page.goto(url)
+
+    def wait_until_loaded(self, timeout=10):
+        try:
+            self.page.wait_for_load_state('networkidle', timeout=timeout * 1000)
+        except Exception:
+            pass
+
+    def current_url(self):
+        return self.page.url
+
+    # ==================== Locators ====================
+
+    def locate(self, locator, root=None):
+        """Translate an engine locator tuple into a Playwright Locator"""
+        root = root or self.page
+        kind = locator[0]
+        if kind == 'role':
+            return root.get_by_role(locator[1], name=locator[2])
+        if kind == 'text':
+            return root.locator(locator[1], has_text=locator[2])
+        if kind == 'xpath':
+            return root.locator('xpath=' + locator[1])
+        return root.locator(locator[1])
+
+    def count(self, locator):
+        return self.locate(locator).count()
+
+    def wait_for_any(self, candidates, timeout=10):
+        """Wait until any candidate is on the page; returns whether one appeared"""
+        deadline = time.monotonic() + timeout
+        while True:
+            for locator in candidates:
+                if self.locate(locator).count():
+                    return True
+            if time.monotonic() >= deadline:
+                return False
+            self.pause(CANCEL_POLL_MS / 1000)
+
+    def try_candidates(self, candidates, action, timeout, report=None):
+        """Run action(target) on each candidate until one succeeds; returns whether one did"""
+        for locator in candidates:
+            started = time.perf_counter()
+            try:
+                target = self.locate(locator).first
+                target.wait_for(state='visible', timeout=timeout * 1000)
+                action(target)
+                if report:
+                    report(locator, True, time.perf_counter() - started)
+                return True
+            except Exception:
+                if report:
+                    report(locator, False, time.perf_counter() - started)
+                # Later candidates are fallbacks for an already loaded page
+                timeout = 1
+        return False
+
+    def fill(self, candidates, value, timeout=5, report=None):
+        """Fill the first candidate that becomes visible; returns whether one did"""
+        return self.try_candidates(candidates, lambda field: field.fill(value), timeout, report)
+
+    def click(self, candidates, timeout=5, js_fallback=False, report=None):
+        """Click the first candidate that becomes visible; returns whether one was clicked"""
+        if self.try_candidates(candidates, lambda target: target.click(), timeout, report):
+            return True
+
+        if js_fallback:
+            # Works when an overlay blocks the real click
+            for locator in candidates:
+                try:
+                    target = self.locate(locator).first
+                    if target.count():
+                        target.evaluate("(el) => el.click()")
+                        return True
+                except Exception:
+                    pass
+        return False
+
+    # ==================== Elements ====================
+
+    def find_all(self, locator):
+        matches = self.locate(locator)
+        return [matches.nth(i) for i in range(matches.count())]
+
+    def find_within(self, element, locator):
+        """First match of locator inside element, or None"""
+        match = self.locate(locator, root=element).first
+        return match if match.count() else None
+
+    def text_of(self, element):
+        return element.inner_text(timeout=3000)
+
+    def is_visible(self, element):
+        return element.is_visible()
+
+    def click_element(self, element):
+        element.click()
+
+    # ==================== Windows and dialogs ====================
+
+    def current_tab(self):
+        return self.page
+
+    def switch_to(self, tab):
+        self.page = tab
+        self.page.bring_to_front()
+
+    def open_tab(self, url):
+        """Open url in a new tab of the same context without waiting for it to load"""
+        tab = self.context.new_page()
+        # 'commit' returns once the response starts; the page keeps loading in the background
+        tab.goto(url, wait_until='commit')
+        return tab
+
+    def click_for_popup(self, candidates, timeout=10, report=None):
+        """Click a link that opens a new window and switch to it; returns its URL"""
+        with self.page.expect_popup(timeout=timeout * 1000) as popup_info:
+            if not self.click(candidates, timeout=timeout, report=report):
+                raise RuntimeError("Popup link not found")
+        self.page = popup_info.value
+        return self.page.url
+
+    def click_and_accept_dialog(self, element, timeout=5):
+        """Click element and accept the alert it raises; returns the alert text or None"""
+        messages = []
+
+        def on_dialog(dialog):
+            messages.append(dialog.message)
+            dialog.accept()
+
+        self.page.on('dialog', on_dialog)
+        try:
+            element.click()
+            deadline = time.monotonic() + timeout
+            while not messages and time.monotonic() < deadline:
+                self.pause(CANCEL_POLL_MS / 1000)
+        finally:
+            self.page.remove_listener('dialog', on_dialog)
+        return messages[0] if messages else None
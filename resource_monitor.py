@@ -0,0 +1,133 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # Optional: without it runs are simply not measured
+    psutil = None
+
+SAMPLE_SECONDS = 5
+# Close policies applied once a run has finished its steps (setting 'browser_close_policy'):
+#   hold        keep the browser for browser_hold_minutes so the user can finish by hand
+#   after_join  close as soon as the Zoom app was opened (flows without Zoom: right away);
+#               dashboard runs always use it so they free their pool slot
+CLOSE_POLICIES = ('hold', 'after_join')
+DEFAULT_HOLD_MINUTES = 60
+DEFAULT_MEMORY_CAP_MB = 2048
+
+# Launches are serialized so each monitor only claims the processes its own start() created
+start_lock = threading.Lock()
+
+
+def own_children():
+    """Direct children only: chromedriver or Playwright's node driver, with the browser below it.
+
+    Deeper processes belong to whichever browser spawned them, possibly another run's.
+    """
+    try:
+        return {child.pid: child for child in psutil.Process(os.getpid()).children(recursive=False)}
+    except psutil.Error:
+        return {}
+
+
+class ResourceMonitor:
+    """Samples RSS and CPU of the browser processes one run launched, and reports their lifetimes"""
+
+    def __init__(self, interval=SAMPLE_SECONDS):
+        self.interval = interval
+        self.roots = []
+        self.processes = {}  # pid -> [psutil.Process, name, first seen, last seen alive]
+        self.rss = 0
+        self.peak_rss = 0
+        self.cpu_samples = []
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def create(cls):
+        """A monitor, or None when psutil is not installed"""
+        return cls() if psutil else None
+
+    @contextmanager
+    def watch_start(self):
+        """Wrap a browser launch; the child processes it creates become this run's roots"""
+        with start_lock:
+            before = own_children()
+            yield
+            self.roots = [process for pid, process in own_children().items() if pid not in before]
+        self.sample()
+        self.thread = threading.Thread(target=self.sample_loop, daemon=True)
+        self.thread.start()
+
+    def sample_loop(self):
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def tree(self):
+        seen = {}
+        for root in self.roots:
+            try:
+                if root.is_running():
+                    seen[root.pid] = root
+                    for child in root.children(recursive=True):
+                        seen[child.pid] = child
+            except psutil.Error:
+                continue
+        return seen
+
+    def sample(self):
+        """Measure the process tree now; returns its total RSS in bytes"""
+        with self.lock:
+            return self.sample_locked()
+
+    def sample_locked(self):
+        now = time.time()
+        rss = 0
+        cpu = 0.0
+        for pid, process in self.tree().items():
+            # Reuse the Process objects so cpu_percent() measures since the previous sample
+            entry = self.processes.setdefault(pid, [process, None, now, now])
+            try:
+                rss += entry[0].memory_info().rss
+                cpu += entry[0].cpu_percent(None)
+                entry[1] = entry[1] or entry[0].name()
+                entry[3] = now
+            except psutil.Error:
+                continue
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss, rss)
+        self.cpu_samples.append(cpu)
+        return rss
+
+    def over_cap(self, cap_mb):
+        return bool(cap_mb) and self.rss > cap_mb * 1024 * 1024
+
+    def stop(self):
+        """Stop sampling; returns a summary with each process's lifetime and any left running"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+        now = time.time()
+        lifetimes = []
+        for pid, (process, name, first_seen, last_seen) in sorted(self.processes.items()):
+            try:
+                alive = process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+                started = process.create_time()
+            except psutil.Error:
+                alive, started = False, first_seen
+            lifetimes.append({
+                'pid': pid,
+                'name': name or '?',
+                'seconds': round((now if alive else last_seen) - started, 1),
+                'alive': alive,
+            })
+        samples = self.cpu_samples[1:] or self.cpu_samples  # The first cpu_percent() reading is always 0
+        return {
+            'peak_rss_mb': round(self.peak_rss / 1024 / 1024, 1),
+            'avg_cpu_percent': round(sum(samples) / len(samples), 1) if samples else 0.0,
+            'processes': lifetimes,
+        }
+
@@ -0,0 +1,111 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+# Distinct runs whose portal operations failed, with no success in between, that open a
+# site's breaker. One account failing repeatedly (wrong password, missing panel) never
+# opens it on its own; several accounts failing together looks like an outage.
+FAILURE_THRESHOLD = 3
+# Seconds an open breaker waits before letting one probe through; doubles while probes fail
+RESET_SECONDS = 15
+MAX_RESET_SECONDS = 120
+# How often blocked callers re-check for cancellation
+POLL_SECONDS = 0.25
+
+
+class RetryPolicy:
+    """How often a step may be repeated and how long to back off in between"""
+
+    def __init__(self, attempts=3, base_delay=2.0, max_delay=30.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """Backoff before retry number attempt (1-based): exponential with full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+# Steps that are safe to run again from scratch. Anything else - opening the Zoom popup,
+# submitting the registration form - could act twice, so it runs once.
+#   login            navigates to the login page first, so a retry starts clean
+#   mark_attendance  reloads the dashboard first and only clicks buttons still shown
+STEP_POLICIES = {
+    'login': RetryPolicy(attempts=3),
+    'mark_attendance': RetryPolicy(attempts=2),
+}
+
+
+class CircuitBreaker:
+    """Shared health state for one portal, so runs stop hammering it when it is down.
+
+    closed     calls go through; failures from FAILURE_THRESHOLD different runs in a row open the breaker
+    open       callers wait until the reset timeout passes
+    half-open  one caller probes; success closes the breaker and wakes everyone,
+               failure reopens it with a longer timeout
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.state = 'closed'
+        self.failures = 0
+        # Callers that failed since the last success
+        self.failing = set()
+        self.reset_seconds = RESET_SECONDS
+        self.opened_at = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self, cancel_token, on_wait=None):
+        """Block until a call may go through; on_wait() is called once if this has to wait"""
+        waited = False
+        with self.condition:
+            while True:
+                cancel_token.check()
+                if self.state == 'closed':
+                    return
+                if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_seconds:
+                    self.state = 'half-open'
+                    return
+                if not waited and on_wait:
+                    waited = True
+                    on_wait()
+                self.condition.wait(POLL_SECONDS)
+
+    def record(self, ok, caller=None):
+        """Record one call's result; caller identifies the run, so its own retries count once"""
+        with self.condition:
+            if ok:
+                self.state = 'closed'
+                self.failures = 0
+                self.failing.clear()
+                self.reset_seconds = RESET_SECONDS
+                self.condition.notify_all()
+                return
+            self.failing.add(caller)
+            self.failures = len(self.failing)
+            if self.state == 'half-open':
+                self.reset_seconds = min(self.reset_seconds * 2, MAX_RESET_SECONDS)
+            if self.state == 'half-open' or self.failures >= FAILURE_THRESHOLD:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """Give up a probe slot without a result (the run was stopped mid-call)"""
+        with self.condition:
+            if self.state == 'half-open':
+                self.state = 'open'
+                self.condition.notify_all()
+
+
+breakers = {}
+breakers_lock = threading.Lock()
+
+
+def breaker_for(url):
+    """The process-wide breaker for url's site, shared by every run and batch worker"""
+    site = urlparse(url).netloc or url
+    with breakers_lock:
+        if site not in breakers:
+            breakers[site] = CircuitBreaker(site)
+        return breakers[site]
@@ -0,0 +1,167 @@
+import itertools
+import threading
+import time
+from events import LOG, STATUS, STEP_FINISHED
+
+DEFAULT_MAX_CONCURRENT_RUNS = 2
+# Steps whose failure is expected and handled (a cache miss falls back to the portal)
+FALLBACK_STEPS = ('cache_join',)
+
+
+class AutomationRun:
+    """One user's automation run, as tracked by the dashboard"""
+
+    def __init__(self, run_id, user, kind):
+        self.run_id = run_id
+        self.user = user
+        self.kind = kind
+        self.state = 'queued'  # queued, running, done, failed, cancelled
+        self.step = "⏳ Waiting for a free slot..."
+        self.level = 'info'
+        self.automation = None
+        self.future = None
+        self.cancel_requested = False
+        self.cancel_requested_at = None
+        self.failed_steps = []
+        self.release_seconds = None
+        self.queued_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def elapsed(self):
+        """Seconds spent running (0 while queued)"""
+        if not self.started_at:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def is_active(self):
+        return self.state in ('queued', 'running')
+
+
+class RunManager:
+    """Runs automations for many users on a bounded thread pool"""
+
+    def __init__(self, config, make_automation, events):
+        self.config = config
+        self.make_automation = make_automation
+        self.events = events
+        events.subscribe(self.on_status, types=(STATUS,))
+        events.subscribe(self.on_step_finished, types=(STEP_FINISHED,))
+        self.lock = threading.Lock()
+        self.runs = []
+        self.run_ids = itertools.count(1)
+        self.max_workers = self.get_max_workers()
+        self.executor = None  # created on first submit, keeping concurrent.futures off startup
+
+    def get_max_workers(self):
+        try:
+            return max(1, int(self.config.get_setting('max_concurrent_runs', DEFAULT_MAX_CONCURRENT_RUNS)))
+        except (TypeError, ValueError):
+            return DEFAULT_MAX_CONCURRENT_RUNS
+
+    def set_max_workers(self, max_workers):
+        """Change the concurrency limit; runs already queued keep their old pool"""
+        max_workers = max(1, int(max_workers))
+        self.config.set_setting('max_concurrent_runs', max_workers)
+        with self.lock:
+            if max_workers == self.max_workers:
+                return
+            old_executor = self.executor
+            self.max_workers = max_workers
+            self.executor = None
+        if old_executor:
+            old_executor.shutdown(wait=False)
+
+    def submit(self, user, kind='zoom'):
+        """Queue a run for user and return its AutomationRun"""
+        with self.lock:
+            if self.executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='automation')
+            run = AutomationRun(next(self.run_ids), user, kind)
+            self.runs.append(run)
+            run.future = self.executor.submit(self.execute, run)
+        return run
+
+    def cancel(self, run_id):
+        """Cancel a queued run or stop a running one"""
+        run = self.get_run(run_id)
+        if not run or not run.is_active:
+            return
+        run.cancel_requested = True
+        run.cancel_requested_at = time.time()
+        if run.future and run.future.cancel():
+            run.state = 'cancelled'
+            run.step = "⏹ Cancelled before start"
+            run.finished_at = time.time()
+        elif run.automation:
+            run.step = "⏹ Stopping..."
+            run.automation.stop()
+
+    def cancel_all(self):
+        for run in list(self.runs):
+            self.cancel(run.run_id)
+
+    def get_run(self, run_id):
+        for run in self.runs:
+            if run.run_id == run_id:
+                return run
+        return None
+
+    def on_status(self, event):
+        """Show a run's latest status on its dashboard row"""
+        run = self.get_run(event.run_id) if event.run_id is not None else None
+        if run:
+            run.step = event.payload['message']
+            run.level = event.payload.get('level', 'info')
+
+    def on_step_finished(self, event):
+        """Note failed steps: a run can complete while one of them failed (e.g. join)"""
+        if event.payload.get('ok') or event.payload['step'] in FALLBACK_STEPS:
+            return
+        run = self.get_run(event.run_id) if event.run_id is not None else None
+        if run:
+            run.failed_steps.append(event.payload['step'])
+
+    def clear_finished(self):
+        with self.lock:
+            self.runs = [run for run in self.runs if run.is_active]
+
+    def execute(self, run):
+        if run.cancel_requested:
+            run.state = 'cancelled'
+            return
+
+        def log(message, level='info'):
+            self.events.emit(LOG, run.run_id, message=message, level=level)
+
+        run.state = 'running'
+        run.started_at = time.time()
+        try:
+            self.config.touch_user(run.user['id'])
+            run.automation = self.make_automation(run.user, run.kind, run.run_id)
+            if run.cancel_requested:
+                # Cancelled while the automation was being built
+                run.automation.stop()
+            run.automation.run()
+            if run.cancel_requested:
+                run.state = 'cancelled'
+            else:
+                # A step that gave up (e.g. login failed) ends the run without raising
+                run.state = 'failed' if run.automation.outcome == 'failed' or run.failed_steps else 'done'
+                if run.failed_steps and run.automation.outcome != 'failed':
+                    run.step = f"❌ {', '.join(run.failed_steps)} failed"
+                    run.level = 'error'
+        except Exception as e:
+            run.state = 'failed'
+            run.step = f"❌ {str(e)}"
+            run.level = 'error'
+            log(f"❌ Error: {str(e)}", 'error')
+        finally:
+            run.finished_at = time.time()
+            if run.cancel_requested_at:
+                run.release_seconds = run.finished_at - run.cancel_requested_at
+                run.step = f"⏹ Stopped - slot freed in {run.release_seconds:.1f}s"
+                log(f"🧹 Worker slot freed {run.release_seconds:.1f}s after cancel", 'info')
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+ONGOING = 'ongoing'
+UPCOMING = 'upcoming'
+ENDED = 'ended'
+STATUS_RANK = {ONGOING: 0, UPCOMING: 1, ENDED: 2}
+
+# How long a run will hold its logged-in session for the next class (setting 'wait_for_class_minutes')
+DEFAULT_MAX_WAIT_MINUTES = 30
+
+
+class PlannedClass:
+    """A class card placed on today's timetable relative to now"""
+
+    __slots__ = ('card', 'status', 'start', 'end')
+
+    def __init__(self, card, status, start, end):
+        self.card = card
+        self.status = status
+        self.start = start
+        self.end = end
+
+    def describe(self, now):
+        if self.status == ONGOING:
+            return f"ongoing, ends in {minutes(self.end - now)}"
+        if self.status == UPCOMING:
+            return f"starts in {minutes(self.start - now)}"
+        return f"ended {minutes(now - self.end)} ago"
+
+
+def minutes(delta):
+    total = max(0, int(delta.total_seconds() // 60))
+    return f"{total // 60}h {total % 60:02d}m" if total >= 60 else f"{total} min"
+
+
+def plan_day(cards, now):
+    """Today's classes ranked: ongoing (latest start first), upcoming (soonest first), then ended (latest first).
+
+    cards are class_parser.ClassCards (None entries are skipped); now should be
+    timetable.portal_now() so 'today' is the portal's day. A class from yesterday
+    that runs past midnight counts as ongoing until it ends.
+    """
+    today = now.date()
+    planned = []
+    for card in cards:
+        if card is None:
+            continue
+        start, end = card.window(now.tzinfo)
+        if start <= now <= end:
+            status = ONGOING
+        elif card.date != today:
+            continue
+        elif start > now:
+            status = UPCOMING
+        else:
+            status = ENDED
+        planned.append(PlannedClass(card, status, start, end))
+
+    def rank(item):
+        if item.status == UPCOMING:
+            return (STATUS_RANK[UPCOMING], item.start.timestamp())
+        moment = item.start if item.status == ONGOING else item.end
+        return (STATUS_RANK[item.status], -moment.timestamp())
+
+    return sorted(planned, key=rank)
+
+
+def choose_class(plan, now, max_wait=timedelta(minutes=DEFAULT_MAX_WAIT_MINUTES)):
+    """The class to join: ongoing, else the next one if it starts within max_wait, else the last ended"""
+    for planned in plan:
+        if planned.status == ONGOING:
+            return planned
+    for planned in plan:
+        if planned.status == UPCOMING and planned.start - now <= max_wait:
+            return planned
+    for planned in plan:
+        if planned.status == ENDED:
+            return planned
+    return None
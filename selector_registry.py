@@ -0,0 +1,125 @@
+# Consecutive misses after which a candidate is tried last
+DEMOTE_AFTER_MISSES = 3
+
+# Logical element -> candidate locators in their default order. Locators are tuples
+# every driver understands: ('role', role, accessible name), ('text', tag, contained text),
+# ('css', selector) or ('xpath', expr).
+SELECTORS = {
+    'username': (
+        ('role', 'textbox', 'Username'),
+        ('css', "#username, input[name='Username'], input[name='username']"),
+        ('css', "input[type='text']")
+    ),
+    'password': (
+        ('role', 'textbox', 'Password'),
+        ('css', "#password, input[name='Password'], input[name='password']"),
+        ('css', "input[type='password']")
+    ),
+    'sign_in': (
+        ('role', 'button', 'Sign In'),
+        ('text', 'button', 'Sign In'),
+        ('css', "button[type='submit']")
+    ),
+    'zoom_popup_link': (
+        ('css', '.col-md-12 > a'),
+    ),
+    'first_name': (
+        ('role', 'textbox', 'First Name'),
+        ('css', "#question_first_name, input[name*='first_name']")
+    ),
+    'last_name': (
+        ('role', 'textbox', 'Last Name'),
+        ('css', "#question_last_name, input[name*='last_name']")
+    ),
+    'email': (
+        ('role', 'textbox', 'Email Address'),
+        ('css', "#question_email, input[type='email']")
+    ),
+    'nic_number': (
+        ('role', 'textbox', 'NIC Number'),
+        ('css', '#question_NICNumber')
+    ),
+    'contact_number': (
+        ('role', 'textbox', 'Contact Number'),
+        ('css', '#question_ContactNumber')
+    ),
+    'register': (
+        ('role', 'button', 'Register'),
+        ('text', 'button', 'Register'),
+        ('css', 'button.zoom-button.zoom-button--primary'),
+        ('css', 'button.zoom-button--primary')
+    ),
+    'open_zoom': (
+        ('text', 'button', 'Open'),
+    ),
+    'attendance_panel': (
+        ('css', '#online_attendance_panel'),
+    ),
+}
+
+
+def locator_key(locator):
+    return ':'.join(locator)
+
+
+class SelectorRegistry:
+    """Orders each element's candidate locators by how they have performed.
+
+    Stats are kept per backend (hits, misses, seconds spent, current miss streak),
+    loaded from the config at the start of a run and merged back by flush().
+    """
+
+    def __init__(self, config, backend, log=None):
+        self.config = config
+        self.backend = backend
+        self.log = log
+        self.stats = config.get_selector_stats(backend)
+        self.pending = {}
+
+    def candidates(self, element):
+        """Candidates for element, historically cheapest working one first and demoted ones last"""
+        element_stats = self.stats.get(element, {})
+
+        def rank(item):
+            index, locator = item
+            stats = element_stats.get(locator_key(locator))
+            if stats and stats['streak'] >= DEMOTE_AFTER_MISSES:
+                return (2, 0.0, index)
+            if not stats or not stats['hits']:
+                return (1, 0.0, index)
+            # Average time per attempt, so occasional misses (and their timeouts) count against it
+            return (0, stats['seconds'] / (stats['hits'] + stats['misses']), index)
+
+        return [locator for _, locator in sorted(enumerate(SELECTORS[element]), key=rank)]
+
+    def reporter(self, element):
+        """Callback for drivers: report(locator, ok, seconds) after every attempt"""
+        def report(locator, ok, seconds):
+            self.record(element, locator, ok, seconds)
+        return report
+
+    def record(self, element, locator, ok, seconds):
+        key = locator_key(locator)
+        for table in (self.stats, self.pending):
+            stats = table.setdefault(element, {}).setdefault(
+                key, {'hits': 0, 'misses': 0, 'seconds': 0.0, 'streak': 0}
+            )
+            stats['seconds'] += seconds
+            if ok:
+                stats['hits'] += 1
+                stats['streak'] = 0
+                if table is self.pending:
+                    # Tells merge_selector_stats to replace the stored streak, not extend it
+                    stats['reset'] = True
+            else:
+                stats['misses'] += 1
+                stats['streak'] += 1
+
+        if not ok and self.log and self.stats[element][key]['streak'] == DEMOTE_AFTER_MISSES:
+            self.log(f"🔻 Selector for '{element}' keeps failing, trying it last from now on: {key}", 'warning')
+
+    def flush(self):
+        """Merge this run's stats into the config file"""
+        if self.pending:
+            pending, self.pending = self.pending, {}
+            self.config.merge_selector_stats(self.backend, pending)
@@ -0,0 +1,332 @@
+import time
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from selenium.common.exceptions import TimeoutException
+
+from cancellation import CancelToken, RunCancelled
+
+# Polling interval for explicit waits (also bounds how late a cancel is noticed)
+POLL_SECONDS = 0.25
+
+
+class SharedBrowser:
+    """A launched WebDriver session that consecutive runs on one thread reuse"""
+
+    def __init__(self, headless=True):
+        launcher = SeleniumDriver(CancelToken(), lambda message, level="info": None, headless)
+        launcher.start()
+        self.driver = launcher.driver
+        # Origins the current account's run visited, cleared before the next account
+        self.origins = set()
+
+    def remember(self, url):
+        parts = urlsplit(url or "")
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
+    def reset(self):
+        """Clear every cookie and the storage of each origin the last run visited"""
+        try:
+            # Chrome and Edge are both Chromium, so DevTools can clear all domains at once
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in self.origins:
+                self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        except Exception:
+            # No DevTools: only the current page's domain can be cleared
+            self.driver.delete_all_cookies()
+            try:
+                self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+        self.origins.clear()
+
+    def close(self):
+        try:
+            self.driver.quit()
+        except:
+            pass
+
+
+class SeleniumDriver:
+    """Engine driver on Selenium WebDriver (Chrome, falling back to Edge)"""
+
+    name = "selenium"
+
+    def __init__(self, cancel_token, log, headless=False, shared=None, har=None):
+        self.cancel_token = cancel_token
+        self.log = log
+        self.headless = headless
+        self.shared = shared
+        self.har = har
+        self.driver = None
+
+    @classmethod
+    def launch_shared(cls, headless=True):
+        return SharedBrowser(headless)
+
+    def build_options(self, options):
+        options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless=new")
+        else:
+            options.add_experimental_option("detach", True)  # Keep browser open
+
+        # Disable automation flags
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        return options
+
+    def start(self):
+        """Try to get Chrome driver, fall back to Edge"""
+        if self.har:
+            raise RuntimeError("HAR record/replay needs the playwright backend")
+        if self.shared:
+            # WebDriver has no cheap contexts; clearing cookies and storage gives the next account a clean session
+            self.driver = self.shared.driver
+            self.shared.reset()
+            return
+        try:
+            self.log("🔧 Attempting to launch Google Chrome...", "info")
+            service = ChromeService(ChromeDriverManager().install())
+            self.driver = webdriver.Chrome(
+                service=service, options=self.build_options(webdriver.ChromeOptions())
+            )
+        except Exception as e:
+            self.log(f"⚠️ Chrome launch failed: {e}", "warning")
+            self.log("🔧 Attempting to launch Microsoft Edge...", "info")
+            try:
+                service = EdgeService(EdgeChromiumDriverManager().install())
+                self.driver = webdriver.Edge(
+                    service=service, options=self.build_options(webdriver.EdgeOptions())
+                )
+            except Exception as e2:
+                self.log(f"❌ Edge launch failed: {e2}", "error")
+                raise Exception(
+                    "Could not launch Chrome or Edge. Please ensure one is installed."
+                )
+
+    def interrupt(self):
+        # WebDriver calls are plain HTTP, so quitting from another thread is safe. A shared
+        # session serves the worker's next accounts: the run notices the token at its next wait
+        if self.driver and not self.shared:
+            try:
+                self.driver.quit()
+            except:
+                pass
+
+    def close(self):
+        if self.shared:
+            # Keep the shared session, but move to a fresh tab (sessionStorage is per tab) and
+            # close every window this run used, noting their origins for the next reset()
+            try:
+                handles = self.driver.window_handles
+                for handle in handles:
+                    self.driver.switch_to.window(handle)
+                    self.shared.remember(self.driver.current_url)
+                self.driver.switch_to.new_window("tab")
+                fresh = self.driver.current_window_handle
+                for handle in handles:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                self.driver.switch_to.window(fresh)
+            except:
+                pass
+            return
+        if self.driver:
+            try:
+                self.driver.quit()
+            except:
+                pass
+
+    def pause(self, seconds):
+        """Like time.sleep, but raises RunCancelled as soon as the run is stopped"""
+        if self.cancel_token.wait(seconds):
+            raise RunCancelled()
+
+    def wait(self, timeout):
+        return WebDriverWait(self.driver, timeout, poll_frequency=POLL_SECONDS)
+
+    # ==================== Tracing ====================
+
+    def start_tracing(self):
+        """WebDriver has no trace recorder; callers skip tracing"""
+        return False
+
+    def begin_trace_chunk(self, title):
+        pass
+
+    def end_trace_chunk(self, path=None):
+        pass
+
+    # ==================== Navigation ====================
+
+    def goto(self, url):
+        if self.shared:
+            self.shared.remember(url)
+        self.driver.get(url)
+
+    def wait_until_loaded(self, timeout=10):
+        try:
+            self.wait(timeout).until(
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete"
+            )
+        except TimeoutException:
+            pass
+
+    def current_url(self):
+        return self.driver.current_url
+
+    def watch_urls(self, callback):
+        """WebDriver has no request events; callers fall back to the popup's URL"""
+        return False
+
+    # ==================== Locators ====================
+
+    def to_by(self, locator):
+        """Translate an engine locator tuple into a (By, value) pair"""
+        kind = locator[0]
+        if kind == "role":
+            role, name = locator[1], locator[2]
+            if role == "textbox":
+                # Approximates Playwright's accessible-name match for inputs
+                return (
+                    By.XPATH,
+                    f'.//input[@aria-label="{name}" or @placeholder="{name}" or @name="{name}"'
+                    f' or @id=//label[normalize-space()="{name}"]/@for]',
+                )
+            return (
+                By.XPATH,
+                f'.//{role if role != "link" else "a"}[contains(normalize-space(.), "{name}")'
+                f' or @aria-label="{name}"]',
+            )
+        if kind == "text":
+            return (By.XPATH, f'.//{locator[1]}[contains(normalize-space(.), "{locator[2]}")]')
+        if kind == "xpath":
+            return (By.XPATH, locator[1])
+        return (By.CSS_SELECTOR, locator[1])
+
+    def count(self, locator):
+        return len(self.driver.find_elements(*self.to_by(locator)))
+
+    def wait_for_any(self, candidates, timeout=10):
+        """Wait until any candidate is on the page; returns whether one appeared"""
+        deadline = time.monotonic() + timeout
+        while True:
+            for locator in candidates:
+                if self.count(locator):
+                    return True
+            if time.monotonic() >= deadline:
+                return False
+            self.pause(POLL_SECONDS)
+
+    def wait_visible(self, locator, timeout):
+        return self.wait(timeout).until(
+            EC.visibility_of_element_located(self.to_by(locator))
+        )
+
+    def try_candidates(self, candidates, action, timeout, report=None):
+        """Run action(element) on each candidate until one succeeds; returns whether one did"""
+        for locator in candidates:
+            self.cancel_token.check()
+            started = time.perf_counter()
+            try:
+                action(self.wait_visible(locator, timeout))
+                if report:
+                    report(locator, True, time.perf_counter() - started)
+                return True
+            except Exception:
+                if report:
+                    report(locator, False, time.perf_counter() - started)
+                # Later candidates are fallbacks for an already loaded page
+                timeout = 1
+        return False
+
+    def fill(self, candidates, value, timeout=5, report=None):
+        """Fill the first candidate that becomes visible; returns whether one did"""
+
+        def type_value(field):
+            field.clear()
+            field.send_keys(value)
+
+        return self.try_candidates(candidates, type_value, timeout, report)
+
+    def click(self, candidates, timeout=5, js_fallback=False, report=None):
+        """Click the first candidate that becomes visible; returns whether one was clicked"""
+        if self.try_candidates(candidates, lambda element: element.click(), timeout, report):
+            return True
+
+        if js_fallback:
+            # Works when an overlay blocks the real click
+            for locator in candidates:
+                elements = self.driver.find_elements(*self.to_by(locator))
+                if elements:
+                    self.driver.execute_script("arguments[0].click();", elements[0])
+                    return True
+        return False
+
+    # ==================== Elements ====================
+
+    def find_all(self, locator):
+        return self.driver.find_elements(*self.to_by(locator))
+
+    def find_within(self, element, locator):
+        """First match of locator inside element, or None"""
+        matches = element.find_elements(*self.to_by(locator))
+        return matches[0] if matches else None
+
+    def text_of(self, element):
+        return element.text
+
+    def is_visible(self, element):
+        return element.is_displayed()
+
+    def click_element(self, element):
+        element.click()
+
+    # ==================== Windows and dialogs ====================
+
+    def current_tab(self):
+        return self.driver.current_window_handle
+
+    def switch_to(self, tab):
+        self.driver.switch_to.window(tab)
+
+    def open_tab(self, url):
+        """Open url in a new tab of the same session without waiting for it to load"""
+        before = set(self.driver.window_handles)
+        # window.open returns immediately, unlike driver.get, so the tab loads in the background
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        self.wait(5).until(lambda driver: set(driver.window_handles) - before)
+        return (set(self.driver.window_handles) - before).pop()
+
+    def click_for_popup(self, candidates, timeout=10, report=None):
+        """Click a link that opens a new window and switch to it; returns its URL"""
+        before = set(self.driver.window_handles)
+        if not self.click(candidates, timeout=timeout, report=report):
+            raise RuntimeError("Popup link not found")
+        self.wait(timeout).until(lambda driver: set(driver.window_handles) - before)
+        new_handle = (set(self.driver.window_handles) - before).pop()
+        self.driver.switch_to.window(new_handle)
+        return self.driver.current_url
+
+    def click_and_accept_dialog(self, element, timeout=5):
+        """Click element and accept the alert it raises; returns the alert text or None"""
+        element.click()
+        try:
+            self.wait(timeout).until(EC.alert_is_present())
+        except TimeoutException:
+            return None
+        alert = self.driver.switch_to.alert
+        message = alert.text
+        alert.accept()
+        return message
@@ -0,0 +1,51 @@
+import time
+import tkinter as tk
+
+
+class StyleRegistry:
+    """Maps widget color options to palette roles so a theme switch can recolor in place"""
+
+    def __init__(self, palette):
+        self.palette = palette
+        self.widgets = {}  # widget path -> (widget, {option: role})
+        self.callbacks = []
+        self.created = 0
+
+    def register(self, widget, **roles):
+        """Color widget from the current palette and remember its roles, e.g. bg='card_bg'"""
+        widget.config(**{option: self.palette[role] for option, role in roles.items()})
+        self.widgets[str(widget)] = (widget, roles)
+        self.created += 1
+        return widget
+
+    def register_callback(self, callback):
+        """Call callback(palette) on every theme switch, for colors that are not plain options"""
+        self.callbacks.append(callback)
+        callback(self.palette)
+
+    def clear(self):
+        """Forget everything registered (the screen is about to be destroyed)"""
+        self.widgets.clear()
+        self.callbacks.clear()
+
+    def set_palette(self, palette):
+        """Recolor every registered widget that still exists; returns (widgets recolored, seconds)"""
+        started = time.perf_counter()
+        self.palette = palette
+        recolored = 0
+
+        for path, (widget, roles) in list(self.widgets.items()):
+            try:
+                widget.config(**{option: palette[role] for option, role in roles.items()})
+                recolored += 1
+            except tk.TclError:
+                # Destroyed since it was registered
+                del self.widgets[path]
+
+        for callback in list(self.callbacks):
+            try:
+                callback(palette)
+            except tk.TclError:
+                self.callbacks.remove(callback)
+
+        return recolored, time.perf_counter() - started
@@ -0,0 +1,90 @@
+import os
+import sys
+from urllib.parse import urlsplit, parse_qs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+
+from zoom_links import parse_zoom_link, deep_link
+
+
+def query(url):
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+def test_meeting_link_with_password():
+    meeting = parse_zoom_link('https://us02web.zoom.us/j/81234567890?pwd=Zz9abc')
+    assert meeting == {'host': 'us02web.zoom.us', 'meeting_id': '81234567890', 'pwd': 'Zz9abc',
+                       'tk': None, 'register_id': None}
+
+
+def test_webinar_link_with_token_and_password():
+    meeting = parse_zoom_link('https://us02web.zoom.us/w/81234567890?tk=AbC-1.x&pwd=Zz9')
+    assert meeting['meeting_id'] == '81234567890'
+    assert meeting['tk'] == 'AbC-1.x'
+    assert meeting['pwd'] == 'Zz9'
+
+
+@pytest.mark.parametrize('url', [
+    'https://zoom.us/wc/join/81234567890?pwd=q',
+    'https://zoom.us/wc/81234567890/join?pwd=q',
+    'https://zoom.us/s/81234567890?pwd=q',
+])
+def test_web_client_and_host_paths(url):
+    meeting = parse_zoom_link(url)
+    assert meeting['meeting_id'] == '81234567890'
+    assert meeting['pwd'] == 'q'
+
+
+def test_registration_page_has_no_meeting_id():
+    meeting = parse_zoom_link('https://us02web.zoom.us/meeting/register/tZ0kf-uprz4')
+    assert meeting['meeting_id'] is None
+    assert meeting['register_id'] == 'tZ0kf-uprz4'
+    webinar = parse_zoom_link('https://us02web.zoom.us/webinar/register/WN_abc')
+    assert webinar['register_id'] == 'WN_abc'
+
+
+def test_deep_link_parses_back():
+    meeting = parse_zoom_link('zoommtg://zoom.us/join?action=join&confno=81234567890&pwd=x&tk=t')
+    assert meeting['meeting_id'] == '81234567890'
+    assert (meeting['pwd'], meeting['tk']) == ('x', 't')
+
+
+@pytest.mark.parametrize('url', [
+    None,
+    '',
+    'not a url',
+    'https://evil.com/j/81234567890',
+    'https://zoom.us.evil.com/j/81234567890',
+    'ftp://zoom.us/j/81234567890',
+    'https://zoom.us/j/123',
+    'https://zoom.us/j/abcdefghij',
+    'https://zoom.us/profile',
+    'zoommtg://zoom.us/join?action=join',
+])
+def test_malformed_or_foreign_links(url):
+    assert parse_zoom_link(url) is None
+
+
+def test_empty_query_values_are_none():
+    meeting = parse_zoom_link('https://zoom.us/j/81234567890?pwd=&tk=')
+    assert meeting['pwd'] is None
+    assert meeting['tk'] is None
+
+
+def test_deep_link_carries_password_and_token():
+    link = deep_link(parse_zoom_link('https://us02web.zoom.us/w/81234567890?tk=AbC-1.x&pwd=Zz9'))
+    assert link.startswith('zoommtg://us02web.zoom.us/join?')
+    assert query(link) == {'action': 'join', 'confno': '81234567890', 'pwd': 'Zz9', 'tk': 'AbC-1.x'}
+
+
+def test_deep_link_omits_missing_values_and_escapes_display_name():
+    link = deep_link(parse_zoom_link('https://zoom.us/j/81234567890'), display_name='Jane Doe & Co')
+    assert query(link) == {'action': 'join', 'confno': '81234567890', 'uname': 'Jane Doe & Co'}
+
+
+def test_no_deep_link_without_meeting_id():
+    assert deep_link(None) is None
+    assert deep_link(parse_zoom_link('https://zoom.us/meeting/register/tZabc')) is None
@@ -0,0 +1,80 @@
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+# The portal publishes class times in Sri Lanka time, whatever the machine's clock says
+DEFAULT_PORTAL_TIMEZONE = 'Asia/Colombo'
+# Offsets for when the tz database is missing (Windows without the tzdata package)
+FIXED_OFFSETS = {
+    'Asia/Colombo': timedelta(hours=5, minutes=30),
+    'UTC': timedelta(0),
+}
+CLOCK_RE = re.compile(r"(\d{1,2}):(\d{2}) ?([AaPp])[Mm]")
+OFFSET_RE = re.compile(r"(?:UTC)?([+-])(\d{1,2}):?(\d{2})")
+
+
+@lru_cache(maxsize=2048)
+def parse_clock(token):
+    """'6:30 PM' -> time(18, 30); timetables repeat a handful of tokens, so results are memoized"""
+    match = CLOCK_RE.fullmatch(token.strip())
+    if not match:
+        raise ValueError(f"Not a clock time: {token!r}")
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError(f"Not a clock time: {token!r}")
+    return time(hour % 12 + (12 if match.group(3) in 'Pp' else 0), minute)
+
+
+@lru_cache(maxsize=512)
+def parse_date(token):
+    return date.fromisoformat(token)
+
+
+@lru_cache(maxsize=512)
+def parse_time_range(text):
+    """'6:30 PM - 9:30 PM' (the cached class_time format) -> (start, end) times"""
+    start, end = text.split(' - ')
+    return parse_clock(start), parse_clock(end)
+
+
+def class_window(class_date, start, end, tz=None):
+    """Start and end datetimes of a class; an end before the start is on the next day"""
+    starts_at = datetime.combine(class_date, start, tzinfo=tz)
+    ends_at = datetime.combine(class_date, end, tzinfo=tz)
+    if end < start:
+        ends_at += timedelta(days=1)
+    return starts_at, ends_at
+
+
+@lru_cache(maxsize=32)
+def get_timezone(name):
+    """tzinfo for an IANA name or a '+05:30' style offset, else the machine's local zone"""
+    if ZoneInfo:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+    if name in FIXED_OFFSETS:
+        return timezone(FIXED_OFFSETS[name], name)
+    match = OFFSET_RE.fullmatch(name.strip())
+    if match:
+        offset = timedelta(hours=int(match.group(2)), minutes=int(match.group(3)))
+        return timezone(offset if match.group(1) == '+' else -offset, name)
+    return datetime.now().astimezone().tzinfo
+
+
+def portal_timezone(config):
+    """Timezone of the portal's timetable, from the 'portal_timezone' setting"""
+    return get_timezone(config.get_setting('portal_timezone', DEFAULT_PORTAL_TIMEZONE) or DEFAULT_PORTAL_TIMEZONE)
+
+
+def portal_now(config):
+    """The portal's clock; the 'clock_offset_seconds' setting shifts it (HAR replays run on the recording's day)"""
+    now = datetime.now(portal_timezone(config))
+    offset = config.get_setting('clock_offset_seconds', 0)
+    return now + timedelta(seconds=offset) if offset else now
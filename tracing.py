@@ -0,0 +1,87 @@
+import os
+import shutil
+from datetime import datetime
+
+TRACES_DIR = 'traces'
+# Total size the traces directory may reach before the oldest runs are deleted
+DEFAULT_MAX_MB = 200
+# Seconds a step may take before its trace is kept even though it succeeded
+STEP_BUDGETS = {
+    'cache_join': 15,
+    'login': 20,
+    'select_class': 15,
+    # Holding a session for the next class is slow by design
+    'wait_for_class': float('inf'),
+    'open_popup': 15,
+    'join': 30,
+    'mark_attendance': 30,
+}
+DEFAULT_BUDGET = 30
+
+
+class StepTracer:
+    """Records a trace chunk per step and keeps it only if the step failed or ran over budget.
+
+    Chunks are written to traces/<run id>/<nn>-<step>.zip (open them with
+    `playwright show-trace`); everything else is discarded when the step ends.
+    """
+
+    def __init__(self, driver, run_id=None, directory=TRACES_DIR, max_mb=DEFAULT_MAX_MB, log=None):
+        self.driver = driver
+        self.directory = directory
+        self.run_dir = os.path.join(directory, str(run_id or datetime.now().strftime('%Y%m%d-%H%M%S')))
+        self.max_bytes = max_mb * 1024 * 1024
+        self.log = log
+        self.index = 0
+        # Drivers without tracing (Selenium) report False and every call becomes a no-op
+        self.enabled = driver.start_tracing()
+
+    def begin(self, step):
+        if self.enabled:
+            self.driver.begin_trace_chunk(step)
+
+    def end(self, step, ok, duration):
+        """Keep the step's chunk if it failed or was slow; returns the saved path or None"""
+        if not self.enabled:
+            return None
+        self.index += 1
+        budget = STEP_BUDGETS.get(step, DEFAULT_BUDGET)
+        if ok and duration <= budget:
+            try:
+                self.driver.end_trace_chunk(None)
+            except Exception:
+                pass
+            return None
+
+        os.makedirs(self.run_dir, exist_ok=True)
+        path = os.path.join(self.run_dir, f"{self.index:02d}-{step}.zip")
+        try:
+            self.driver.end_trace_chunk(path)
+        except Exception:
+            return None
+        if self.log:
+            reason = "failed" if not ok else f"took {duration:.1f}s (budget {budget}s)"
+            self.log(f"🧾 {step} {reason} - trace saved to {path}", 'info')
+        prune_traces(self.directory, self.max_bytes, keep=self.run_dir)
+        return path
+
+
+def prune_traces(directory, max_bytes, keep=None):
+    """Delete the oldest run directories until the total size fits max_bytes"""
+    runs = []
+    total = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if not os.path.isdir(path):
+            continue
+        size = sum(os.path.getsize(os.path.join(path, file)) for file in os.listdir(path))
+        runs.append((os.path.getmtime(path), path, size))
+        total += size
+
+    for _, path, size in sorted(runs):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
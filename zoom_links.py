@@ -0,0 +1,106 @@
+import os
+import re
+import subprocess
+import sys
+import webbrowser
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+# Turns captured Zoom links into their meeting id, password and token, and launches
+# the Zoom app directly through a zoommtg:// deep link. Parsing does no I/O:
+#   python zoom_links.py URL [URL ...]
+
+# Join paths carrying the meeting id: /j/<id>, /w/<id> (webinar), /s/<id> (host), /wc/join/<id>, /wc/<id>/join
+MEETING_PATH_RE = re.compile(r'^/(?:j|w|s|wc/join|wc)/(\d{9,11})(?:/|$)')
+REGISTER_PATH_RE = re.compile(r'^/(?:meeting|webinar)/register/([\w-]+)')
+DEEP_LINK_SCHEMES = ('zoommtg', 'zoomus')
+DEFAULT_HOST = 'zoom.us'
+OPEN_TIMEOUT_SECONDS = 5
+
+
+def first(query, key):
+    values = query.get(key)
+    return values[0] if values and values[0] else None
+
+
+def parse_zoom_link(url):
+    """Structured form of a Zoom link, or None if it is not one.
+
+    Returns {'host', 'meeting_id', 'pwd', 'tk', 'register_id'}. Join links and
+    zoommtg:// links have a meeting_id; registration pages only a register_id.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    query = parse_qs(parts.query)
+    meeting = {'host': host or DEFAULT_HOST, 'meeting_id': None, 'pwd': first(query, 'pwd'),
+               'tk': first(query, 'tk'), 'register_id': None}
+
+    if parts.scheme.lower() in DEEP_LINK_SCHEMES:
+        meeting['meeting_id'] = first(query, 'confno')
+        return meeting if meeting['meeting_id'] else None
+
+    if parts.scheme.lower() not in ('http', 'https') or not (host == DEFAULT_HOST or host.endswith('.zoom.us')):
+        return None
+    join_match = MEETING_PATH_RE.match(parts.path)
+    if join_match:
+        meeting['meeting_id'] = join_match.group(1)
+        return meeting
+    register_match = REGISTER_PATH_RE.match(parts.path)
+    if register_match:
+        meeting['register_id'] = register_match.group(1)
+        return meeting
+    return None
+
+
+def deep_link(meeting, display_name=None):
+    """zoommtg:// URL that opens the meeting straight in the Zoom app, or None without a meeting id"""
+    if not meeting or not meeting.get('meeting_id'):
+        return None
+    params = {'action': 'join', 'confno': meeting['meeting_id']}
+    for key in ('pwd', 'tk'):
+        if meeting.get(key):
+            params[key] = meeting[key]
+    if display_name:
+        params['uname'] = display_name
+    return f"zoommtg://{meeting.get('host') or DEFAULT_HOST}/join?{urlencode(params)}"
+
+
+def open_deep_link(url):
+    """Hand url to the OS protocol handler; returns False when no app claims it"""
+    try:
+        if sys.platform == 'win32':
+            os.startfile(url)
+            return True
+        command = ['open', url] if sys.platform == 'darwin' else ['xdg-open', url]
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                timeout=OPEN_TIMEOUT_SECONDS)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def launch_meeting(link, meeting=None, display_name=None):
+    """Open a cached class in the Zoom app, falling back to the web link; returns 'app' or 'web'.
+
+    Waits for the OS handler (up to OPEN_TIMEOUT_SECONDS), so GUIs call it off their UI thread.
+    """
+    app_link = deep_link(meeting or parse_zoom_link(link), display_name)
+    if app_link and open_deep_link(app_link):
+        return 'app'
+    webbrowser.open(link)
+    return 'web'
+
+
+def main():
+    if len(sys.argv) < 2:
+        raise SystemExit("Usage: python zoom_links.py URL [URL ...]")
+    for url in sys.argv[1:]:
+        meeting = parse_zoom_link(url)
+        print(url)
+        print(f"  {meeting}")
+        print(f"  -> {deep_link(meeting) or 'no meeting id - opens the web link'}")
+
+
+if __name__ == '__main__':
+    main()